@@ -0,0 +1,257 @@
+"""Initial schema
+
+Revision ID: 5c2d8e1f4a90
+Revises:
+Create Date: 2026-10-19 10:40:00.000000
+
+Databases created earlier with ``create_tables()`` already have this schema:
+run ``alembic stamp 5c2d8e1f4a90`` once, then ``alembic upgrade head``.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2d8e1f4a90"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("NOT is_deleted")
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    ]
+
+
+def _versioned() -> list[sa.Column]:
+    return [
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.Column(
+            "is_deleted", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("full_name", sa.String(length=255), nullable=True),
+        sa.Column("avatar_url", sa.String(length=500), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_superuser", sa.Boolean(), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("headers", sa.JSON(), nullable=True),
+        sa.Column("body", sa.LargeBinary(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+    op.create_index(
+        "ix_idempotency_keys_expires_at", "idempotency_keys", ["expires_at"]
+    )
+    op.create_index("ix_idempotency_keys_id", "idempotency_keys", ["id"])
+
+    op.create_table(
+        "projects",
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("owner_id", sa.Uuid(), nullable=False),
+        *_timestamps(),
+        *_versioned(),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_projects_id", "projects", ["id"])
+    op.create_index(
+        "ix_projects_owner_id", "projects", ["owner_id"], postgresql_where=LIVE
+    )
+
+    op.create_table(
+        "project_members",
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("role", sa.String(length=50), nullable=False),
+        sa.Column(
+            "joined_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "project_id", "user_id", name="uq_project_members_project_user"
+        ),
+    )
+    op.create_index("ix_project_members_id", "project_members", ["id"])
+    op.create_index("ix_project_members_user_id", "project_members", ["user_id"])
+
+    op.create_table(
+        "project_deletions",
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("requested_by", sa.Uuid(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("tasks_total", sa.Integer(), nullable=False),
+        sa.Column("tasks_deleted", sa.Integer(), nullable=False),
+        sa.Column("comments_deleted", sa.Integer(), nullable=False),
+        sa.Column("notifications_deleted", sa.Integer(), nullable=False),
+        sa.Column("last_task_id", sa.Uuid(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["requested_by"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("project_id"),
+    )
+    op.create_index("ix_project_deletions_id", "project_deletions", ["id"])
+    op.create_index("ix_project_deletions_status", "project_deletions", ["status"])
+
+    op.create_table(
+        "project_clones",
+        sa.Column("source_project_id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=True),
+        sa.Column("requested_by", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("include_members", sa.Boolean(), nullable=False),
+        sa.Column("include_tasks", sa.Boolean(), nullable=False),
+        sa.Column("include_comments", sa.Boolean(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("step", sa.String(length=20), nullable=True),
+        sa.Column("tasks_total", sa.Integer(), nullable=False),
+        sa.Column("members_copied", sa.Integer(), nullable=False),
+        sa.Column("tasks_copied", sa.Integer(), nullable=False),
+        sa.Column("comments_copied", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(
+            ["source_project_id"], ["projects.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["requested_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_project_clones_id", "project_clones", ["id"])
+    op.create_index(
+        "ix_project_clones_source_project_id", "project_clones", ["source_project_id"]
+    )
+    op.create_index("ix_project_clones_status", "project_clones", ["status"])
+
+    op.create_table(
+        "tasks",
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("priority", sa.String(length=50), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("creator_id", sa.Uuid(), nullable=False),
+        sa.Column("assignee_id", sa.Uuid(), nullable=True),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+        *_timestamps(),
+        *_versioned(),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["creator_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["assignee_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+    op.create_index("ix_tasks_project_id_id", "tasks", ["project_id", "id"])
+    op.create_index(
+        "ix_tasks_project_id_position",
+        "tasks",
+        ["project_id", "position"],
+        postgresql_where=LIVE,
+    )
+    op.create_index("ix_tasks_status", "tasks", ["status"], postgresql_where=LIVE)
+    op.create_index("ix_tasks_priority", "tasks", ["priority"], postgresql_where=LIVE)
+    op.create_index(
+        "ix_tasks_assignee_id", "tasks", ["assignee_id"], postgresql_where=LIVE
+    )
+    op.create_index("ix_tasks_due_date", "tasks", ["due_date"], postgresql_where=LIVE)
+    op.create_index(
+        "ix_tasks_deleted_at",
+        "tasks",
+        ["deleted_at"],
+        postgresql_where=sa.text("is_deleted"),
+    )
+
+    op.create_table(
+        "comments",
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_comments_id", "comments", ["id"])
+    op.create_index("ix_comments_task_id", "comments", ["task_id"])
+
+    op.create_table(
+        "notifications",
+        sa.Column("type", sa.String(length=100), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("link", sa.String(length=500), nullable=True),
+        sa.Column("read", sa.Boolean(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_notifications_id", "notifications", ["id"])
+    op.create_index("ix_notifications_link", "notifications", ["link"])
+    op.create_index("ix_notifications_read", "notifications", ["read"])
+    op.create_index("ix_notifications_user_id", "notifications", ["user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("notifications")
+    op.drop_table("comments")
+    op.drop_table("tasks")
+    op.drop_table("project_clones")
+    op.drop_table("project_deletions")
+    op.drop_table("project_members")
+    op.drop_table("projects")
+    op.drop_table("idempotency_keys")
+    op.drop_table("users")
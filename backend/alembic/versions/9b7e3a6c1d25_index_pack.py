@@ -0,0 +1,129 @@
+"""Index pack: composite, covering and partial indexes for the repositories
+
+Revision ID: 9b7e3a6c1d25
+Revises: 5c2d8e1f4a90
+Create Date: 2026-10-19 11:05:00.000000
+
+Replaces single-column indexes on low-selectivity columns (task status and
+priority, notification read) with composites matching the repositories'
+WHERE and ORDER BY shapes, adds indexes for unindexed foreign keys, and drops
+the ``ix_<table>_id`` indexes that duplicated the primary keys.
+
+Indexes are built and dropped ``CONCURRENTLY`` so writes keep flowing on
+live tables; each runs outside the migration transaction. A build that
+fails leaves an INVALID index behind: drop it and rerun the migration.
+``tests/test_query_plans.py`` checks that the queries use these indexes.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b7e3a6c1d25"
+down_revision: Union[str, Sequence[str], None] = "5c2d8e1f4a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("NOT is_deleted")
+
+# (name, table, columns, options)
+NEW_INDEXES = [
+    (
+        "ix_tasks_project_id_status_position",
+        "tasks",
+        ["project_id", "status", "position"],
+        {"postgresql_where": LIVE},
+    ),
+    (
+        "ix_tasks_project_id_created_at_id",
+        "tasks",
+        ["project_id", "created_at", "id"],
+        {"postgresql_where": LIVE},
+    ),
+    (
+        "ix_tasks_project_id_updated_at",
+        "tasks",
+        ["project_id", "updated_at"],
+        {"postgresql_where": LIVE},
+    ),
+    (
+        "ix_tasks_assignee_id_status_due_date",
+        "tasks",
+        ["assignee_id", "status", "due_date"],
+        {"postgresql_where": LIVE},
+    ),
+    ("ix_tasks_creator_id", "tasks", ["creator_id"], {}),
+    ("ix_comments_task_id_created_at", "comments", ["task_id", "created_at"], {}),
+    ("ix_comments_user_id", "comments", ["user_id"], {}),
+    (
+        "ix_notifications_user_id_read_created_at",
+        "notifications",
+        ["user_id", "read", "created_at"],
+        {},
+    ),
+    (
+        "ix_project_members_user_id_include",
+        "project_members",
+        ["user_id"],
+        {"postgresql_include": ["project_id", "role"]},
+    ),
+]
+
+# (name, table, columns, options) of the indexes the pack supersedes
+OLD_INDEXES = [
+    ("ix_tasks_status", "tasks", ["status"], {"postgresql_where": LIVE}),
+    ("ix_tasks_priority", "tasks", ["priority"], {"postgresql_where": LIVE}),
+    ("ix_tasks_assignee_id", "tasks", ["assignee_id"], {"postgresql_where": LIVE}),
+    ("ix_comments_task_id", "comments", ["task_id"], {}),
+    ("ix_notifications_read", "notifications", ["read"], {}),
+    ("ix_notifications_user_id", "notifications", ["user_id"], {}),
+    ("ix_project_members_user_id", "project_members", ["user_id"], {}),
+    # Duplicates of the primary keys
+    ("ix_users_id", "users", ["id"], {}),
+    ("ix_idempotency_keys_id", "idempotency_keys", ["id"], {}),
+    ("ix_projects_id", "projects", ["id"], {}),
+    ("ix_project_members_id", "project_members", ["id"], {}),
+    ("ix_project_deletions_id", "project_deletions", ["id"], {}),
+    ("ix_project_clones_id", "project_clones", ["id"], {}),
+    ("ix_tasks_id", "tasks", ["id"], {}),
+    ("ix_comments_id", "comments", ["id"], {}),
+    ("ix_notifications_id", "notifications", ["id"], {}),
+]
+
+
+def _create(indexes) -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in indexes:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options,
+            )
+
+
+def _drop(indexes) -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in indexes:
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the new indexes before dropping the ones queries use meanwhile
+    _create(NEW_INDEXES)
+    _drop(OLD_INDEXES)
+    op.execute("ANALYZE tasks, comments, notifications, project_members")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _create(OLD_INDEXES)
+    _drop(NEW_INDEXES)
@@ -1,14 +1,27 @@
 # app/dependencies.py
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import uuid
+from typing import Callable, Optional, Tuple, Type
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import HTTPConnection
+
+from app.core.security import get_user_id_from_token
+from app.db.session import get_db
+from app.repositories.comment import CommentRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.project_clone import ProjectCloneRepository
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.repositories.task import TaskRepository
 from app.repositories.user import UserRepository
+from app.schemas.user import UserResponse
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
 from app.services.user_service import UserService
-from app.core.security import get_user_id_from_token
-import uuid
-
-from backend.app.db.session import get_db
-from backend.app.schemas.user import UserResponse
 
 # Security scheme for Bearer tokens
 security = HTTPBearer(auto_error=False)
@@ -24,7 +37,59 @@ def get_user_service(
     return UserService(user_repo)
 
 
+def get_project_repository() -> ProjectRepository:
+    return ProjectRepository()
+
+
+def get_task_repository() -> TaskRepository:
+    return TaskRepository()
+
+
+def get_comment_repository() -> CommentRepository:
+    return CommentRepository()
+
+
+def get_export_service(
+    project_repo: ProjectRepository = Depends(get_project_repository),
+    task_repo: TaskRepository = Depends(get_task_repository),
+    comment_repo: CommentRepository = Depends(get_comment_repository),
+) -> ExportService:
+    return ExportService(project_repo, task_repo, comment_repo)
+
+
+def get_import_service(
+    task_repo: TaskRepository = Depends(get_task_repository),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> ImportService:
+    return ImportService(task_repo, user_repo)
+
+
+def get_project_deletion_repository() -> ProjectDeletionRepository:
+    return ProjectDeletionRepository()
+
+
+def get_project_clone_repository() -> ProjectCloneRepository:
+    return ProjectCloneRepository()
+
+
+def get_project_service(
+    project_repo: ProjectRepository = Depends(get_project_repository),
+    deletion_repo: ProjectDeletionRepository = Depends(get_project_deletion_repository),
+    clone_repo: ProjectCloneRepository = Depends(get_project_clone_repository),
+) -> ProjectService:
+    return ProjectService(project_repo, deletion_repo, clone_repo)
+
+
+def get_task_service(
+    task_repo: TaskRepository = Depends(get_task_repository),
+    project_repo: ProjectRepository = Depends(get_project_repository),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> TaskService:
+    return TaskService(task_repo, project_repo, user_repo)
+
+
 async def get_current_user(
+    connection: HTTPConnection,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     user_service: UserService = Depends(get_user_service),
     db: AsyncSession = Depends(get_db),
@@ -37,7 +102,14 @@ async def get_current_user(
     2. Validates the token
     3. Gets user from database
     4. Returns UserResponse or raises 401
+
+    Sub-requests of ``/batch`` use the principal the batch already
+    authenticated (``connection.state.principal``).
     """
+    principal = getattr(connection.state, "principal", None)
+    if principal is not None:
+        return principal
+
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -92,6 +164,7 @@ async def get_current_active_superuser(
 
 
 async def get_optional_current_user(
+    connection: HTTPConnection,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     user_service: UserService = Depends(get_user_service),
     db: AsyncSession = Depends(get_db),
@@ -100,6 +173,10 @@ async def get_optional_current_user(
     Get current user if authenticated, otherwise return None.
     Useful for endpoints that work for both authenticated and unauthenticated users.
     """
+    principal = getattr(connection.state, "principal", None)
+    if principal is not None:
+        return principal
+
     if not credentials:
         return None
 
@@ -117,3 +194,41 @@ async def get_optional_current_user(
         return user
     except HTTPException:
         return None
+
+
+def get_sparse_fields(
+    schema: Type[BaseModel],
+) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """
+    Build a dependency parsing a ``fields=`` query parameter against a schema.
+
+    The dependency returns the requested field names in schema order, always
+    including ``id``, or None when all fields are wanted. Unknown names are
+    rejected with 400.
+
+    Usage:
+        fields: tuple[str, ...] | None = Depends(get_sparse_fields(TaskResponse))
+    """
+
+    def sparse_fields(
+        fields: Optional[str] = Query(
+            None,
+            description=(
+                "Comma-separated fields to return, e.g. id,title,status. "
+                "Defaults to all fields."
+            ),
+        ),
+    ) -> Optional[Tuple[str, ...]]:
+        if not fields:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - schema.model_fields.keys()
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        requested.add("id")
+        return tuple(name for name in schema.model_fields if name in requested)
+
+    return sparse_fields
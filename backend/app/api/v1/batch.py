@@ -0,0 +1,248 @@
+# app/api/v1/batch.py
+"""
+Multiplexed API calls: many v1 operations in one HTTP request.
+
+The batch authenticates once and its sub-requests reuse that principal, so
+token decoding and the user lookup aren't repeated per call. Sub-requests are
+dispatched in-process to the application router (no middleware, no network)
+and share the batch's database session through ``request.state``.
+
+Consecutive GETs run concurrently, at most ``BATCH_CONCURRENCY`` at a time.
+An AsyncSession can't run two queries at once, so every concurrent read lane
+beyond the first gets its own pooled session for the rest of the batch. Writes
+run one at a time, in order, on the batch session after the preceding reads
+have finished.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import pydantic_core
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.responses import SchemaResponse, dumps
+from app.db.session import get_db, get_sessionmaker
+from app.schemas.batch import BatchRequest, BatchRequestItem, BatchResponse
+from app.schemas.user import UserResponse
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = "/batch"
+READ_METHODS = {"GET"}
+# Parent request headers passed on to every sub-request
+FORWARDED_HEADERS = {b"host", b"authorization", b"user-agent", b"accept-language"}
+# ASGI scope keys sub-requests inherit from the batch request
+INHERITED_SCOPE_KEYS = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+)
+
+
+def _dispatch_app(app: FastAPI) -> ASGIApp:
+    """
+    The app's router with only the pieces routes depend on: exception
+    handlers (so HTTPExceptions become responses) and FastAPI's exit stack.
+    User middleware (CORS, compression, ...) is left out on purpose.
+    """
+    dispatch_app = getattr(app.state, "batch_dispatch_app", None)
+    if dispatch_app is None:
+        handlers = {
+            key: handler
+            for key, handler in app.exception_handlers.items()
+            if key not in (500, Exception)
+        }
+        dispatch_app = AsyncExitStackMiddleware(
+            ExceptionMiddleware(app.router, handlers=handlers)
+        )
+        app.state.batch_dispatch_app = dispatch_app
+    return dispatch_app
+
+
+def _sub_request_path(path: str) -> str:
+    path = path if path.startswith("/") else f"/{path}"
+    if not path.startswith(f"{settings.API_V1_STR}/"):
+        path = f"{settings.API_V1_STR}{path}"
+    return path
+
+
+def _build_scope(
+    request: Request, item: BatchRequestItem, state: Dict[str, Any]
+) -> tuple[Dict[str, Any], bytes]:
+    path, _, raw_query = _sub_request_path(item.path).partition("?")
+    query = urlencode(item.query, doseq=True) if item.query else raw_query
+    body = b"" if item.body is None else dumps(item.body)
+
+    headers = [(k, v) for k, v in request.scope["headers"] if k in FORWARDED_HEADERS]
+    headers += [
+        (name.encode("latin-1"), value.encode("latin-1"))
+        for name, value in (item.headers or {}).items()
+    ]
+    if body:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+
+    scope = {
+        key: request.scope[key] for key in INHERITED_SCOPE_KEYS if key in request.scope
+    }
+    scope.update(
+        method=item.method,
+        path=path,
+        raw_path=path.encode(),
+        query_string=query.encode(),
+        headers=headers,
+        state=state,
+    )
+    return scope, body
+
+
+def _decode_body(body: bytes, content_type: str) -> Any:
+    if not body:
+        return None
+    if content_type.startswith("application/json"):
+        return pydantic_core.from_json(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _dispatch(
+    request: Request,
+    item: BatchRequestItem,
+    principal: UserResponse,
+    db: AsyncSession,
+) -> Dict[str, Any]:
+    """Run one sub-request through the application router and capture it."""
+    if _sub_request_path(item.path).split("?")[0].endswith(BATCH_PATH):
+        return {"id": item.id, "status": 400, "body": {"detail": "Nested batch"}}
+
+    scope, body = _build_scope(request, item, {"db": db, "principal": principal})
+    status = 500
+    headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+    body_sent = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers.update(
+                (k.decode("latin-1"), v.decode("latin-1"))
+                for k, v in message.get("headers", [])
+                if k != b"content-length"
+            )
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await _dispatch_app(request.app)(scope, receive, send)
+    except Exception as e:
+        logger.exception(f"Batch sub-request {item.method} {item.path} failed: {e}")
+        await db.rollback()
+        return {
+            "id": item.id,
+            "status": 500,
+            "body": {"detail": "Internal Server Error"},
+        }
+
+    return {
+        "id": item.id,
+        "status": status,
+        "headers": headers,
+        "body": _decode_body(b"".join(chunks), headers.get("content-type", "")),
+    }
+
+
+async def run_batch(
+    request: Request,
+    items: List[BatchRequestItem],
+    principal: UserResponse,
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """
+    Execute sub-requests in order, running runs of reads concurrently.
+
+    Args:
+        request: The batch request (scope and app are inherited)
+        items: Sub-requests
+        principal: Authenticated user shared by all sub-requests
+        db: Batch session, used for writes and the first read lane
+
+    Returns:
+        Captured responses in request order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    lanes: asyncio.Queue[AsyncSession] = asyncio.Queue()
+    lanes.put_nowait(db)
+    extra_sessions: List[AsyncSession] = []
+
+    async def acquire_lane() -> AsyncSession:
+        if lanes.empty() and len(extra_sessions) < settings.BATCH_CONCURRENCY - 1:
+            session = get_sessionmaker()()
+            extra_sessions.append(session)
+            return session
+        return await lanes.get()
+
+    async def run_read(index: int) -> None:
+        session = await acquire_lane()
+        try:
+            results[index] = await _dispatch(request, items[index], principal, session)
+        finally:
+            lanes.put_nowait(session)
+
+    try:
+        reads: List[int] = []
+        for index, item in enumerate(items):
+            if item.method in READ_METHODS:
+                reads.append(index)
+                continue
+            # A write sees everything requested before it
+            await asyncio.gather(*(run_read(i) for i in reads))
+            reads = []
+            results[index] = await _dispatch(request, item, principal, db)
+        await asyncio.gather(*(run_read(i) for i in reads))
+    finally:
+        await asyncio.gather(*(session.close() for session in extra_sessions))
+
+    return results
+
+
+@router.post(BATCH_PATH, response_model=BatchResponse)
+async def batch(
+    data: BatchRequest,
+    request: Request,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Execute up to ``BATCH_MAX_REQUESTS`` v1 API calls in one request.
+
+    Each item has a method, a path relative to the API prefix, optional query
+    parameters, optional conditional headers (``If-Match``, ``If-None-Match``,
+    ``If-Modified-Since``) and an optional JSON body. Responses come back in the same
+    order with their status, headers and decoded body; one failing item
+    doesn't fail the batch.
+    """
+    responses = await run_batch(request, data.requests, current_user, db)
+    return SchemaResponse({"responses": responses}, BatchResponse)
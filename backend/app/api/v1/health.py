@@ -1,11 +1,16 @@
 # app/api/v1/health.py
+import logging
 from datetime import datetime, timezone
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db import get_db
+
+from app.core.background import background_runner
 from app.core.config import settings
-import logging
+from app.core.responses import JSONResponse
+from app.core.warmup import warmup_state
+from app.db import get_db
 
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
@@ -23,6 +28,19 @@ async def health_check():
     }
 
 
+@router.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the startup warm-up has finished."""
+    return JSONResponse(
+        status_code=200 if warmup_state.ready else 503,
+        content={
+            "status": "ready" if warmup_state.ready else "warming_up",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "warmup": warmup_state.as_dict(),
+        },
+    )
+
+
 @router.get("/health/db")
 async def health_check_db(db: AsyncSession = Depends(get_db)):
     """Database health check with actual query."""
@@ -69,6 +87,16 @@ async def health_check_redis():
         }
 
 
+@router.get("/health/background")
+async def health_check_background():
+    """In-process background runner queue depths and counters."""
+    return {
+        "status": "running" if background_runner.running else "stopped",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "jobs": background_runner.metrics(),
+    }
+
+
 @router.get("/health/full")
 async def full_health_check(db: AsyncSession = Depends(get_db)):
     """Comprehensive health check of all services."""
@@ -0,0 +1,309 @@
+# app/api/v1/projects.py
+import uuid
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import (
+    get_current_user,
+    get_export_service,
+    get_import_service,
+    get_project_repository,
+    get_project_service,
+    get_sparse_fields,
+    get_task_service,
+)
+from app.api.v1.tasks import TASK_ORDER_PATTERN
+from app.core.cache import Validator, cache_key, conditional_response
+from app.core.config import settings
+from app.core.counting import count_headers
+from app.core.responses import SchemaResponse, partial_schema
+from app.db.session import get_db
+from app.repositories.project import ProjectRepository
+from app.schemas.project import (
+    ProjectCloneCreate,
+    ProjectCloneResponse,
+    ProjectDeletionResponse,
+    ProjectResponse,
+    ProjectUpdate,
+)
+from app.schemas.task import TaskFilters, TaskImportResult, TaskResponse
+from app.schemas.user import UserResponse
+from app.services.export_service import (
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportResource,
+    ExportService,
+)
+from app.services.import_service import ImportFormat, ImportService
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+
+router = APIRouter()
+
+
+async def ensure_project_access(
+    db: AsyncSession,
+    project_repository: ProjectRepository,
+    project_id: uuid.UUID,
+    current_user: UserResponse,
+) -> None:
+    """Raise 404 unless the user can see the project (members and superusers)."""
+    if current_user.is_superuser:
+        if await project_repository.exists(db, id=project_id):
+            return
+    elif await project_repository.is_member(db, project_id, current_user.id):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+    )
+
+
+@router.get("/{project_id}", response_model=ProjectResponse)
+async def get_project(
+    project_id: uuid.UUID,
+    request: Request,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """
+    Get a project. The ETag carries its version, for ``If-Match`` on update.
+    """
+    current = await project_service.get_project_version(db, project_id, current_user)
+    validator = Validator.for_version(current["version"], current["updated_at"])
+
+    async def build():
+        row = await project_service.get_project(db, project_id)
+        return SchemaResponse(row, ProjectResponse)
+
+    return await conditional_response(request, validator, build, scope=current_user.id)
+
+
+@router.patch("/{project_id}", response_model=ProjectResponse)
+async def update_project(
+    project_id: uuid.UUID,
+    data: ProjectUpdate,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """
+    Update a project's name, description or status (owners and admins).
+
+    Send the ETag in ``If-Match`` (412 if the project changed since) or the
+    ``version`` in the body (409).
+    """
+    row = await project_service.update_project(
+        db, project_id, data, current_user, if_match=if_match
+    )
+    validator = Validator.for_version(row["version"], row["updated_at"])
+    return SchemaResponse(row, ProjectResponse, headers=validator.headers())
+
+
+@router.delete(
+    "/{project_id}",
+    response_model=ProjectDeletionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def delete_project(
+    project_id: uuid.UUID,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """
+    Delete a project (owner only).
+
+    The project disappears immediately; its tasks, comments and notifications
+    are deleted in the background. Follow progress at the ``Location`` URL.
+    """
+    deletion = await project_service.delete_project(db, project_id, current_user)
+    return SchemaResponse(
+        deletion,
+        ProjectDeletionResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Location": f"{settings.API_V1_STR}/projects/{project_id}/deletion"},
+    )
+
+
+@router.get("/{project_id}/deletion", response_model=ProjectDeletionResponse)
+async def get_project_deletion(
+    project_id: uuid.UUID,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """Progress of a project deletion: status and rows deleted so far."""
+    deletion = await project_service.get_deletion(db, project_id, current_user)
+    return SchemaResponse(deletion, ProjectDeletionResponse)
+
+
+@router.post(
+    "/{project_id}/clone",
+    response_model=ProjectCloneResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": ProjectCloneResponse}},
+)
+async def clone_project(
+    project_id: uuid.UUID,
+    data: ProjectCloneCreate,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """
+    Copy a project with its members, tasks and (optionally) comments.
+
+    The copy is made by the database in one transaction. Small projects are
+    copied right away (201, ``Location`` of the new project); big ones in the
+    background (202, ``Location`` of the clone's progress).
+    """
+    clone = await project_service.clone_project(db, project_id, data, current_user)
+    if clone.status == "done":
+        return SchemaResponse(
+            clone,
+            ProjectCloneResponse,
+            status_code=status.HTTP_201_CREATED,
+            headers={"Location": f"{settings.API_V1_STR}/projects/{clone.project_id}"},
+        )
+    return SchemaResponse(
+        clone,
+        ProjectCloneResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Location": f"{settings.API_V1_STR}/projects/clones/{clone.id}"},
+    )
+
+
+@router.get("/clones/{clone_id}", response_model=ProjectCloneResponse)
+async def get_project_clone(
+    clone_id: uuid.UUID,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service),
+):
+    """Progress of a project clone: status, current step and rows copied."""
+    clone = await project_service.get_clone(db, clone_id, current_user)
+    return SchemaResponse(clone, ProjectCloneResponse)
+
+
+@router.get("/{project_id}/tasks", response_model=list[TaskResponse])
+async def list_project_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    task_status: Optional[str] = Query(None, alias="status"),
+    assignee_id: Optional[uuid.UUID] = None,
+    fields: Optional[Tuple[str, ...]] = Depends(get_sparse_fields(TaskResponse)),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    order_by: str = Query("position", pattern=TASK_ORDER_PATTERN),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_repository: ProjectRepository = Depends(get_project_repository),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    List a project's tasks, by board position by default.
+
+    Kanban boards should ask for the card fields only, e.g.
+    ``fields=title,status,priority,position,assignee_id``. Supports
+    conditional requests; unchanged boards are answered with a 304.
+
+    Total: exact, in ``X-Total-Count``; the validator counts the tasks anyway.
+    """
+    await ensure_project_access(db, project_repository, project_id, current_user)
+
+    filters = TaskFilters(
+        project_id=project_id, status=task_status, assignee_id=assignee_id
+    )
+    count, max_updated_at = await task_service.get_list_stats(
+        db, filters, current_user, check_access=False
+    )
+    validator = Validator.for_collection(
+        "project_tasks", cache_key(request), count, max_updated_at
+    )
+
+    async def build():
+        rows = await task_service.list_tasks(
+            db,
+            filters,
+            current_user,
+            fields=fields,
+            skip=skip,
+            limit=limit,
+            order_by=order_by,
+            check_access=False,
+        )
+        return SchemaResponse(
+            rows,
+            partial_schema(TaskResponse, fields),
+            headers=count_headers(count, has_more=skip + len(rows) < count),
+        )
+
+    # Access was checked above, so members share one cached board
+    return await conditional_response(request, validator, build)
+
+
+@router.get("/{project_id}/export/{resource}")
+async def export_project(
+    project_id: uuid.UUID,
+    resource: ExportResource,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_repository: ProjectRepository = Depends(get_project_repository),
+    export_service: ExportService = Depends(get_export_service),
+):
+    """
+    Stream all tasks, comments or members of a project as NDJSON or CSV.
+
+    Rows are fetched through a server-side cursor and sent as they arrive,
+    so exports of any size run in constant memory.
+    """
+    await ensure_project_access(db, project_repository, project_id, current_user)
+
+    filename = f"project-{project_id}-{resource.value}.{export_format.value}"
+    return StreamingResponse(
+        export_service.stream_export(project_id, resource, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/{project_id}/tasks/import", response_model=TaskImportResult)
+async def import_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    import_format: ImportFormat | None = Query(None, alias="format"),
+    atomic: bool = Query(False, description="Import nothing if any row fails"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    project_repository: ProjectRepository = Depends(get_project_repository),
+    import_service: ImportService = Depends(get_import_service),
+):
+    """
+    Bulk-import tasks from a CSV (with header) or NDJSON request body.
+
+    Columns: title, description, status, priority, due_date and either
+    assignee_id or assignee_email. The body is read as a stream and imported
+    in chunks; rows that fail validation are reported by row number.
+    """
+    await ensure_project_access(db, project_repository, project_id, current_user)
+
+    if import_format is None:
+        content_type = request.headers.get("content-type", "")
+        import_format = (
+            ImportFormat.CSV if "csv" in content_type else ImportFormat.NDJSON
+        )
+
+    return await import_service.import_tasks(
+        db,
+        project_id=project_id,
+        creator_id=current_user.id,
+        body=request.stream(),
+        import_format=import_format,
+        atomic=atomic,
+    )
@@ -0,0 +1,186 @@
+# app/api/v1/tasks.py
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_sparse_fields, get_task_service
+from app.core.cache import Validator, cache_key, conditional_response
+from app.core.config import settings
+from app.core.counting import count_headers
+from app.core.responses import SchemaResponse, partial_schema
+from app.db.session import get_db
+from app.schemas.task import (
+    TaskBulkUpdate,
+    TaskBulkUpdateResult,
+    TaskFilters,
+    TaskResponse,
+    TaskTombstone,
+    TaskUpdate,
+)
+from app.schemas.user import UserResponse
+from app.services.task_service import TaskService
+
+router = APIRouter()
+
+# Fields tasks can be listed by, prefix with '-' for DESC
+TASK_ORDER_PATTERN = "^-?(created_at|updated_at|due_date|position|title)$"
+
+
+@router.get("", response_model=list[TaskResponse])
+async def list_tasks(
+    request: Request,
+    filters: TaskFilters = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(get_sparse_fields(TaskResponse)),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    order_by: str = Query("-created_at", pattern=TASK_ORDER_PATTERN),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    List tasks in projects you can see.
+
+    Use ``fields`` to fetch only some columns, e.g. ``fields=id,title,status``
+    for a list view: the other columns are neither queried nor serialized.
+
+    Responses carry a weak ETag derived from the count and newest update of
+    the matching tasks; send it back in ``If-None-Match`` to get a 304.
+
+    Total: exact, in ``X-Total-Count``; the validator counts the tasks anyway.
+    """
+    count, max_updated_at = await task_service.get_list_stats(db, filters, current_user)
+    validator = Validator.for_collection(
+        "tasks", cache_key(request, current_user.id), count, max_updated_at
+    )
+
+    async def build():
+        rows = await task_service.list_tasks(
+            db,
+            filters,
+            current_user,
+            fields=fields,
+            skip=skip,
+            limit=limit,
+            order_by=order_by,
+        )
+        return SchemaResponse(
+            rows,
+            partial_schema(TaskResponse, fields),
+            headers=count_headers(count, has_more=skip + len(rows) < count),
+        )
+
+    return await conditional_response(request, validator, build, scope=current_user.id)
+
+
+@router.get("/tombstones", response_model=list[TaskTombstone])
+async def list_task_tombstones(
+    since: Optional[datetime] = None,
+    after_id: Optional[uuid.UUID] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    Tasks deleted since a point in time, for syncing clients.
+
+    Ordered by ``deleted_at`` then ``id``; to get the next page, pass the last
+    tombstone's ``deleted_at`` as ``since`` and its ``id`` as ``after_id``.
+    Tombstones are kept for ``SOFT_DELETE_RETENTION_DAYS``.
+
+    Total: none; ``X-Has-More`` tells whether to fetch another page.
+    """
+    rows = await task_service.get_tombstones(
+        db, current_user, since=since, after_id=after_id, limit=limit + 1
+    )
+    return SchemaResponse(
+        rows[:limit],
+        TaskTombstone,
+        headers=count_headers(has_more=len(rows) > limit),
+    )
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: uuid.UUID,
+    request: Request,
+    fields: Optional[Tuple[str, ...]] = Depends(get_sparse_fields(TaskResponse)),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    Get a task. Supports ``fields`` and conditional requests.
+
+    The ETag carries the task's version; send it in ``If-Match`` when
+    updating the task to make sure nobody changed it in between.
+    """
+    current = await task_service.get_task_version(db, task_id, current_user)
+    validator = Validator.for_version(current["version"], current["updated_at"], fields)
+
+    async def build():
+        row = await task_service.get_task(db, task_id, fields=fields)
+        return SchemaResponse(row, partial_schema(TaskResponse, fields))
+
+    return await conditional_response(request, validator, build, scope=current_user.id)
+
+
+@router.patch("/bulk", response_model=TaskBulkUpdateResult)
+async def bulk_update_tasks(
+    data: TaskBulkUpdate,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    Move, assign or reprioritize many tasks in one request.
+
+    Select tasks with ``task_ids`` or ``filters``; tasks in projects you are
+    not a member of are skipped. Assignees get one grouped notification.
+    """
+    rows = await task_service.bulk_update(db, data, current_user)
+    return SchemaResponse({"updated": len(rows), "tasks": rows}, TaskBulkUpdateResult)
+
+
+@router.patch("/{task_id}", response_model=TaskResponse)
+async def update_task(
+    task_id: uuid.UUID,
+    data: TaskUpdate,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    Update a task.
+
+    Send the ETag from ``GET /tasks/{task_id}`` in ``If-Match`` (412 if the
+    task changed since) or the task's ``version`` in the body (409). The
+    response carries the new ETag.
+    """
+    row = await task_service.update_task(
+        db, task_id, data, current_user, if_match=if_match
+    )
+    validator = Validator.for_version(row["version"], row["updated_at"])
+    return SchemaResponse(row, TaskResponse, headers=validator.headers())
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(
+    task_id: uuid.UUID,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """
+    Delete a task. Honours ``If-Match`` (412 if the task changed since).
+
+    Deleted tasks show up in ``GET /tasks/tombstones`` until purged.
+    """
+    await task_service.delete_task(db, task_id, current_user, if_match=if_match)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,303 @@
+# app/core/background.py
+"""
+In-process asyncio runner for sub-second side effects.
+
+WebSocket broadcasts, cache invalidation and counter bumps don't need a broker
+round trip. Job types are registered with their own bounded queue, worker
+count and batching window; similar jobs submitted close together are handed to
+the handler as one batch. Each job type can be switched to Celery execution
+through ``settings.BACKGROUND_JOB_MODES`` without touching the callers.
+
+Usage:
+    from app.core.background import background_runner
+
+    @background_runner.job("cache_invalidation", batch_size=100, batch_window=0.01)
+    async def invalidate_keys(payloads: list[str]) -> None:
+        await cache.delete(*payloads)
+
+    background_runner.dispatch("cache_invalidation", "user:42")
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[List[Any]], Awaitable[None]]
+
+INPROCESS = "inprocess"
+CELERY = "celery"
+
+
+@dataclass
+class JobMetrics:
+    """Counters for one job type."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    sent_to_celery: int = 0
+    batches: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    def as_dict(self, queue_depth: int) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "sent_to_celery": self.sent_to_celery,
+            "batches": self.batches,
+            "queue_depth": queue_depth,
+            "avg_wait_ms": round(
+                1000 * self.total_wait_seconds / max(self.completed + self.failed, 1),
+                3,
+            ),
+            "avg_batch_ms": round(
+                1000 * self.total_run_seconds / max(self.batches, 1), 3
+            ),
+        }
+
+
+@dataclass
+class JobSpec:
+    """Registration of a job type."""
+
+    name: str
+    handler: JobHandler
+    concurrency: int
+    max_queue: int
+    batch_size: int
+    batch_window: float
+    mode: str = INPROCESS
+    celery_task: Any = None
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+    queue: Optional[asyncio.Queue] = None
+    workers: List[asyncio.Task] = field(default_factory=list)
+
+
+class BackgroundRunner:
+    """Bounded, batching asyncio job runner started in the app lifespan."""
+
+    def __init__(self):
+        self._jobs: Dict[str, JobSpec] = {}
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def register(
+        self,
+        name: str,
+        handler: JobHandler,
+        *,
+        concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        batch_size: int = 1,
+        batch_window: float = 0.0,
+        mode: str = INPROCESS,
+        celery_task: Any = None,
+    ) -> JobSpec:
+        """
+        Register a job type.
+
+        Args:
+            name: Job type name used by ``dispatch``
+            handler: Coroutine receiving a list of payloads
+            concurrency: Workers for this job type
+            max_queue: Queue bound; further submissions overflow or drop
+            batch_size: Maximum payloads per handler call
+            batch_window: Seconds to wait for a batch to fill up
+            mode: Default execution mode (``inprocess`` or ``celery``)
+            celery_task: Celery task taking a list of payloads, or its
+                registered name so the web process doesn't import the task
+                module; used in ``celery`` mode and when the in-process queue
+                is full
+
+        Returns:
+            The job specification
+        """
+        if name in self._jobs:
+            raise ValueError(f"Job type already registered: {name}")
+        # Checked after the settings override, which can switch a job to Celery
+        mode = settings.BACKGROUND_JOB_MODES.get(name, mode)
+        if mode not in (INPROCESS, CELERY):
+            raise ValueError(f"Unknown mode for job type {name}: {mode}")
+        if mode == CELERY and celery_task is None:
+            raise ValueError(f"Job type {name} needs a celery_task in celery mode")
+
+        spec = JobSpec(
+            name=name,
+            handler=handler,
+            concurrency=concurrency or settings.BACKGROUND_CONCURRENCY,
+            max_queue=max_queue or settings.BACKGROUND_QUEUE_SIZE,
+            batch_size=batch_size,
+            batch_window=batch_window,
+            mode=mode,
+            celery_task=celery_task,
+        )
+        self._jobs[name] = spec
+        if self._running:
+            self._start_job(spec)
+        return spec
+
+    def job(self, name: str, **options: Any) -> Callable[[JobHandler], JobHandler]:
+        """Decorator form of ``register``."""
+
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.register(name, handler, **options)
+            return handler
+
+        return decorator
+
+    def dispatch(self, name: str, payload: Any) -> bool:
+        """
+        Submit a job without waiting for it.
+
+        Must be called from the event loop thread.
+
+        Args:
+            name: Registered job type
+            payload: JSON-serializable payload (required for Celery mode)
+
+        Returns:
+            True if the job was queued in-process or sent to Celery
+        """
+        spec = self._jobs[name]
+        spec.metrics.submitted += 1
+
+        if spec.mode == CELERY or not self._running:
+            return self._send_to_celery(spec, payload)
+
+        try:
+            spec.queue.put_nowait((time.perf_counter(), payload))
+            return True
+        except asyncio.QueueFull:
+            # Backpressure: spill to Celery rather than grow without bound
+            return self._send_to_celery(spec, payload)
+
+    def _send_to_celery(self, spec: JobSpec, payload: Any) -> bool:
+        if spec.celery_task is None:
+            spec.metrics.dropped += 1
+            logger.warning(f"Dropped background job {spec.name}: runner unavailable")
+            return False
+        try:
+            if isinstance(spec.celery_task, str):
+                from app.tasks.celery_app import celery
+
+                celery.send_task(spec.celery_task, args=[[payload]])
+            else:
+                spec.celery_task.delay([payload])
+        except Exception as e:
+            spec.metrics.dropped += 1
+            logger.error(f"Could not send background job {spec.name}: {str(e)}")
+            return False
+        spec.metrics.sent_to_celery += 1
+        return True
+
+    async def start(self) -> None:
+        """Start workers for every registered in-process job type."""
+        if self._running:
+            return
+        self._running = True
+        for spec in self._jobs.values():
+            self._start_job(spec)
+        logger.info(f"Background runner started with {len(self._jobs)} job types")
+
+    def _start_job(self, spec: JobSpec) -> None:
+        if spec.mode != INPROCESS:
+            return
+        spec.queue = asyncio.Queue(maxsize=spec.max_queue)
+        spec.workers = [
+            asyncio.create_task(self._worker(spec), name=f"bg-{spec.name}-{i}")
+            for i in range(spec.concurrency)
+        ]
+
+    async def _next_batch(self, spec: JobSpec) -> List[Any]:
+        batch = [await spec.queue.get()]
+        if spec.batch_size > 1:
+            deadline = time.perf_counter() + spec.batch_window
+            while len(batch) < spec.batch_size:
+                try:
+                    batch.append(spec.queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(spec.queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+        return batch
+
+    async def _worker(self, spec: JobSpec) -> None:
+        while True:
+            batch = await self._next_batch(spec)
+            started = time.perf_counter()
+            metrics = spec.metrics
+            metrics.total_wait_seconds += sum(started - queued for queued, _ in batch)
+            try:
+                await spec.handler([payload for _, payload in batch])
+                metrics.completed += len(batch)
+            except Exception as e:
+                metrics.failed += len(batch)
+                logger.exception(f"Background job {spec.name} failed: {str(e)}")
+            finally:
+                metrics.batches += 1
+                metrics.total_run_seconds += time.perf_counter() - started
+                for _ in batch:
+                    spec.queue.task_done()
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting jobs, drain queued work, then stop the workers.
+
+        Args:
+            timeout: Seconds to wait for queues to drain
+        """
+        if not self._running:
+            return
+        self._running = False
+        timeout = settings.BACKGROUND_SHUTDOWN_TIMEOUT if timeout is None else timeout
+
+        specs = [spec for spec in self._jobs.values() if spec.workers]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(spec.queue.join() for spec in specs)), timeout
+            )
+        except asyncio.TimeoutError:
+            pending = sum(spec.queue.qsize() for spec in specs)
+            logger.warning(f"Background runner stopped with {pending} jobs pending")
+
+        for spec in specs:
+            for worker in spec.workers:
+                worker.cancel()
+            await asyncio.gather(*spec.workers, return_exceptions=True)
+            spec.workers = []
+        logger.info("Background runner stopped")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-job-type counters and queue depths."""
+        return {
+            name: {
+                "mode": spec.mode,
+                **spec.metrics.as_dict(spec.queue.qsize() if spec.queue else 0),
+            }
+            for name, spec in self._jobs.items()
+        }
+
+
+# Global runner instance
+background_runner = BackgroundRunner()
@@ -0,0 +1,368 @@
+# app/core/cache.py
+"""
+HTTP validators and a shared response cache for GET endpoints.
+
+Routes answer conditional requests from a cheap query instead of rebuilding
+the response. For a single resource the validator is its ``updated_at``; for a
+collection it's ``count(*)`` and ``max(updated_at)`` over the filtered rows,
+plus the query parameters. ``conditional_response`` then:
+
+1. Returns 304 if the client's ``If-None-Match``/``If-Modified-Since`` still
+   matches
+2. Serves the cached body if the server already built a response for this
+   validator
+3. Otherwise builds the response, tags it with ``ETag``/``Last-Modified`` and
+   caches it
+
+Cached bodies are compressed at most once per encoding and the compressed
+bytes are kept with the entry, so hot responses cost no compression CPU.
+
+Usage:
+    @router.get("/{task_id}")
+    async def get_task(task_id: UUID, request: Request, ...):
+        updated_at = await task_repository.get_updated_at(db, task_id)
+        validator = Validator.for_resource("task", task_id, updated_at)
+        return await conditional_response(
+            request, validator, lambda: build_task_response(task_id),
+            scope=current_user.id,
+        )
+
+The cache lives in process memory, bounded by entries and TTL. Entries are
+keyed by caller and URL, so one user never sees another user's response.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, Request, status
+from starlette.responses import Response
+
+from app.core.compression import choose_encoding, compress, is_compressible
+from app.core.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag from the given parts; equal parts give equal tags."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def format_http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+@dataclass(frozen=True)
+class Validator:
+    """An ETag and, when known, the last modification time of a response."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def for_resource(
+        cls, kind: str, id: Any, updated_at: Optional[datetime], *extra: Any
+    ) -> "Validator":
+        """Validator for one row, from its ``updated_at``."""
+        return cls(make_etag(kind, id, updated_at, *extra), updated_at)
+
+    @classmethod
+    def for_collection(
+        cls,
+        kind: str,
+        params: Any,
+        count: int,
+        max_updated_at: Optional[datetime],
+    ) -> "Validator":
+        """
+        Validator for a filtered collection.
+
+        Any insert, update or delete under the filter changes ``count`` or
+        ``max(updated_at)``; ``params`` covers paging, ordering and fields.
+        """
+        return cls(make_etag(kind, params, count, max_updated_at), max_updated_at)
+
+    @classmethod
+    def for_version(
+        cls,
+        version: int,
+        updated_at: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> "Validator":
+        """
+        Validator for a row of a versioned model (``VersionMixin``).
+
+        The ETag carries the version itself, so ``If-Match`` on a later write
+        can be turned into ``WHERE version = :v`` (see ``if_match_versions``).
+        """
+        tag = str(version)
+        if fields:
+            tag += "-" + make_etag(*fields)[3:11]
+        return cls(f'"{tag}"', updated_at)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_http_date(self.last_modified)
+        return headers
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def if_match_versions(if_match: str) -> Optional[List[int]]:
+    """
+    Versions named by an ``If-Match`` header of ``for_version`` ETags.
+
+    Returns None for ``*`` (any current version). Tags we didn't issue are
+    skipped, so they can never match.
+    """
+    if if_match.strip() == "*":
+        return None
+    versions = []
+    for candidate in if_match.split(","):
+        tag = candidate.strip().removeprefix("W/").strip('"')
+        version = tag.split("-", 1)[0]
+        if version.isdigit():
+            versions.append(int(version))
+    return versions
+
+
+def expected_versions(
+    if_match: Optional[str], version: Optional[int], kind: str
+) -> Optional[List[int]]:
+    """
+    Versions a write may apply to, from ``If-Match`` or the body's ``version``.
+
+    None means any version. Raises 428 when neither is sent and
+    ``REQUIRE_IF_MATCH`` is set.
+    """
+    if if_match is not None:
+        return if_match_versions(if_match)
+    if version is not None:
+        return [version]
+    if settings.REQUIRE_IF_MATCH:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail=f"Send If-Match with the {kind}'s ETag",
+        )
+    return None
+
+
+def version_conflict(
+    if_match: Optional[str], current_version: int, kind: str
+) -> HTTPException:
+    """
+    Error for a versioned write that lost the race.
+
+    412 when the precondition came from ``If-Match``, 409 when it came from
+    the body. The current ETag is included so the client can refetch.
+    """
+    return HTTPException(
+        status_code=(
+            status.HTTP_412_PRECONDITION_FAILED
+            if if_match is not None
+            else status.HTTP_409_CONFLICT
+        ),
+        detail=f"{kind.capitalize()} was modified (now at version {current_version})",
+        headers=Validator.for_version(current_version).headers(),
+    )
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """
+    Whether the client's cached copy is still valid.
+
+    ``If-None-Match`` wins over ``If-Modified-Since`` when both are sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validator.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validator.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        last_modified = validator.last_modified
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: bytes
+    media_type: Optional[str]
+    headers: Dict[str, str]
+    expires_at: float
+    # Compressed bodies by content coding, filled on first request for each
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def to_response(self, request: Request, headers: Dict[str, str]) -> Response:
+        """
+        Response for this entry, compressed for the client if worthwhile.
+
+        Each encoding is computed once and reused by every later hit, so the
+        compression middleware (which skips encoded responses) never redoes it.
+        """
+        encoding = None
+        if len(self.body) >= settings.COMPRESSION_MIN_SIZE and is_compressible(
+            self.media_type
+        ):
+            encoding = choose_encoding(request.headers.get("accept-encoding"))
+        if encoding is None:
+            return Response(
+                self.body,
+                media_type=self.media_type,
+                headers={**self.headers, **headers},
+            )
+
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = self.encoded[encoding] = compress(self.body, encoding)
+        return Response(
+            body,
+            media_type=self.media_type,
+            headers={
+                **self.headers,
+                **headers,
+                "Content-Encoding": encoding,
+                "Vary": "Accept-Encoding",
+            },
+        )
+
+
+class ResponseCache:
+    """Bounded LRU cache of rendered GET responses with a TTL."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, etag: str) -> Optional[CachedResponse]:
+        """Cached response for ``key`` if it was built for ``etag``."""
+        entry = self._entries.get(key)
+        if entry is None or entry.etag != etag or entry.expires_at < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, response: Response, etag: str) -> Optional[CachedResponse]:
+        if self.max_entries <= 0:
+            return None
+        entry = self._entries[key] = CachedResponse(
+            etag=etag,
+            body=bytes(response.body),
+            media_type=response.media_type,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name not in ("content-length", "etag", "last-modified")
+            },
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
+
+
+def cache_key(request: Request, scope: Any = None) -> str:
+    """Cache key from the caller scope, the path and the sorted query."""
+    query = "&".join(
+        f"{name}={value}" for name, value in sorted(request.query_params.multi_items())
+    )
+    return f"{scope}:{request.url.path}?{query}"
+
+
+def cache_control(policy: str) -> Callable[[Request], None]:
+    """
+    Dependency setting a route's ``Cache-Control`` header.
+
+    The middleware applies ``settings.HTTP_CACHE_CONTROL`` to GET responses
+    of routes that don't declare their own policy.
+
+    Usage:
+        @router.get("/health", dependencies=[Depends(cache_control("no-store"))])
+    """
+
+    def set_cache_control(request: Request) -> None:
+        request.state.cache_control = policy
+
+    return set_cache_control
+
+
+async def conditional_response(
+    request: Request,
+    validator: Validator,
+    build: Callable[[], Awaitable[Response]],
+    *,
+    scope: Any = None,
+) -> Response:
+    """
+    Answer a GET from its validator: 304, cached body or a fresh response.
+
+    Args:
+        request: Incoming request (conditional headers, cache key)
+        validator: Validator computed from a cheap query
+        build: Coroutine function producing the full response
+        scope: Who the response is for, usually the user id; part of the key
+
+    Returns:
+        A 304, the cached response or the freshly built one
+    """
+    headers = validator.headers()
+    if is_not_modified(request, validator):
+        return Response(status_code=304, headers=headers)
+
+    key = cache_key(request, scope)
+    cached = response_cache.get(key, validator.etag)
+    if cached is not None:
+        return cached.to_response(request, headers)
+
+    response = await build()
+    if response.status_code != 200:
+        return response
+    entry = response_cache.set(key, response, validator.etag)
+    if entry is None:
+        response.headers.update(headers)
+        return response
+    return entry.to_response(request, headers)
@@ -0,0 +1,232 @@
+# app/core/compression.py
+"""
+Response compression: gzip always, brotli and zstd when installed.
+
+``CompressionMiddleware`` compresses responses whose content type is textual
+and whose body is at least ``COMPRESSION_MIN_SIZE`` bytes, choosing the
+first encoding from ``COMPRESSION_ENCODINGS`` that the client accepts.
+Streaming responses (exports) are compressed chunk by chunk; their first
+chunks are held back until the body is known to reach the minimum size.
+
+Responses that already carry a ``Content-Encoding`` are left alone. The GET
+response cache uses this to compress hot bodies once per encoding and serve
+the stored bytes afterwards (see ``app.core.cache``).
+"""
+
+import zlib
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional encoder
+    brotli = None
+
+try:
+    from compression import zstd  # Python 3.14+
+
+    ZSTD_STDLIB = True
+except ImportError:  # pragma: no cover - zstd is an optional encoder
+    ZSTD_STDLIB = False
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class _GzipStream:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_LEVEL)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self) -> None:
+        compressor = zstd.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+        # The zstandard package streams through a separate compressobj
+        self._compressor = compressor if ZSTD_STDLIB else compressor.compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _available_streams() -> Dict[str, Callable[[], object]]:
+    streams: Dict[str, Callable[[], object]] = {"gzip": _GzipStream}
+    if brotli is not None:
+        streams["br"] = _BrotliStream
+    if zstd is not None:
+        streams["zstd"] = _ZstdStream
+    return streams
+
+
+STREAMS = _available_streams()
+
+
+def available_encodings() -> List[str]:
+    """Configured encodings this process can produce, in preference order."""
+    return [name for name in settings.COMPRESSION_ENCODINGS if name in STREAMS]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a whole body with one of ``available_encodings()``."""
+    stream = STREAMS[encoding]()
+    return stream.compress(body) + stream.finish()
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the server's most preferred encoding the client accepts.
+
+    Encodings with ``q=0`` are refused; ``*`` accepts anything not listed.
+    """
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """Compress textual responses above a size threshold (see module doc)."""
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = (
+            settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        stream = None
+        passthrough = False
+        # Leading chunks of a body of unknown length, held until it is known
+        # to reach the minimum size
+        pending: List[bytes] = []
+        pending_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stream, passthrough, pending_size
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                length = headers.get("content-length")
+                if (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                    or not is_compressible(headers.get("content-type"))
+                    or (length is not None and int(length) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if stream is None:
+                pending.append(body)
+                pending_size += len(body)
+                if more_body and pending_size < self.minimum_size:
+                    return
+                body = b"".join(pending)
+                pending.clear()
+                headers = MutableHeaders(scope=start)
+                if not more_body and len(body) < self.minimum_size:
+                    # Unknown length up front, but turned out to be small
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    passthrough = True
+                    return
+                stream = STREAMS[encoding]()
+                headers["Content-Encoding"] = encoding
+                add_vary(headers)
+                del headers["content-length"]
+                if not more_body:
+                    compressed = stream.compress(body) + stream.finish()
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send(start)
+
+            data = stream.compress(body)
+            if not more_body:
+                data += stream.finish()
+            if data or not more_body:
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,149 @@
+# app/core/counting.py
+"""
+How paginated listings get their ``total``.
+
+An exact ``count(*)`` reads every matching row, which on a big table costs
+more than the page itself. Each list endpoint declares a ``CountStrategy``:
+
+- ``exact``: ``count(*)`` on every request
+- ``cached``: ``count(*)``, kept per query for ``COUNT_CACHE_TTL`` seconds.
+  Writes through a repository drop the table's cached counts in this
+  process; other processes may serve a count up to the TTL old
+- ``estimated``: the planner's row estimate, from ``pg_class.reltuples`` for
+  a whole table or ``EXPLAIN`` for a filtered query. Estimates below
+  ``COUNT_ESTIMATE_MIN`` are replaced by an exact count, which is cheap there
+- ``has_more``: no total at all; the page is read with one extra row to tell
+  whether another page follows
+
+Usage:
+    page = await repository.get_page(
+        db, skip=0, limit=20, count=CountStrategy.ESTIMATED
+    )
+    return SchemaResponse(page.items, UserResponse, headers=page.headers())
+"""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    HAS_MORE = "has_more"
+
+
+def count_headers(
+    total: Optional[int] = None,
+    *,
+    estimated: bool = False,
+    has_more: Optional[bool] = None,
+) -> Dict[str, str]:
+    """``X-Total-Count``, ``X-Total-Count-Estimated`` and ``X-Has-More``."""
+    headers = {}
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+        if estimated:
+            headers["X-Total-Count-Estimated"] = "true"
+    if has_more is not None:
+        headers["X-Has-More"] = "true" if has_more else "false"
+    return headers
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a listing and what is known about the rest."""
+
+    items: List[T]
+    # None with the has_more strategy
+    total: Optional[int] = None
+    estimated: bool = False
+    # None when only an estimated total is known
+    has_more: Optional[bool] = None
+
+    def pages(self, size: int) -> Optional[int]:
+        if self.total is None:
+            return None
+        return math.ceil(self.total / size) if size else 0
+
+    def headers(self) -> Dict[str, str]:
+        return count_headers(
+            self.total, estimated=self.estimated, has_more=self.has_more
+        )
+
+
+@dataclass
+class _Entry:
+    count: int
+    generation: int
+    expires_at: float
+
+
+class CountCache:
+    """Bounded LRU of exact counts by table and query, with a TTL."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        # Bumped by every write to a table; older entries are stale
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, table: str, key: str) -> Optional[int]:
+        entry = self._entries.get((table, key))
+        if (
+            entry is None
+            or entry.generation != self._generations.get(table, 0)
+            or entry.expires_at < time.monotonic()
+        ):
+            self.misses += 1
+            return None
+        self._entries.move_to_end((table, key))
+        self.hits += 1
+        return entry.count
+
+    def generation(self, table: str) -> int:
+        return self._generations.get(table, 0)
+
+    def set(self, table: str, key: str, count: int, generation: int) -> None:
+        """
+        Store a count computed while ``table`` was at ``generation``.
+
+        A count that raced with a write is still stored, but under the old
+        generation, so it is never served.
+        """
+        if self.max_entries <= 0:
+            return
+        self._entries[(table, key)] = _Entry(
+            count, generation, time.monotonic() + self.ttl
+        )
+        self._entries.move_to_end((table, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop the cached counts of the tables (call after writing to them)."""
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+count_cache = CountCache(
+    max_entries=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl=settings.COUNT_CACHE_TTL,
+)
@@ -0,0 +1,447 @@
+# app/core/idempotency.py
+"""
+Idempotency-Key handling for retried writes.
+
+Clients send a unique ``Idempotency-Key`` header with a POST or PATCH. The
+first request with a key runs normally and its response (status, headers and
+body bytes) is stored for ``IDEMPOTENCY_TTL`` seconds. Later requests with
+the same key get that response replayed byte for byte, marked with
+``Idempotent-Replayed: true``, without reaching the routes or repositories.
+
+A duplicate that arrives while the first request is still running waits for
+its result (up to ``IDEMPOTENCY_WAIT_TIMEOUT``) instead of running the work
+again, then gets 409 if it's still not done. Reusing a key for a different
+method, path, query or body is rejected with 422.
+
+Responses live in Redis; if Redis can't be reached, the ``idempotency_keys``
+table is used until it's back. Keys are scoped to the user the bearer token
+was issued to, so two users can't collide or read each other's responses,
+while a retry sent with a refreshed token still finds its key. Server errors and
+transient statuses are not stored, so those requests can be retried.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pydantic_core
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.security import get_user_id_from_token
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = (b"idempotent-replayed", b"true")
+# Responses a retry should not get replayed: the client may fix the cause
+UNSTORED_STATUSES = {401, 403, 408, 409, 425, 429}
+REDIS_KEY_PREFIX = "idempotency:"
+# Seconds to stop trying Redis after it failed
+REDIS_RETRY_AFTER = 30
+# Seconds between purges of expired rows in the fallback table
+PURGE_INTERVAL = 600
+
+
+@dataclass
+class StoredResponse:
+    """A stored response, or an in-flight lock when ``status_code`` is None."""
+
+    fingerprint: str
+    status_code: Optional[int] = None
+    headers: Optional[List[List[str]]] = None
+    body: bytes = b""
+
+    @property
+    def completed(self) -> bool:
+        return self.status_code is not None
+
+
+class IdempotencyStore:
+    """Where keys are locked and responses kept."""
+
+    async def reserve(self, key: str, fingerprint: str) -> bool:
+        """Claim ``key`` for a request about to run; False if already taken."""
+        raise NotImplementedError
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        raise NotImplementedError
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        raise NotImplementedError
+
+    async def release(self, key: str) -> None:
+        """Give up the lock so a retry runs the request again."""
+        raise NotImplementedError
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """Keys as Redis strings: JSON metadata, a newline, then the body bytes."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(url)
+
+    @staticmethod
+    def _encode(response: StoredResponse) -> bytes:
+        meta = {
+            "fingerprint": response.fingerprint,
+            "status_code": response.status_code,
+            "headers": response.headers,
+        }
+        return pydantic_core.to_json(meta) + b"\n" + response.body
+
+    @staticmethod
+    def _decode(value: bytes) -> StoredResponse:
+        meta, _, body = value.partition(b"\n")
+        return StoredResponse(**pydantic_core.from_json(meta), body=body)
+
+    async def reserve(self, key: str, fingerprint: str) -> bool:
+        return bool(
+            await self.redis.set(
+                REDIS_KEY_PREFIX + key,
+                self._encode(StoredResponse(fingerprint)),
+                nx=True,
+                ex=settings.IDEMPOTENCY_LOCK_TTL,
+            )
+        )
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        value = await self.redis.get(REDIS_KEY_PREFIX + key)
+        return None if value is None else self._decode(value)
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        await self.redis.set(
+            REDIS_KEY_PREFIX + key,
+            self._encode(response),
+            ex=settings.IDEMPOTENCY_TTL,
+        )
+
+    async def release(self, key: str) -> None:
+        await self.redis.delete(REDIS_KEY_PREFIX + key)
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Keys in the ``idempotency_keys`` table, one short session per call."""
+
+    def __init__(self) -> None:
+        from app.repositories.idempotency import IdempotencyRepository
+
+        self.repository = IdempotencyRepository()
+        self._next_purge = 0.0
+
+    def _session(self):
+        from app.db.session import get_sessionmaker
+
+        return get_sessionmaker()()
+
+    async def reserve(self, key: str, fingerprint: str) -> bool:
+        lock_until = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.IDEMPOTENCY_LOCK_TTL
+        )
+        async with self._session() as db:
+            if time.monotonic() >= self._next_purge:
+                self._next_purge = time.monotonic() + PURGE_INTERVAL
+                await self.repository.purge_expired(db)
+            return await self.repository.reserve(
+                db, key=key, fingerprint=fingerprint, lock_until=lock_until
+            )
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        async with self._session() as db:
+            row = await self.repository.get_by_key(db, key)
+        if row is None:
+            return None
+        return StoredResponse(
+            fingerprint=row["fingerprint"],
+            status_code=row["status_code"],
+            headers=row["headers"],
+            body=row["body"] or b"",
+        )
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        async with self._session() as db:
+            await self.repository.complete(
+                db,
+                key=key,
+                status_code=response.status_code,
+                headers=response.headers,
+                body=response.body,
+                expires_at=datetime.now(timezone.utc)
+                + timedelta(seconds=settings.IDEMPOTENCY_TTL),
+            )
+
+    async def release(self, key: str) -> None:
+        async with self._session() as db:
+            await self.repository.release(db, key)
+
+
+class IdempotencyStores:
+    """Redis with the table as fallback, per ``IDEMPOTENCY_BACKEND``."""
+
+    def __init__(self) -> None:
+        self._redis: Optional[RedisIdempotencyStore] = None
+        self._database: Optional[DatabaseIdempotencyStore] = None
+        self._redis_down_until = 0.0
+
+    @property
+    def database(self) -> DatabaseIdempotencyStore:
+        if self._database is None:
+            self._database = DatabaseIdempotencyStore()
+        return self._database
+
+    @property
+    def redis(self) -> Optional[RedisIdempotencyStore]:
+        if settings.IDEMPOTENCY_BACKEND == "database" or not settings.REDIS_URL:
+            return None
+        if (
+            settings.IDEMPOTENCY_BACKEND == "auto"
+            and time.monotonic() < self._redis_down_until
+        ):
+            return None
+        if self._redis is None:
+            self._redis = RedisIdempotencyStore(settings.REDIS_URL)
+        return self._redis
+
+    async def reserve(
+        self, key: str, fingerprint: str
+    ) -> Tuple[IdempotencyStore, bool]:
+        """Reserve in the preferred store, falling back to the table."""
+        store = self.redis
+        if store is not None:
+            from redis.exceptions import RedisError
+
+            try:
+                return store, await store.reserve(key, fingerprint)
+            except (RedisError, OSError) as e:
+                self._on_redis_error(e)
+        return self.database, await self.database.reserve(key, fingerprint)
+
+    async def get(self, store: IdempotencyStore, key: str) -> Optional[StoredResponse]:
+        """
+        Look up a key in the store that refused to reserve it.
+
+        A Redis failure reads as a missing key; Redis is then skipped, so the
+        next ``reserve`` goes to the table.
+        """
+        if store is self.database:
+            return await store.get(key)
+        from redis.exceptions import RedisError
+
+        try:
+            return await store.get(key)
+        except (RedisError, OSError) as e:
+            self._on_redis_error(e)
+            return None
+
+    def _on_redis_error(self, error: Exception) -> None:
+        if settings.IDEMPOTENCY_BACKEND == "redis":
+            raise error
+        logger.warning(f"Redis unavailable for idempotency keys, using DB: {error}")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+
+
+idempotency_stores = IdempotencyStores()
+
+
+def _error(status_code: int, detail: str) -> JSONResponse:
+    return JSONResponse({"detail": detail}, status_code=status_code)
+
+
+async def _read_body(receive: Receive, limit: int) -> Optional[bytes]:
+    """Read the whole request body, or None if it is larger than ``limit``."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """Store and replay responses of writes sent with an Idempotency-Key."""
+
+    def __init__(self, app: ASGIApp, stores: Optional[IdempotencyStores] = None):
+        self.app = app
+        self.stores = stores or idempotency_stores
+        # Requests running in this process, so local duplicates needn't poll
+        self._in_flight: Dict[str, asyncio.Event] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in (
+            settings.IDEMPOTENCY_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        client_key = headers.get(IDEMPOTENCY_HEADER)
+        if client_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not 0 < len(client_key) <= 255:
+            await _error(400, "Idempotency-Key must be 1-255 characters")(
+                scope, receive, send
+            )
+            return
+        body = await _read_body(receive, settings.IDEMPOTENCY_MAX_BODY_BYTES)
+        if body is None:
+            await _error(413, "Request body too large for an Idempotency-Key")(
+                scope, receive, send
+            )
+            return
+
+        key = self._storage_key(headers, client_key)
+        fingerprint = hashlib.blake2b(
+            b"\x1f".join(
+                [
+                    scope["method"].encode(),
+                    scope["path"].encode(),
+                    scope.get("query_string", b""),
+                    body,
+                ]
+            ),
+            digest_size=32,
+        ).hexdigest()
+
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+        while True:
+            store, reserved = await self.stores.reserve(key, fingerprint)
+            if reserved:
+                break
+            stored = await self.stores.get(store, key)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    await _error(
+                        422, "Idempotency-Key was already used for another request"
+                    )(scope, receive, send)
+                    return
+                if stored.completed:
+                    await self._replay(stored, send)
+                    return
+            # Wait for the request holding the key, then look again
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                await _error(409, "A request with this Idempotency-Key is in progress")(
+                    scope, receive, send
+                )
+                return
+            await self._wait(key, min(remaining, settings.IDEMPOTENCY_POLL_INTERVAL))
+
+        await self._run(scope, receive, send, body, store, key, fingerprint)
+
+    @staticmethod
+    def _storage_key(headers: Headers, client_key: str) -> str:
+        # The method and path are in the fingerprint, not the key, so reusing
+        # a key for another endpoint is caught as a mismatch. Requests without
+        # a valid token share the anonymous scope; the routes reject them.
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        subject = None
+        if scheme.lower() == "bearer" and token:
+            subject = get_user_id_from_token(token.strip())
+        return hashlib.sha256(
+            "\x1f".join((subject or "", client_key)).encode()
+        ).hexdigest()
+
+    async def _wait(self, key: str, timeout: float) -> None:
+        event = self._in_flight.get(key)
+        if event is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _replay(self, stored: StoredResponse, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": stored.status_code,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in stored.headers or []
+                ]
+                + [REPLAYED_HEADER],
+            }
+        )
+        await send({"type": "http.response.body", "body": stored.body})
+
+    async def _run(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        body: bytes,
+        store: IdempotencyStore,
+        key: str,
+        fingerprint: str,
+    ) -> None:
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        response = StoredResponse(fingerprint)
+        chunks: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response.status_code = message["status"]
+                response.headers = [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        event = self._in_flight[key] = asyncio.Event()
+        try:
+            await self.app(scope, receive_body, send_wrapper)
+        except BaseException:
+            await self._finish(store, key, None)
+            raise
+        else:
+            response.body = b"".join(chunks)
+            await self._finish(store, key, response)
+        finally:
+            event.set()
+            self._in_flight.pop(key, None)
+
+    async def _finish(
+        self, store: IdempotencyStore, key: str, response: Optional[StoredResponse]
+    ) -> None:
+        """Store a replayable response, or release the key for a retry."""
+        try:
+            if (
+                response is not None
+                and response.status_code is not None
+                and response.status_code < 500
+                and response.status_code not in UNSTORED_STATUSES
+            ):
+                await store.complete(key, response)
+            else:
+                await store.release(key)
+        except Exception as e:
+            # The write itself succeeded; only replay of it is lost
+            logger.error(f"Could not store idempotent response: {e}")
@@ -1,9 +1,27 @@
 # app/middleware.py or app/core/middleware.py
+import hashlib
+from typing import List, Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import etag_matches
 from app.core.config import settings
 
+# Headers a 304 keeps from the response it replaces (RFC 9110, 15.4.5)
+NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "vary",
+)
+
 
 def add_middleware(app: FastAPI):
     # CORS
@@ -23,3 +41,101 @@ def add_middleware(app: FastAPI):
 
     # Optional: Logging middleware
     # Optional: Rate limiting middleware
+
+
+class ConditionalGetMiddleware:
+    """
+    ETag, 304 and Cache-Control handling for every GET.
+
+    Routes using ``conditional_response`` set validators from a cheap query;
+    this covers everything else. A 200 without an ETag whose body is at most
+    ``CONDITIONAL_ETAG_MAX_BYTES`` gets a weak ETag hashed from the body, so
+    clients still get 304s (saving bandwidth, not server work). Responses
+    without a Content-Length, i.e. streams, are passed through untouched.
+
+    GET and HEAD responses below 400 get the route's ``Cache-Control``
+    policy (see ``app.core.cache.cache_control``) or the configured default.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        buffered_start: Optional[Message] = None
+        chunks: List[bytes] = []
+        done = False
+
+        async def send_not_modified(start: Message) -> None:
+            nonlocal done
+            done = True
+            headers = MutableHeaders(scope=start)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (name.encode("latin-1"), value.encode("latin-1"))
+                        for name, value in headers.items()
+                        if name in NOT_MODIFIED_HEADERS
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal buffered_start
+            if done:
+                return  # Body of a response already answered with 304
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                if status < 400 and "cache-control" not in headers:
+                    policy = scope.get("state", {}).get("cache_control")
+                    headers["Cache-Control"] = policy or settings.HTTP_CACHE_CONTROL
+                if status != 200:
+                    await send(message)
+                    return
+
+                etag = headers.get("etag")
+                if etag is not None:
+                    if if_none_match and etag_matches(if_none_match, etag):
+                        await send_not_modified(message)
+                    else:
+                        await send(message)
+                    return
+
+                length = headers.get("content-length")
+                if (
+                    scope["method"] == "GET"
+                    and length is not None
+                    and int(length) <= settings.CONDITIONAL_ETAG_MAX_BYTES
+                ):
+                    buffered_start = message
+                    return
+                await send(message)
+                return
+
+            if buffered_start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            etag = f'W/"{digest}"'
+            MutableHeaders(scope=buffered_start)["ETag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                await send_not_modified(buffered_start)
+                return
+            await send(buffered_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
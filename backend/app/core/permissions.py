@@ -0,0 +1,179 @@
+# app/core/permissions.py
+"""
+Per-user cache of project roles for authorization checks.
+
+Nearly every project, task and comment endpoint asks "is this user a member
+of that project, and with which role?". ``MembershipCache`` answers from an
+in-process map ``{project_id: role}`` per user, loaded with one query the
+first time a user is checked and kept for ``PERMISSION_CACHE_TTL`` seconds.
+
+When a membership changes, ``invalidate`` drops the affected users' maps
+locally and publishes their ids on a Redis channel, so the other API
+processes drop theirs too. If Redis is down, the TTL bounds how long another
+process can serve a stale role.
+
+Usage:
+    roles = await membership_cache.get_roles(db, user_id, loader)
+    role = roles.get(project_id)  # "owner", "admin", "member" or None
+
+``ProjectRepository`` wraps this; most callers should use its
+``get_member_role``, ``is_member`` and ``get_member_roles``.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RoleMap = Dict[uuid.UUID, str]
+RoleLoader = Callable[[AsyncSession, uuid.UUID], Awaitable[RoleMap]]
+
+INVALIDATION_CHANNEL = "permissions:invalidate"
+# Published instead of user ids to drop every cached map
+INVALIDATE_ALL = "*"
+# Seconds between attempts to resubscribe after Redis failed
+RESUBSCRIBE_AFTER = 5
+
+
+@dataclass
+class _Entry:
+    roles: RoleMap
+    expires_at: float
+
+
+class MembershipCache:
+    """Bounded LRU of ``{project_id: role}`` maps by user, with a TTL."""
+
+    def __init__(self, max_users: int, ttl: float):
+        self.max_users = max_users
+        self.ttl = ttl
+        self._entries: "OrderedDict[uuid.UUID, _Entry]" = OrderedDict()
+        # Bumped by every invalidation; loads that straddle one aren't stored
+        self._epoch = 0
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    async def get_roles(
+        self, db: AsyncSession, user_id: uuid.UUID, loader: RoleLoader
+    ) -> RoleMap:
+        """The user's roles by project, from the cache or ``loader``."""
+        entry = self._entries.get(user_id)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry.roles
+
+        self.misses += 1
+        epoch = self._epoch
+        roles = await loader(db, user_id)
+        if epoch == self._epoch and self.max_users > 0:
+            self._entries[user_id] = _Entry(roles, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+        return roles
+
+    def discard(self, user_ids: Iterable[uuid.UUID]) -> None:
+        """Drop cached maps in this process only."""
+        self._epoch += 1
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+
+    async def invalidate(self, *user_ids: uuid.UUID) -> None:
+        """
+        Drop the users' maps here and in every other process.
+
+        Call after committing a membership or ownership change. With no ids,
+        every map is dropped (e.g. after deleting a project).
+        """
+        if user_ids:
+            self.discard(user_ids)
+        else:
+            self.clear()
+        redis = self._get_redis()
+        if redis is None:
+            return
+        message = ",".join(str(user_id) for user_id in user_ids) or INVALIDATE_ALL
+        try:
+            await redis.publish(INVALIDATION_CHANNEL, message)
+        except Exception as exc:
+            logger.warning(f"Could not publish permission invalidation: {exc}")
+
+    def _get_redis(self):
+        if self._redis is None and settings.REDIS_URL:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    def _apply(self, message: str) -> None:
+        if message == INVALIDATE_ALL:
+            self.clear()
+            return
+        user_ids = []
+        for value in message.split(","):
+            try:
+                user_ids.append(uuid.UUID(value))
+            except ValueError:
+                logger.warning(f"Ignoring bad permission invalidation: {value!r}")
+        self.discard(user_ids)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Invalidations published while we weren't listening are lost
+                self.clear()
+                async for message in pubsub.listen():
+                    data = message.get("data")
+                    if isinstance(data, bytes):
+                        self._apply(data.decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    f"Permission invalidation listener failed, retrying: {exc}"
+                )
+                await asyncio.sleep(RESUBSCRIBE_AFTER)
+
+    async def start(self) -> None:
+        """Start following invalidations from other processes (lifespan)."""
+        if self._listener is None and self._get_redis() is not None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def shutdown(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"users": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+membership_cache = MembershipCache(
+    max_users=settings.PERMISSION_CACHE_MAX_USERS,
+    ttl=settings.PERMISSION_CACHE_TTL,
+)
@@ -0,0 +1,195 @@
+# app/core/responses.py
+"""
+Fast JSON responses.
+
+``JSONResponse`` is the application's default response class. It encodes with
+orjson when installed, falling back to pydantic-core's encoder, and both
+handle UUIDs, datetimes and Pydantic models natively.
+
+Routes with a ``response_model`` still go through FastAPI's validate and
+serialize passes before the response class sees the data. Hot endpoints skip
+them by returning a ``SchemaResponse``, which encodes ORM rows in one pass:
+
+    @router.get("/users", response_model=list[UserResponse])
+    async def list_users(db: AsyncSession = Depends(get_db)):
+        users = await user_repository.get_multi(db, limit=100)
+        return SchemaResponse(users, UserResponse)
+
+Rows loaded from our own database are trusted: the schema's fields are read
+straight off the objects without validation (the ``model_construct`` contract).
+Pass ``validate=True`` for data from anywhere else, which runs a cached
+``TypeAdapter`` over the whole list at once.
+"""
+
+import types
+import typing
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Type
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter, create_model
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse as StarletteJSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+_MISSING = object()
+
+# (field name, default or _MISSING, nested schema, nested is a list)
+FieldPlan = Tuple[str, Any, Optional[Type[BaseModel]], bool]
+
+
+def _default(obj: Any) -> Any:
+    # Types orjson doesn't know (Pydantic models, Decimal, ...)
+    return pydantic_core.to_jsonable_python(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to JSON bytes with the fastest available encoder."""
+    if orjson is not None:
+        # UTC as "Z" matches Pydantic's own datetime serialization
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+    return pydantic_core.to_json(content)
+
+
+class JSONResponse(StarletteJSONResponse):
+    """Drop-in ``JSONResponse`` using orjson / pydantic-core."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def get_adapter(schema: Any) -> TypeAdapter:
+    """Cached ``TypeAdapter`` for a schema or type such as ``list[Schema]``."""
+    return TypeAdapter(schema)
+
+
+@lru_cache(maxsize=256)
+def partial_schema(
+    schema: Type[BaseModel], fields: Optional[Tuple[str, ...]]
+) -> Type[BaseModel]:
+    """
+    A cached copy of ``schema`` reduced to ``fields`` (sparse fieldsets).
+
+    Pass ``fields`` as a tuple in a stable order so repeated requests for the
+    same field set reuse the model. ``None`` returns ``schema`` unchanged.
+    """
+    if not fields:
+        return schema
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=schema.model_config,
+        **{
+            name: (info.annotation, info)
+            for name, info in schema.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+def _nested_schema(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Return the schema nested in a field annotation and whether it's a list."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _nested_schema(args[0]) if len(args) == 1 else (None, False)
+    if origin in (list, List, tuple, set, frozenset):
+        args = typing.get_args(annotation)
+        schema, _ = _nested_schema(args[0]) if args else (None, False)
+        return schema, schema is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _field_plan(schema: Type[BaseModel]) -> Tuple[FieldPlan, ...]:
+    # Resolves forward references such as "UserSummary" on first use
+    schema.model_rebuild()
+    plan = []
+    for name, info in schema.model_fields.items():
+        default = (
+            _MISSING
+            if info.is_required()
+            else info.get_default(call_default_factory=True)
+        )
+        nested, many = _nested_schema(info.annotation)
+        plan.append((name, default, nested, many))
+    return tuple(plan)
+
+
+def to_payload(obj: Any, schema: Type[BaseModel]) -> Any:
+    """
+    Read a schema's fields off a trusted object into a plain dict.
+
+    Works on ORM objects, ``Row`` objects and mappings, recursing into nested
+    schemas. Nothing is validated, so only use it for data we produced.
+    """
+    if obj is None or isinstance(obj, BaseModel):
+        return obj
+    is_mapping = isinstance(obj, Mapping)
+    payload = {}
+    for name, default, nested, many in _field_plan(schema):
+        value = obj.get(name, default) if is_mapping else getattr(obj, name, default)
+        if value is _MISSING:
+            raise AttributeError(
+                f"{type(obj).__name__} has no field {name!r} required by "
+                f"{schema.__name__}"
+            )
+        if nested is not None and value is not None:
+            value = (
+                [to_payload(item, nested) for item in value]
+                if many
+                else to_payload(value, nested)
+            )
+        payload[name] = value
+    return payload
+
+
+def serialize(content: Any, schema: Type[BaseModel], validate: bool = False) -> bytes:
+    """
+    Serialize one object or a list of objects as ``schema`` to JSON bytes.
+
+    Args:
+        content: ORM object(s), rows, mappings or schema instances
+        schema: Response schema describing the output fields
+        validate: Validate through a ``TypeAdapter`` instead of trusting content
+    """
+    many = isinstance(content, (list, tuple))
+    if validate:
+        adapter = get_adapter(List[schema] if many else schema)
+        return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    if many:
+        return dumps([to_payload(item, schema) for item in content])
+    return dumps(to_payload(content, schema))
+
+
+class SchemaResponse(JSONResponse):
+    """Response that serializes ORM rows through a schema in a single pass."""
+
+    def __init__(
+        self,
+        content: Any,
+        schema: Type[BaseModel],
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        *,
+        validate: bool = False,
+    ) -> None:
+        self.schema = schema
+        self.validate = validate
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        return serialize(content, self.schema, validate=self.validate)
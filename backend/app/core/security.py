@@ -1,8 +1,10 @@
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
-from backend.app.core.config import settings
+
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+
+from app.core.config import settings
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
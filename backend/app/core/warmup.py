@@ -0,0 +1,227 @@
+# app/core/warmup.py
+"""
+Startup warm-up run from the app lifespan.
+
+The first requests after a deploy otherwise pay for TCP/TLS setup, asyncpg
+type introspection, SQLAlchemy statement compilation and Pydantic schema
+building. Warm-up runs in the background right after startup:
+
+1. Opens ``WARMUP_POOL_CONNECTIONS`` pool connections at once
+2. Executes the repositories' hot statements on each of them, filling the
+   SQLAlchemy compiled cache and asyncpg's per-connection statement cache
+3. Rebuilds and exercises ``model_validate`` for every response schema
+
+``/health/ready`` reports 503 until the required steps have succeeded. A
+failed or timed-out database step is retried every ``WARMUP_RETRY_INTERVAL``
+seconds, so an instance that started before its database stays out of the
+load balancer until it can actually serve requests.
+"""
+
+import asyncio
+import logging
+import time
+import types
+import typing
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Steps that must succeed before the instance reports ready
+REQUIRED_STEPS: Tuple[str, ...] = ("database",)
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up, reported by the readiness probe."""
+
+    ready: bool = False
+    attempts: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "attempts": self.attempts,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "steps": self.steps,
+        }
+
+    def step_succeeded(self, name: str) -> bool:
+        return self.steps.get(name, {}).get("status") == "ok"
+
+
+warmup_state = WarmupState()
+
+
+def _warmup_repositories() -> list:
+    """Repositories whose hot statements are compiled during warm-up."""
+    from app.repositories.project import ProjectRepository
+    from app.repositories.task import TaskRepository
+    from app.repositories.user import UserRepository
+
+    return [UserRepository(), ProjectRepository(), TaskRepository()]
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[Any]]) -> None:
+    """Run one warm-up step; failures are recorded but never abort startup."""
+    started = time.perf_counter()
+    try:
+        detail = await step()
+        status = "ok"
+    except Exception as e:
+        detail = str(e)
+        status = "failed"
+        logger.warning(f"Warm-up step {name} failed: {detail}")
+    warmup_state.steps[name] = {
+        "status": status,
+        "duration_ms": round(1000 * (time.perf_counter() - started), 1),
+        "detail": detail,
+    }
+
+
+async def warm_database(connection_count: int) -> Dict[str, int]:
+    """
+    Open pool connections concurrently and run the hot statements on each.
+
+    Connections are returned to the pool afterwards, so they stay open and
+    each one already has the statements prepared.
+    """
+    from app.db.session import get_engine
+
+    engine = get_engine()
+    connection_count = min(connection_count, engine.pool.size())
+    statements = [
+        statement
+        for repository in _warmup_repositories()
+        for statement in repository.warmup_statements()
+    ]
+
+    async def warm_connection(connection: AsyncConnection) -> None:
+        await connection.execute(text("SELECT 1"))
+        for statement in statements:
+            await connection.execute(statement)
+        await connection.rollback()
+
+    connections: List[AsyncConnection] = []
+    try:
+        # Hold every connection at once so the pool has to open new ones
+        for _ in range(connection_count):
+            connections.append(await engine.connect())
+        await asyncio.gather(*(warm_connection(c) for c in connections))
+    finally:
+        await asyncio.gather(*(c.close() for c in connections))
+
+    return {"connections": len(connections), "statements": len(statements)}
+
+
+def _sample_value(annotation: Any, name: str) -> Any:
+    """Build a plausible value for a schema field from its annotation."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _sample_value(args[0], name) if args else None
+    if origin in (list, List):
+        (item,) = typing.get_args(annotation) or (str,)
+        return [_sample_value(item, name)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _sample_schema(annotation)
+    if annotation is uuid.UUID:
+        return uuid.uuid4()
+    if annotation is datetime:
+        return datetime.now(timezone.utc)
+    if annotation is bool:
+        return False
+    if annotation is int:
+        return 1
+    if "email" in name:
+        return "warmup@example.com"
+    return "warmup"
+
+
+def _sample_schema(schema: type[BaseModel]) -> Any:
+    values = {}
+    for name, info in schema.model_fields.items():
+        if info.is_required():
+            values[name] = _sample_value(info.annotation, name)
+        else:
+            values[name] = info.get_default(call_default_factory=True)
+    if schema.model_config.get("from_attributes"):
+        # Response schemas are validated from ORM objects in the hot path
+        return types.SimpleNamespace(**values)
+    return values
+
+
+async def warm_schemas() -> Dict[str, int]:
+    """Resolve forward references and exercise validation/serialization."""
+    import app.schemas as schemas
+
+    count = 0
+    for name in schemas.__all__:
+        schema = getattr(schemas, name)
+        schema.model_rebuild()
+        if not (
+            name.endswith("Response") or schema.model_config.get("from_attributes")
+        ):
+            continue
+        try:
+            schema.model_validate(_sample_schema(schema)).model_dump_json()
+        except ValidationError:
+            # The validator ran either way, which is all warm-up needs
+            pass
+        count += 1
+    return {"schemas": count}
+
+
+async def run_warmup() -> WarmupState:
+    """
+    Run all warm-up steps, retrying the required ones until they succeed.
+
+    The application is marked ready once every step in ``REQUIRED_STEPS``
+    has succeeded, or straight away when warm-up is disabled.
+    """
+    warmup_state.started_at = datetime.now(timezone.utc)
+
+    if settings.WARMUP_ENABLED:
+        logger.info("🔥 Warming up")
+        await _attempt(_run_all_steps)
+        while not all(warmup_state.step_succeeded(name) for name in REQUIRED_STEPS):
+            logger.warning(
+                f"Warm-up incomplete, retrying in {settings.WARMUP_RETRY_INTERVAL}s"
+            )
+            await asyncio.sleep(settings.WARMUP_RETRY_INTERVAL)
+            await _attempt(_run_database_step)
+
+    warmup_state.finished_at = datetime.now(timezone.utc)
+    warmup_state.ready = True
+    elapsed = (warmup_state.finished_at - warmup_state.started_at).total_seconds()
+    logger.info(f"✅ Ready after {elapsed:.2f}s warm-up")
+    return warmup_state
+
+
+async def _attempt(steps: Callable[[], Awaitable[None]]) -> None:
+    warmup_state.attempts += 1
+    try:
+        await asyncio.wait_for(steps(), settings.WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Warm-up timed out after {settings.WARMUP_TIMEOUT}s")
+
+
+async def _run_database_step() -> None:
+    await _run_step("database", lambda: warm_database(settings.WARMUP_POOL_CONNECTIONS))
+
+
+async def _run_all_steps() -> None:
+    await _run_database_step()
+    await _run_step("schemas", warm_schemas)
@@ -1,12 +1,13 @@
 # app/db/__init__.py
-from .base import Base, UUIDModel, TimestampMixin
+from .base import Base, TimestampMixin, UUIDModel
 from .session import (
-    engine,
-    SessionLocal,
-    get_db,
-    get_db_transaction,
     create_tables,
+    dispose_engine,
     drop_tables,
+    get_db,
+    get_db_transaction,
+    get_engine,
+    get_sessionmaker,
 )
 
 __all__ = [
@@ -15,8 +16,20 @@ __all__ = [
     "TimestampMixin",
     "engine",
     "SessionLocal",
+    "get_engine",
+    "get_sessionmaker",
     "get_db",
     "get_db_transaction",
     "create_tables",
     "drop_tables",
+    "dispose_engine",
 ]
+
+
+def __getattr__(name: str):
+    # engine and SessionLocal are created lazily by app.db.session
+    if name in ("engine", "SessionLocal"):
+        from . import session
+
+        return getattr(session, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
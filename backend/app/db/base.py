@@ -1,10 +1,11 @@
 # app/db/base.py
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import DateTime, func
 import uuid
 from datetime import datetime
 from typing import Any, Optional
 
+from sqlalchemy import DateTime, Integer, false, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -33,9 +34,8 @@ class UUIDModel(Base, TimestampMixin):
 
     __abstract__ = True
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        primary_key=True, default=uuid.uuid4, index=True
-    )
+    # The primary key is indexed already; no separate ix_<table>_id
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.id}>"
@@ -46,11 +46,35 @@ class UUIDModel(Base, TimestampMixin):
 
 
 class SoftDeleteMixin:
-    """Mixin for soft delete functionality."""
+    """
+    Mixin for soft delete functionality.
+
+    ``BaseRepository`` hides flagged rows from reads and turns ``delete`` into
+    an UPDATE. Models should declare their hot indexes as partial indexes
+    ``WHERE NOT is_deleted`` so tombstones don't slow down live queries.
+    """
 
     __abstract__ = True
 
-    is_deleted: Mapped[bool] = mapped_column(default=False, nullable=False)
+    is_deleted: Mapped[bool] = mapped_column(
+        default=False, server_default=false(), nullable=False
+    )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+
+
+class VersionMixin:
+    """
+    Mixin for optimistic concurrency control.
+
+    Every update bumps ``version`` in the same statement, and conditional
+    updates add ``WHERE version = :expected``, so concurrent writers are
+    detected without holding row locks.
+    """
+
+    __abstract__ = True
+
+    version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default="1", nullable=False
+    )
@@ -1,40 +1,76 @@
 # app/db/session.py
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from starlette.requests import HTTPConnection
+
 from app.core.config import settings
 from app.db.base import Base
 
-# Create async SQLAlchemy engine
-engine = create_async_engine(
-    str(settings.DATABASE_URL).replace("postgresql://", "postgresql+asyncpg://"),
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG,
-)
 
-# Create AsyncSessionLocal class
-SessionLocal = async_sessionmaker(
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-)
+# The engine and session factory are created on first use rather than at import
+# time, so CLI tools (alembic, seed scripts, Celery) that never touch the async
+# engine don't pay for the asyncpg dialect import and pool setup.
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Get the process-wide async SQLAlchemy engine, creating it on first use."""
+    return create_async_engine(
+        str(settings.DATABASE_URL).replace("postgresql://", "postgresql+asyncpg://"),
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        echo=settings.DEBUG,
+    )
+
 
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the process-wide session factory, creating it on first use."""
+    return async_sessionmaker(
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+        expire_on_commit=False,
+    )
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+
+def __getattr__(name: str):
+    # Keep `from app.db.session import engine, SessionLocal` working lazily
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function that yields a database session.
     Automatically closes the session after use.
 
+    Sub-requests of ``/batch`` reuse the session the batch put in
+    ``connection.state.db`` instead of opening their own.
+
     Usage:
         @app.get("/items")
         async def read_items(db: AsyncSession = Depends(get_db)):
             result = await db.execute(select(User))
             return result.scalars().all()
     """
-    async with SessionLocal() as session:
+    shared = getattr(connection.state, "db", None)
+    if shared is not None:
+        yield shared
+        return
+
+    async with get_sessionmaker()() as session:
         try:
             yield session
         finally:
@@ -43,18 +79,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def create_tables():
     """Create all tables in the database."""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def drop_tables():
     """Drop all tables in the database (for testing)."""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
-# Optional: Add a context manager for transactions
-from contextlib import asynccontextmanager
+async def dispose_engine() -> None:
+    """Close pooled connections, if the engine was ever created."""
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
 
 
 @asynccontextmanager
@@ -67,7 +105,7 @@ async def get_db_transaction() -> AsyncGenerator[AsyncSession, None]:
             await db.execute(...)
             await db.commit()
     """
-    async with SessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
             await session.commit()
@@ -1,10 +1,21 @@
 # app/main.py
+import asyncio
 from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+
+from app.api.v1 import v1_router  # Single import for all v1 routes
+from app.core.background import background_runner
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.idempotency import IdempotencyMiddleware
 from app.core.logging import setup_logging
-from app.api.v1 import v1_router  # Single import for all v1 routes
+from app.core.middleware import ConditionalGetMiddleware
+from app.core.permissions import membership_cache
+from app.core.responses import JSONResponse
+from app.core.warmup import run_warmup
+from app.db.session import dispose_engine
 
 
 @asynccontextmanager
@@ -21,11 +32,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"🌍 Environment: {settings.ENVIRONMENT}")
     logger.info(f"🔧 Debug mode: {settings.DEBUG}")
 
-    # TODO: Add any startup logic here
+    await background_runner.start()
+    await membership_cache.start()
+    # Warm up in the background; /health/ready reports 503 until it finishes
+    warmup_task = asyncio.create_task(run_warmup())
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down application")
+    warmup_task.cancel()
+    await membership_cache.shutdown()
+    await background_runner.shutdown()
+    await dispose_engine()
 
 
 # Create FastAPI application
@@ -37,8 +55,20 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    # orjson-backed; hot list endpoints return SchemaResponse directly
+    default_response_class=JSONResponse,
 )
 
+# Replays writes retried with the same Idempotency-Key (stores identity bodies)
+app.add_middleware(IdempotencyMiddleware)
+
+# ETags, 304s and Cache-Control for GETs (inside CORS so 304s keep its headers)
+app.add_middleware(ConditionalGetMiddleware)
+
+# gzip/br/zstd for large textual bodies; outside the ETag middleware so
+# validators are computed on the identity body
+app.add_middleware(CompressionMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
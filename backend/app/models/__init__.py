@@ -1,5 +1,3 @@
-from backend.app.db.base import Base
-
 """
 Database models for the Task Management API.
 
@@ -7,17 +5,23 @@ Import all models here so they're available when importing from app.models
 and so Alembic can detect them for migrations.
 """
 
-from app.models.user import User
-from app.models.project import Project, ProjectMember
-from app.models.task import Task
+from app.db.base import Base
 from app.models.comment import Comment
+from app.models.idempotency import IdempotencyKey
 from app.models.notification import Notification
+from app.models.project import Project, ProjectClone, ProjectDeletion, ProjectMember
+from app.models.task import Task
+from app.models.user import User
 
 __all__ = [
+    "Base",
     "User",
     "Project",
     "ProjectMember",
+    "ProjectDeletion",
+    "ProjectClone",
     "Task",
     "Comment",
     "Notification",
+    "IdempotencyKey",
 ]
@@ -1,15 +1,25 @@
 # app/models/comment.py
-from sqlalchemy import Text, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
-from backend.app.db.base import UUIDModel
-from app.models import Task, User
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Index, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import UUIDModel
+
+if TYPE_CHECKING:
+    from app.models.task import Task
+    from app.models.user import User
 
 
 class Comment(UUIDModel):  # Inherit from UUIDModel instead of Base
     """Comment model for task discussions."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # A task's comments in order, also for joins from a project's tasks
+        Index("ix_comments_task_id_created_at", "task_id", "created_at"),
+    )
 
     # No need for id, created_at, updated_at - they come from UUIDModel
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -17,10 +27,9 @@ class Comment(UUIDModel):  # Inherit from UUIDModel instead of Base
     task_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tasks.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Relationships
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import UUIDModel
+
+
+class IdempotencyKey(UUIDModel):
+    """
+    Response stored for an Idempotency-Key.
+
+    Used when Redis is unavailable. A row with no status_code is a request
+    still in flight; ``expires_at`` is its lock timeout until it completes,
+    then the replay TTL.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    # Hash of caller, method, path and the client's key
+    key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # Hash of the request, to reject a key reused for a different request
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    headers: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKey {self.key}>"
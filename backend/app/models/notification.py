@@ -1,14 +1,28 @@
+from typing import TYPE_CHECKING
 from uuid import UUID
-from sqlalchemy import String, Text, Boolean, ForeignKey
+
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.app.db.base import UUIDModel
-from backend.app.models.user import User
+
+from app.db.base import UUIDModel
+
+if TYPE_CHECKING:
+    from app.models.user import User
 
 
 class Notification(UUIDModel):
     """Notification model for user alerts."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # A user's (unread) notifications, newest first; also serves user_id
+        Index(
+            "ix_notifications_user_id_read_created_at",
+            "user_id",
+            "read",
+            "created_at",
+        ),
+    )
 
     type: Mapped[str] = mapped_column(
         String(100), nullable=False
@@ -16,16 +30,13 @@ class Notification(UUIDModel):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
     link: Mapped[str | None] = mapped_column(
-        String(500), nullable=True
-    )  # Link to relevant resource
-    read: Mapped[bool] = mapped_column(
-        Boolean, default=False, nullable=False, index=True
-    )
+        String(500), nullable=True, index=True
+    )  # Link to relevant resource; indexed to clean up after deletions
+    read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Relationships
@@ -1,14 +1,42 @@
-from sqlalchemy import String, Text, ForeignKey, DateTime, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
-from backend.app.db.base import UUIDModel
-from app.models import Project, ProjectMember, Task, User
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import SoftDeleteMixin, UUIDModel, VersionMixin
+
+if TYPE_CHECKING:
+    from app.models.task import Task
+    from app.models.user import User
 
 
-class Project(UUIDModel):
-    """Project model for organizing tasks."""
+class Project(UUIDModel, VersionMixin, SoftDeleteMixin):
+    """
+    Project model for organizing tasks.
+
+    Deleting a project only sets ``is_deleted``; its tasks and comments are
+    removed in batches by a background job (see ``ProjectDeletion``).
+    """
 
     __tablename__ = "projects"
+    __table_args__ = (
+        Index(
+            "ix_projects_owner_id", "owner_id", postgresql_where=text("NOT is_deleted")
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -39,6 +67,18 @@ class ProjectMember(UUIDModel):
     """Many-to-many relationship between Projects and Users."""
 
     __tablename__ = "project_members"
+    __table_args__ = (
+        # One membership per user and project; also serves (project, user) lookups
+        UniqueConstraint(
+            "project_id", "user_id", name="uq_project_members_project_user"
+        ),
+        # A user's projects and roles (permission checks) by index-only scan
+        Index(
+            "ix_project_members_user_id_include",
+            "user_id",
+            postgresql_include=["project_id", "role"],
+        ),
+    )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
@@ -61,3 +101,76 @@ class ProjectMember(UUIDModel):
 
     def __repr__(self) -> str:
         return f"<ProjectMember {self.user_id} in {self.project_id}>"
+
+
+class ProjectDeletion(UUIDModel):
+    """
+    Progress of the background deletion of a project's contents.
+
+    Not a foreign key to ``projects``: the row outlives the project so
+    clients can see that the deletion finished.
+    """
+
+    __tablename__ = "project_deletions"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(unique=True, nullable=False)
+    requested_by: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), default="pending", nullable=False, index=True
+    )  # pending, running, done, failed
+    tasks_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    tasks_deleted: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    comments_deleted: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    notifications_deleted: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    # Keyset cursor: the last task id deleted, so a restarted job resumes
+    last_task_id: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectDeletion {self.project_id} {self.status}>"
+
+
+class ProjectClone(UUIDModel):
+    """A request to copy a project, and the progress of the copy."""
+
+    __tablename__ = "project_clones"
+
+    source_project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    # Set once the copy has been committed
+    project_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+    )
+    requested_by: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    include_members: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    include_tasks: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    include_comments: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), default="pending", nullable=False, index=True
+    )  # pending, running, done, failed
+    step: Mapped[str | None] = mapped_column(
+        String(20), nullable=True
+    )  # project, members, tasks, comments
+    tasks_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    members_copied: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    tasks_copied: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    comments_copied: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectClone {self.source_project_id} {self.status}>"
@@ -1,29 +1,84 @@
-from sqlalchemy import String, Text, ForeignKey, Integer, DateTime
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
-from backend.app.db.base import UUIDModel
-from app.models import Comment, Project, User
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import SoftDeleteMixin, UUIDModel, VersionMixin
+
+if TYPE_CHECKING:
+    from app.models.comment import Comment
+    from app.models.project import Project
+    from app.models.user import User
 
 
-class Task(UUIDModel):
+# Index predicate for live rows; queries say "is_deleted = false", which
+# the planner folds into the same expression
+LIVE = text("NOT is_deleted")
+
+
+class Task(UUIDModel, VersionMixin, SoftDeleteMixin):
     """Task model for individual work items."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Project filters and keyset walks over all of a project's tasks by id
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        # Live rows only, so tombstones don't bloat the hot indexes
+        Index(
+            "ix_tasks_project_id_position",
+            "project_id",
+            "position",
+            postgresql_where=LIVE,
+        ),
+        # Board columns: a project's tasks in one status, in board order
+        Index(
+            "ix_tasks_project_id_status_position",
+            "project_id",
+            "status",
+            "position",
+            postgresql_where=LIVE,
+        ),
+        # Newest-first listings and exports, with id as the tie-breaker
+        Index(
+            "ix_tasks_project_id_created_at_id",
+            "project_id",
+            "created_at",
+            "id",
+            postgresql_where=LIVE,
+        ),
+        # Covers the list validator (count and max(updated_at) per project)
+        # with an index-only scan
+        Index(
+            "ix_tasks_project_id_updated_at",
+            "project_id",
+            "updated_at",
+            postgresql_where=LIVE,
+        ),
+        # "My tasks": an assignee's tasks by status, soonest due first
+        Index(
+            "ix_tasks_assignee_id_status_due_date",
+            "assignee_id",
+            "status",
+            "due_date",
+            postgresql_where=LIVE,
+        ),
+        Index("ix_tasks_due_date", "due_date", postgresql_where=LIVE),
+        # Tombstone reads and the purge job
+        Index("ix_tasks_deleted_at", "deleted_at", postgresql_where=text("is_deleted")),
+        # Foreign key: deleting a user must not scan all tasks
+        Index("ix_tasks_creator_id", "creator_id"),
+    )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(
-        String(50), default="todo", nullable=False, index=True
-    )
-    priority: Mapped[str] = mapped_column(
-        String(50), default="medium", nullable=False, index=True
-    )
+    status: Mapped[str] = mapped_column(String(50), default="todo", nullable=False)
+    priority: Mapped[str] = mapped_column(String(50), default="medium", nullable=False)
     position: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     creator_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -31,11 +86,10 @@ class Task(UUIDModel):
     assignee_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
 
     due_date: Mapped[DateTime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True, index=True
+        DateTime(timezone=True), nullable=True
     )
 
     # Relationships
@@ -1,9 +1,16 @@
 # app/models/user.py
-from typing import Optional
-from sqlalchemy import String, Boolean
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import Boolean, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.app.db.base import UUIDModel
-from app.models import Comment, Notification, Project, ProjectMember, Task
+
+from app.db.base import UUIDModel
+
+if TYPE_CHECKING:
+    from app.models.comment import Comment
+    from app.models.notification import Notification
+    from app.models.project import Project, ProjectMember
+    from app.models.task import Task
 
 
 class User(UUIDModel):  # Now inherits from UUIDModel
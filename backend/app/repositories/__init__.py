@@ -13,9 +13,23 @@ Usage:
 """
 
 from app.repositories.base import BaseRepository
+from app.repositories.comment import CommentRepository
+from app.repositories.idempotency import IdempotencyRepository
+from app.repositories.notification import NotificationRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.project_clone import ProjectCloneRepository
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.repositories.task import TaskRepository
 from app.repositories.user import UserRepository
 
 __all__ = [
     "BaseRepository",
     "UserRepository",
+    "ProjectRepository",
+    "ProjectDeletionRepository",
+    "ProjectCloneRepository",
+    "TaskRepository",
+    "CommentRepository",
+    "NotificationRepository",
+    "IdempotencyRepository",
 ]
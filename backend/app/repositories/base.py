@@ -1,11 +1,39 @@
-from typing import Generic, TypeVar, List, Optional, Any, Dict
+import uuid
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import and_, select, delete, func
+from sqlalchemy import (
+    Executable,
+    RowMapping,
+    Select,
+    and_,
+    delete,
+    false,
+    func,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.db.base import UUIDModel
-
+from app.core.config import settings
+from app.core.counting import CountStrategy, Page, count_cache
+from app.db.base import SoftDeleteMixin, UUIDModel
+from app.db.explain import explain
 
 # Generic type for SQLAlchemy models
 ModelType = TypeVar("ModelType", bound=UUIDModel)
@@ -25,6 +53,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     - Pagination
     - Filtering
 
+    Listings choose how their total is counted (``get_page``, ``count_rows``
+    and ``app.core.counting``); writes drop the table's cached counts.
+
+    Models with ``SoftDeleteMixin`` are soft-deleted: reads skip rows with
+    ``is_deleted`` set, ``delete`` only flags the row, and ``purge_deleted``
+    removes flagged rows for good once they are old enough.
+
     Usage:
         class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             pass
@@ -38,19 +73,44 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy model class (e.g., User, Task)
         """
         self.model = model
+        self.soft_delete = issubclass(model, SoftDeleteMixin)
+
+    def live_clause(self):
+        """
+        Condition matching rows that aren't soft-deleted (always true otherwise).
+
+        Rendered as ``is_deleted = false``, which the planner folds into
+        ``NOT is_deleted`` and so matches the models' partial indexes.
+        """
+        if self.soft_delete:
+            return self.model.is_deleted == false()
+        return true()
+
+    def invalidate_counts(self) -> None:
+        """Drop cached counts of this table; call after writing to it."""
+        count_cache.invalidate(self.model.__tablename__)
 
-    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+    def _live(self, query: Select, include_deleted: bool = False) -> Select:
+        if self.soft_delete and not include_deleted:
+            query = query.where(self.live_clause())
+        return query
+
+    async def get(
+        self, db: AsyncSession, id: Any, *, include_deleted: bool = False
+    ) -> Optional[ModelType]:
         """
         Get a single record by ID.
 
         Args:
             db: Database session
             id: Record ID (UUID, int, etc.)
+            include_deleted: Also return a soft-deleted record
 
         Returns:
             Model instance or None if not found
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
+        query = self._live(select(self.model), include_deleted)
+        result = await db.execute(query.where(self.model.id == id))
         return result.scalar_one_or_none()
 
     async def get_multi(
@@ -84,9 +144,147 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 order_by="-created_at"
             )
         """
-        query = select(self.model)
+        query = self._apply_filters(self._live(select(self.model)), filters)
+        query = self._apply_ordering(query, order_by)
+
+        # Apply pagination
+        query = query.offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        scalar_result = result.scalars()
+        # Explicitly convert to list
+        items = scalar_result.all()
+        return list(items)
+
+    def projection(self, fields: Optional[Sequence[str]] = None) -> Select:
+        """
+        Core select of some of the model's columns.
+
+        Rows come back as plain tuples: no ORM objects are built and columns
+        that aren't asked for (large text, say) are never read.
+
+        Args:
+            fields: Column names, all columns if empty
+
+        Returns:
+            Select of the requested columns
+        """
+        columns = self.model.__table__.c
+        if not fields:
+            return select(*columns)
+        return select(*(columns[name] for name in fields))
+
+    async def get_multi_fields(
+        self,
+        db: AsyncSession,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+    ) -> List[RowMapping]:
+        """
+        Like ``get_multi``, but fetch only the given columns.
+
+        Args:
+            db: Database session
+            fields: Column names to select, all columns if empty
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+            filters: Dictionary of field: value filters
+            order_by: Field name to order by (prefix with '-' for DESC)
+
+        Returns:
+            List of row mappings with just the selected columns
+
+        Example:
+            rows = await repository.get_multi_fields(
+                db, fields=["id", "title", "status"], order_by="position"
+            )
+        """
+        query = self._apply_filters(self._live(self.projection(fields)), filters)
+        query = self._apply_ordering(query, order_by)
+        query = query.offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        return list(result.mappings().all())
+
+    async def get_fields(
+        self,
+        db: AsyncSession,
+        id: Any,
+        fields: Optional[Sequence[str]] = None,
+        *,
+        include_deleted: bool = False,
+    ) -> Optional[RowMapping]:
+        """
+        Get some columns of a single record by ID.
+
+        Args:
+            db: Database session
+            id: Record ID
+            fields: Column names to select, all columns if empty
+            include_deleted: Also return a soft-deleted record
+
+        Returns:
+            Row mapping or None if not found
+        """
+        query = self._live(self.projection(fields), include_deleted)
+        result = await db.execute(query.where(self.model.id == id))
+        return result.mappings().one_or_none()
+
+    async def get_updated_at(self, db: AsyncSession, id: Any) -> Optional[datetime]:
+        """
+        Last modification time of a record, for HTTP validators.
+
+        Args:
+            db: Database session
+            id: Record ID
+
+        Returns:
+            The record's updated_at or None if not found
+        """
+        result = await db.execute(
+            self._live(select(self.model.updated_at)).where(self.model.id == id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_collection_stats(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Count and newest ``updated_at`` of the records matching filters.
+
+        Together they change whenever a matching record is inserted, updated
+        or deleted, which makes them a cheap validator for collections.
+
+        Args:
+            db: Database session
+            filters: Dictionary of field: value filters
+
+        Returns:
+            (count, max updated_at)
+        """
+        query = self._apply_filters(
+            self._live(
+                select(func.count(), func.max(self.model.updated_at)).select_from(
+                    self.model
+                )
+            ),
+            filters,
+        )
+        result = await db.execute(query)
+        count, max_updated_at = result.one()
+        return count, max_updated_at
 
-        # Apply filters
+    def _apply_filters(
+        self, query: Select, filters: Optional[Dict[str, Any]]
+    ) -> Select:
+        """Add equality filters for known fields, skipping None values."""
         if filters:
             filter_clauses = []
             for field, value in filters.items():
@@ -94,8 +292,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     filter_clauses.append(getattr(self.model, field) == value)
             if filter_clauses:
                 query = query.where(and_(*filter_clauses))
+        return query
 
-        # Apply ordering
+    def _apply_ordering(self, query: Select, order_by: Optional[str]) -> Select:
+        """Order by a field name, prefixed with '-' for DESC."""
         if order_by:
             if order_by.startswith("-"):
                 # Descending order
@@ -106,21 +306,67 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 # Ascending order
                 if hasattr(self.model, order_by):
                     query = query.order_by(getattr(self.model, order_by))
+        return query
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+    async def stream(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over all matching records through a server-side cursor.
 
-        result = await db.execute(query)
-        scalar_result = result.scalars()
-        # Explicitly convert to list
-        items = scalar_result.all()
-        return list(items)
+        Only ``batch_size`` rows are buffered at a time, so memory stays flat
+        however many records match. Use instead of paging with ``get_multi``.
+
+        Args:
+            db: Database session
+            filters: Dictionary of field: value filters
+            order_by: Field name to order by (prefix with '-' for DESC)
+            batch_size: Rows fetched from the cursor per round trip
+
+        Example:
+            async for user in repository.stream(db, filters={"is_active": True}):
+                ...
+        """
+        query = self._apply_filters(self._live(select(self.model)), filters)
+        query = self._apply_ordering(query, order_by)
+        result = await db.stream_scalars(
+            query, execution_options={"yield_per": batch_size}
+        )
+        async for obj in result:
+            yield obj
+
+    async def stream_batches(
+        self, db: AsyncSession, query: Select, *, batch_size: int = 1000
+    ) -> AsyncIterator[List[RowMapping]]:
+        """
+        Run a column query through a server-side cursor, yielding row batches.
+
+        Column rows skip ORM object construction and identity map bookkeeping,
+        which matters for exports of millions of rows.
+
+        Args:
+            db: Database session
+            query: Core select of the columns to fetch
+            batch_size: Rows per yielded batch
+
+        Returns:
+            Async iterator of lists of row mappings
+        """
+        result = await db.stream(query, execution_options={"yield_per": batch_size})
+        async for batch in result.mappings().partitions():
+            yield batch
 
     async def get_count(
         self,
         db: AsyncSession,
         *,
         filters: Optional[Dict[str, Any]] = None,
+        strategy: CountStrategy = CountStrategy.EXACT,
     ) -> int:
         """
         Get count of records matching filters.
@@ -128,22 +374,116 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             db: Database session
             filters: Dictionary of field: value filters
+            strategy: Exact, cached or estimated (see ``count_rows``)
 
         Returns:
             Count of matching records
         """
-        query = select(func.count()).select_from(self.model)
+        query = self._apply_filters(self._live(select(self.model.id)), filters)
+        count, _ = await self.count_rows(db, query, strategy)
+        return count
 
-        if filters:
-            filter_clauses = []
-            for field, value in filters.items():
-                if hasattr(self.model, field) and value is not None:
-                    filter_clauses.append(getattr(self.model, field) == value)
-            if filter_clauses:
-                query = query.where(and_(*filter_clauses))
+    async def count_rows(
+        self, db: AsyncSession, query: Select, strategy: CountStrategy
+    ) -> Tuple[int, bool]:
+        """
+        Count the rows of a filtered select of this repository's model.
 
-        result = await db.execute(query)
-        return result.scalar_one()
+        Args:
+            db: Database session
+            query: The listing's select, without ordering or paging
+            strategy: ``exact`` runs ``count(*)``; ``cached`` reuses a recent
+                ``count(*)`` of the same query; ``estimated`` asks the planner
+                and counts exactly only when it expects few rows
+
+        Returns:
+            (count, whether it is an estimate)
+        """
+        if strategy is CountStrategy.HAS_MORE:
+            raise ValueError("The has_more strategy doesn't count rows")
+        query = query.order_by(None).limit(None).offset(None)
+
+        if strategy is CountStrategy.ESTIMATED:
+            estimate = await self._estimate_rows(db, query)
+            if estimate >= settings.COUNT_ESTIMATE_MIN:
+                return estimate, True
+            strategy = CountStrategy.EXACT
+
+        count_query = query.with_only_columns(func.count(), maintain_column_froms=True)
+        if strategy is CountStrategy.EXACT:
+            return (await db.execute(count_query)).scalar_one(), False
+
+        table = self.model.__tablename__
+        compiled = count_query.compile()
+        key = f"{compiled}:{sorted(compiled.params.items())}"
+        count = count_cache.get(table, key)
+        if count is None:
+            generation = count_cache.generation(table)
+            count = (await db.execute(count_query)).scalar_one()
+            count_cache.set(table, key, count, generation)
+        return count, False
+
+    async def _estimate_rows(self, db: AsyncSession, query: Select) -> int:
+        """
+        The planner's row estimate for a select.
+
+        Unfiltered: the table's ``reltuples`` from the last ANALYZE/VACUUM
+        (-1 or 0 if it never ran, so the caller falls back to counting).
+        Filtered: the top plan node's ``Plan Rows``.
+        """
+        if query.whereclause is None:
+            estimate = await db.scalar(
+                text(
+                    "SELECT CAST(reltuples AS bigint) FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": self.model.__tablename__},
+            )
+            return int(estimate or 0)
+        plan = await explain(db, query)
+        return int(plan["Plan"]["Plan Rows"])
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[ModelType]:
+        """
+        One page of records with a total counted by the given strategy.
+
+        With ``has_more`` no total is computed; ``limit + 1`` records are read
+        instead, and the extra one only tells whether another page follows.
+
+        Example:
+            page = await repository.get_page(
+                db, skip=40, limit=20, count=CountStrategy.CACHED
+            )
+            UserListResponse(items=page.items, total=page.total, ...)
+        """
+        query = self._apply_filters(self._live(select(self.model)), filters)
+        page_query = self._apply_ordering(query, order_by).offset(skip)
+
+        if count is CountStrategy.HAS_MORE:
+            result = await db.execute(page_query.limit(limit + 1))
+            items = list(result.scalars().all())
+            return Page(items[:limit], has_more=len(items) > limit)
+
+        result = await db.execute(page_query.limit(limit))
+        items = list(result.scalars().all())
+        total, estimated = await self.count_rows(
+            db, query.with_only_columns(self.model.id), count
+        )
+        return Page(
+            items,
+            total=total,
+            estimated=estimated,
+            has_more=None if estimated else skip + len(items) < total,
+        )
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -164,6 +504,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         await db.commit()
+        self.invalidate_counts()
         await db.refresh(db_obj)
         return db_obj
 
@@ -198,13 +539,69 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             update_data = obj_in.model_dump(exclude_unset=True)
 
         for field in obj_data:
-            if field in update_data:
+            if field in update_data and field != "version":
                 setattr(db_obj, field, update_data[field])
+        if hasattr(self.model, "version"):
+            # Versioned models: bump in SQL so concurrent bumps aren't lost
+            db_obj.version = self.model.version + 1
 
         await db.commit()
+        self.invalidate_counts()
         await db.refresh(db_obj)
         return db_obj
 
+    async def update_versioned(
+        self,
+        db: AsyncSession,
+        *,
+        id: Any,
+        values: Dict[str, Any],
+        versions: Optional[Sequence[int]] = None,
+        fields: Optional[Sequence[str]] = None,
+        where: Sequence[Any] = (),
+    ) -> Optional[RowMapping]:
+        """
+        Update a record in one statement and bump its version.
+
+        For models with ``VersionMixin``. With ``versions`` the row is only
+        changed if its current version is one of them, so a concurrent edit
+        is detected without locking the row (optimistic concurrency).
+
+        Args:
+            db: Database session
+            id: Record ID to update
+            values: Column values to set
+            versions: Versions the caller expects; None updates any version
+            fields: Columns to return, all columns if empty
+            where: Extra conditions, e.g. access checks
+
+        Returns:
+            The updated row, or None if no row matched (missing, filtered out
+            by ``where`` or at another version)
+
+        Example:
+            row = await repository.update_versioned(
+                db, id=task_id, values={"status": "done"}, versions=[3]
+            )
+        """
+        columns = self.model.__table__.c
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, self.live_clause(), *where)
+            .values(**values, version=self.model.version + 1)
+        )
+        if versions is not None:
+            stmt = stmt.where(self.model.version.in_(versions))
+        stmt = stmt.returning(
+            *(columns[name] for name in fields) if fields else columns
+        ).execution_options(synchronize_session=False)
+
+        result = await db.execute(stmt)
+        row = result.mappings().one_or_none()
+        await db.commit()
+        self.invalidate_counts()
+        return row
+
     async def update_by_id(
         self,
         db: AsyncSession,
@@ -229,10 +626,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return await self.update(db, db_obj=db_obj, obj_in=obj_in)
 
+    def _soft_delete_values(self) -> Dict[str, Any]:
+        values: Dict[str, Any] = {"is_deleted": True, "deleted_at": func.now()}
+        if hasattr(self.model, "version"):
+            values["version"] = self.model.version + 1
+        return values
+
     async def delete(self, db: AsyncSession, *, id: Any) -> bool:
         """
         Delete a record by ID.
 
+        Soft-deleted models only get ``is_deleted``/``deleted_at`` set, in one
+        UPDATE; use ``hard_delete`` to remove the row.
+
         Args:
             db: Database session
             id: Record ID to delete
@@ -243,12 +649,36 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Example:
             deleted_user = await repository.delete(db, id=user_id)
         """
-        entity = await self.get(db, id=id)
+        if self.soft_delete:
+            result = await db.execute(
+                update(self.model)
+                .where(self.model.id == id, self.live_clause())
+                .values(**self._soft_delete_values())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            self.invalidate_counts()
+            return result.rowcount > 0
+        return await self.hard_delete(db, id=id)
+
+    async def hard_delete(self, db: AsyncSession, *, id: Any) -> bool:
+        """
+        Remove a record by ID, even from a soft-deleting repository.
+
+        Args:
+            db: Database session
+            id: Record ID to delete
+
+        Returns:
+            True if a record was removed
+        """
+        entity = await self.get(db, id=id, include_deleted=True)
         if not entity:
             return False
 
         await db.delete(entity)
         await db.commit()
+        self.invalidate_counts()
         return True
 
     async def get_by_field(
@@ -270,7 +700,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         if hasattr(self.model, field):
             result = await db.execute(
-                select(self.model).where(getattr(self.model, field) == value)
+                self._live(select(self.model)).where(
+                    getattr(self.model, field) == value
+                )
             )
             return result.scalar_one_or_none()
         return None
@@ -286,7 +718,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             True if exists, False otherwise
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
+        result = await db.execute(
+            self._live(select(self.model.id)).where(self.model.id == id)
+        )
         return result.scalar_one_or_none() is not None
 
     async def exists_by_field(self, db: AsyncSession, field: str, value: Any) -> bool:
@@ -303,7 +737,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         if hasattr(self.model, field):
             result = await db.execute(
-                select(self.model).where(getattr(self.model, field) == value).limit(1)
+                self._live(select(self.model.id))
+                .where(getattr(self.model, field) == value)
+                .limit(1)
             )
             return result.scalar_one_or_none() is not None
         return False
@@ -329,6 +765,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         db.add_all(db_objects)
         await db.commit()
+        self.invalidate_counts()
 
         # Refresh all objects
         for db_obj in db_objects:
@@ -350,6 +787,17 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not ids:
             return 0
 
+        if self.soft_delete:
+            result = await db.execute(
+                update(self.model)
+                .where(self.model.id.in_(ids), self.live_clause())
+                .values(**self._soft_delete_values())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            self.invalidate_counts()
+            return result.rowcount
+
         # Get count before delete
         count_query = select(func.count()).where(self.model.id.in_(ids))
         count_result = await db.execute(count_query)
@@ -362,5 +810,111 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         stmt = delete(self.model).where(self.model.id.in_(ids))
         await db.execute(stmt)
         await db.commit()
+        self.invalidate_counts()
 
         return before_count
+
+    async def get_tombstones(
+        self,
+        db: AsyncSession,
+        *,
+        since: Optional[datetime] = None,
+        after_id: Optional[uuid.UUID] = None,
+        limit: int = 100,
+        fields: Sequence[str] = ("id", "deleted_at"),
+        where: Sequence[Any] = (),
+    ) -> List[RowMapping]:
+        """
+        Soft-deleted records in deletion order, for clients syncing deletes.
+
+        Pages are keyset-based: pass the last row's ``deleted_at`` and ``id``
+        as ``since`` and ``after_id`` to get the next page.
+
+        Args:
+            db: Database session
+            since: Only records deleted at or after this time
+            after_id: With ``since``, skip records deleted at ``since`` up to
+                and including this id
+            limit: Maximum number of records to return
+            fields: Columns to return
+            where: Extra conditions, e.g. access checks
+
+        Returns:
+            Row mappings ordered by ``deleted_at`` then ``id``
+        """
+        if not self.soft_delete:
+            return []
+        query = self.projection(fields).where(self.model.is_deleted == true(), *where)
+        if since is not None:
+            if after_id is not None:
+                query = query.where(
+                    tuple_(self.model.deleted_at, self.model.id) > (since, after_id)
+                )
+            else:
+                query = query.where(self.model.deleted_at >= since)
+        query = query.order_by(self.model.deleted_at, self.model.id).limit(limit)
+        result = await db.execute(query)
+        return list(result.mappings().all())
+
+    async def purge_deleted(
+        self,
+        db: AsyncSession,
+        *,
+        older_than: datetime,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Permanently remove records soft-deleted before ``older_than``.
+
+        Rows go in batches of ``batch_size``, one transaction each, so a large
+        backlog never holds locks on more than one batch.
+
+        Args:
+            db: Database session
+            older_than: Deletion time cut-off (tombstones newer than this stay)
+            batch_size: Records removed per transaction
+
+        Returns:
+            Number of records removed
+        """
+        if not self.soft_delete:
+            return 0
+        purged = 0
+        while True:
+            batch = (
+                select(self.model.id)
+                .where(
+                    self.model.is_deleted == true(),
+                    self.model.deleted_at < older_than,
+                )
+                .order_by(self.model.deleted_at)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                delete(self.model)
+                .where(self.model.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                return purged
+
+    def warmup_statements(self) -> List[Executable]:
+        """
+        Representative statements for this repository's hot paths.
+
+        Executed once per pooled connection during startup warm-up so the
+        compiled and prepared statements are cached before the first request.
+        Values are placeholders; only the statement shape matters.
+
+        Returns:
+            List of executable statements
+        """
+        placeholder_id = uuid.uuid4()
+        return [
+            self._live(select(self.model)).where(self.model.id == placeholder_id),
+            self._live(select(self.model)).offset(0).limit(1),
+            self._live(select(func.count()).select_from(self.model)),
+        ]
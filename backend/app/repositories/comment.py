@@ -0,0 +1,30 @@
+import uuid
+from typing import List
+
+from sqlalchemy import Select, false, select
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.repositories.base import BaseRepository
+from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+
+
+class CommentRepository(BaseRepository[Comment, CommentCreate, CommentUpdate]):
+    """Comment-specific repository"""
+
+    def __init__(self):
+        super().__init__(Comment)
+
+    def export_columns(self) -> List[str]:
+        """Columns written by comment exports, matching CommentResponse"""
+        return list(CommentResponse.model_fields)
+
+    def export_query(self, project_id: uuid.UUID) -> Select:
+        """Column query for streaming all comments on a project's tasks"""
+        columns = Comment.__table__.c
+        return (
+            select(*(columns[name] for name in self.export_columns()))
+            .join(Task, Task.id == Comment.task_id)
+            .where(Task.project_id == project_id, Task.is_deleted == false())
+            .order_by(Comment.created_at, Comment.id)
+        )
@@ -0,0 +1,108 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import RowMapping, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.idempotency import IdempotencyKey
+from app.repositories.base import BaseRepository
+
+
+class IdempotencyRepository(BaseRepository[IdempotencyKey, BaseModel, BaseModel]):
+    """Stored Idempotency-Key responses (the fallback when Redis is down)"""
+
+    def __init__(self):
+        super().__init__(IdempotencyKey)
+
+    async def reserve(
+        self,
+        db: AsyncSession,
+        *,
+        key: str,
+        fingerprint: str,
+        lock_until: datetime,
+    ) -> bool:
+        """
+        Claim a key for a request about to run.
+
+        Succeeds if the key is new or its row has expired (a finished replay
+        window or an abandoned in-flight lock), in one INSERT ... ON CONFLICT.
+
+        Returns:
+            True if this caller now owns the key
+        """
+        stmt = pg_insert(IdempotencyKey).values(
+            id=uuid.uuid4(), key=key, fingerprint=fingerprint, expires_at=lock_until
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={
+                "fingerprint": fingerprint,
+                "status_code": None,
+                "headers": None,
+                "body": None,
+                "expires_at": lock_until,
+            },
+            where=IdempotencyKey.expires_at < func.now(),
+        ).returning(IdempotencyKey.id)
+        result = await db.execute(stmt)
+        reserved = result.scalar_one_or_none() is not None
+        await db.commit()
+        return reserved
+
+    async def get_by_key(self, db: AsyncSession, key: str) -> Optional[RowMapping]:
+        """Unexpired stored response or in-flight lock for a key"""
+        result = await db.execute(
+            select(
+                IdempotencyKey.fingerprint,
+                IdempotencyKey.status_code,
+                IdempotencyKey.headers,
+                IdempotencyKey.body,
+            )
+            .where(IdempotencyKey.key == key)
+            .where(IdempotencyKey.expires_at >= func.now())
+        )
+        return result.mappings().one_or_none()
+
+    async def complete(
+        self,
+        db: AsyncSession,
+        *,
+        key: str,
+        status_code: int,
+        headers: List[List[str]],
+        body: bytes,
+        expires_at: datetime,
+    ) -> None:
+        """Store the response of the request holding the key"""
+        await db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(
+                status_code=status_code,
+                headers=headers,
+                body=body,
+                expires_at=expires_at,
+            )
+        )
+        await db.commit()
+
+    async def release(self, db: AsyncSession, key: str) -> None:
+        """Drop an in-flight lock so a retry can run the request again"""
+        await db.execute(
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .where(IdempotencyKey.status_code.is_(None))
+        )
+        await db.commit()
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        """Delete expired rows; returns the number deleted"""
+        result = await db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at < func.now())
+        )
+        await db.commit()
+        return result.rowcount
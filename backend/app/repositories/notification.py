@@ -0,0 +1,26 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Notification
+from app.repositories.base import BaseRepository
+from app.schemas.notification import NotificationCreate, NotificationUpdate
+
+
+class NotificationRepository(
+    BaseRepository[Notification, NotificationCreate, NotificationUpdate]
+):
+    """Notification-specific repository"""
+
+    def __init__(self):
+        super().__init__(Notification)
+
+    async def create_many(self, db: AsyncSession, *, rows: List[Dict[str, Any]]) -> int:
+        """Insert many notifications in one batched INSERT, without refreshing"""
+        if not rows:
+            return 0
+        await db.execute(insert(Notification), rows)
+        await db.commit()
+        self.invalidate_counts()
+        return len(rows)
@@ -0,0 +1,164 @@
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import Executable, Select, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.permissions import membership_cache
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.repositories.base import BaseRepository
+from app.schemas.project import ProjectCreate, ProjectMemberResponse, ProjectUpdate
+
+
+class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
+    """Project-specific repository with membership queries"""
+
+    def __init__(self):
+        super().__init__(Project)
+
+    async def get_member_user_ids(
+        self, db: AsyncSession, project_id: uuid.UUID
+    ) -> List[uuid.UUID]:
+        """The owner and members of a project"""
+        result = await db.execute(
+            select(Project.owner_id)
+            .where(Project.id == project_id)
+            .union(
+                select(ProjectMember.user_id).where(
+                    ProjectMember.project_id == project_id
+                )
+            )
+        )
+        return list(result.scalars())
+
+    def member_roles_query(self, user_id: uuid.UUID) -> Select:
+        """(project id, role) rows for the projects a user owns or belongs to"""
+        owned = select(Project.id, literal("owner").label("role")).where(
+            Project.owner_id == user_id, self.live_clause()
+        )
+        memberships = (
+            select(ProjectMember.project_id, ProjectMember.role)
+            .join(Project, Project.id == ProjectMember.project_id)
+            .where(ProjectMember.user_id == user_id, self.live_clause())
+        )
+        return owned.union_all(memberships)
+
+    async def load_member_roles(
+        self, db: AsyncSession, user_id: uuid.UUID
+    ) -> Dict[uuid.UUID, str]:
+        """All of a user's project roles in one query (uncached)"""
+        result = await db.execute(self.member_roles_query(user_id))
+        roles: Dict[uuid.UUID, str] = {}
+        for project_id, role in result.all():
+            # Ownership wins over a membership row for the same project
+            if roles.get(project_id) != "owner":
+                roles[project_id] = role
+        return roles
+
+    async def get_member_roles(
+        self, db: AsyncSession, user_id: uuid.UUID
+    ) -> Dict[uuid.UUID, str]:
+        """The user's roles by project id, served from the membership cache"""
+        return await membership_cache.get_roles(db, user_id, self.load_member_roles)
+
+    async def get_member_role(
+        self, db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID
+    ) -> Optional[str]:
+        """The user's role in a project: "owner", the member role or None"""
+        return (await self.get_member_roles(db, user_id)).get(project_id)
+
+    async def is_member(
+        self, db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID
+    ) -> bool:
+        """Check whether a user owns or is a member of a project"""
+        return await self.get_member_role(db, project_id, user_id) is not None
+
+    async def check_projects(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        project_ids: Iterable[uuid.UUID],
+        roles: Optional[Sequence[str]] = None,
+    ) -> Set[uuid.UUID]:
+        """
+        Which of the projects the user may access, checked in one go.
+
+        With ``roles``, only projects where the user has one of them count.
+        """
+        member_roles = await self.get_member_roles(db, user_id)
+        return {
+            project_id
+            for project_id in project_ids
+            if project_id in member_roles
+            and (roles is None or member_roles[project_id] in roles)
+        }
+
+    async def add_member(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        user_id: uuid.UUID,
+        role: str = "member",
+    ) -> ProjectMember:
+        """Add a user to a project, or change their role if already a member"""
+        stmt = (
+            insert(ProjectMember)
+            .values(id=uuid.uuid4(), project_id=project_id, user_id=user_id, role=role)
+            .on_conflict_do_update(
+                index_elements=[ProjectMember.project_id, ProjectMember.user_id],
+                set_={"role": role},
+            )
+            .returning(ProjectMember)
+        )
+        result = await db.execute(stmt)
+        member = result.scalar_one()
+        await db.commit()
+        await membership_cache.invalidate(user_id)
+        return member
+
+    async def remove_member(
+        self, db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID
+    ) -> bool:
+        """Remove a user from a project; False if they weren't a member"""
+        result = await db.execute(
+            delete(ProjectMember)
+            .where(ProjectMember.project_id == project_id)
+            .where(ProjectMember.user_id == user_id)
+        )
+        await db.commit()
+        await membership_cache.invalidate(user_id)
+        return result.rowcount > 0
+
+    def member_export_columns(self) -> List[str]:
+        """Columns written by member exports: the membership plus the user"""
+        return list(ProjectMemberResponse.model_fields) + ["email", "full_name"]
+
+    def member_export_query(self, project_id: uuid.UUID) -> Select:
+        """Column query for streaming a project's members with their user"""
+        columns = ProjectMember.__table__.c
+        return (
+            select(
+                *(columns[name] for name in ProjectMemberResponse.model_fields),
+                User.email,
+                User.full_name,
+            )
+            .join(User, User.id == ProjectMember.user_id)
+            .where(ProjectMember.project_id == project_id)
+            .order_by(ProjectMember.joined_at, ProjectMember.id)
+        )
+
+    def warmup_statements(self) -> List[Executable]:
+        """Add the membership lookups behind every permission check"""
+        placeholder_id = uuid.uuid4()
+        return super().warmup_statements() + [
+            self.member_roles_query(placeholder_id),
+            select(Project.owner_id)
+            .where(Project.id == placeholder_id)
+            .union(
+                select(ProjectMember.user_id).where(
+                    ProjectMember.project_id == placeholder_id
+                )
+            ),
+        ]
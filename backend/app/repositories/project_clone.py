@@ -0,0 +1,275 @@
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from pydantic import BaseModel
+from sqlalchemy import false, func, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.counting import count_cache
+from app.models.comment import Comment
+from app.models.project import Project, ProjectClone, ProjectMember
+from app.models.task import Task
+from app.repositories.base import BaseRepository
+
+# Old task id -> new task id, for pointing copied comments at copied tasks
+CLONE_TASK_MAP_TABLE = "project_clone_task_map"
+
+# Called after each step of a copy with the step name and the rows copied
+ProgressCallback = Callable[[str, Dict[str, int]], Awaitable[None]]
+
+
+class ProjectCloneRepository(BaseRepository[ProjectClone, BaseModel, BaseModel]):
+    """Clone requests and the server-side copy of a project's rows"""
+
+    def __init__(self):
+        super().__init__(ProjectClone)
+
+    async def count_source_tasks(self, db: AsyncSession, project_id: uuid.UUID) -> int:
+        """Live tasks a clone of the project would copy"""
+        return await db.scalar(
+            select(func.count())
+            .select_from(Task)
+            .where(Task.project_id == project_id, Task.is_deleted == false())
+        )
+
+    async def create_clone(
+        self,
+        db: AsyncSession,
+        *,
+        source_project_id: uuid.UUID,
+        requested_by: uuid.UUID,
+        name: str,
+        description: Optional[str],
+        include_members: bool,
+        include_tasks: bool,
+        include_comments: bool,
+        tasks_total: int,
+    ) -> ProjectClone:
+        clone = ProjectClone(
+            source_project_id=source_project_id,
+            requested_by=requested_by,
+            name=name,
+            description=description,
+            include_members=include_members,
+            include_tasks=include_tasks,
+            include_comments=include_comments,
+            tasks_total=tasks_total,
+        )
+        db.add(clone)
+        await db.commit()
+        await db.refresh(clone)
+        return clone
+
+    async def claim(
+        self, db: AsyncSession, clone_id: uuid.UUID, stale_before: datetime
+    ) -> Optional[ProjectClone]:
+        """
+        Mark a clone running, unless another worker is already on it.
+
+        A running clone without progress since ``stale_before`` is taken over;
+        its worker died and the copy, being one transaction, was rolled back.
+        """
+        result = await db.execute(
+            update(ProjectClone)
+            .where(
+                ProjectClone.id == clone_id,
+                or_(
+                    ProjectClone.status == "pending",
+                    (ProjectClone.status == "running")
+                    & (ProjectClone.updated_at < stale_before),
+                ),
+            )
+            .values(status="running", step=None, error=None)
+            .returning(ProjectClone)
+        )
+        clone = result.scalar_one_or_none()
+        await db.commit()
+        return clone
+
+    async def record_progress(
+        self, db: AsyncSession, clone_id: uuid.UUID, step: str, **counts: int
+    ) -> None:
+        """Store the step reached; run on a session other than the copy's"""
+        await db.execute(
+            update(ProjectClone)
+            .where(ProjectClone.id == clone_id)
+            .values(step=step, **counts)
+        )
+        await db.commit()
+
+    async def lock(self, db: AsyncSession, clone_id: uuid.UUID) -> bool:
+        """
+        Take a transaction-scoped advisory lock on the clone, or return False
+        if another worker's copy holds it.
+
+        Call at the start of the copy's transaction. The lock goes away with
+        the transaction or the connection, so a copy taken over after its
+        worker went quiet can never run twice at once.
+        """
+        return await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(hashtextextended(:key, 0))"),
+            {"key": f"project_clone:{clone_id}"},
+        )
+
+    async def copy_project(
+        self,
+        db: AsyncSession,
+        clone: ProjectClone,
+        *,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Optional[Set[uuid.UUID]]:
+        """
+        Copy the source project, and its members, tasks and comments as the
+        clone asks, with ``INSERT ... SELECT`` in one transaction.
+
+        No row is loaded into Python. New task ids are drawn up front into a
+        temporary map table, so copied comments are re-pointed with a join.
+        Deleted tasks are not copied; copied tasks are created by the
+        requester and keep their assignee only when members are copied.
+        Comments keep their authors and timestamps, so threads read the same.
+
+        Marks the clone done in the same transaction, so the copy appears
+        all at once or not at all.
+
+        Returns:
+            Users given access to the new project (for cache invalidation),
+            or None if the source project is missing or deleted
+        """
+        project_id = uuid.uuid4()
+        params = {
+            "source_id": clone.source_project_id,
+            "project_id": project_id,
+            "user_id": clone.requested_by,
+        }
+
+        result = await db.execute(
+            text("""
+                INSERT INTO projects (id, name, description, status, owner_id)
+                SELECT CAST(:project_id AS uuid), :name, :description, status,
+                       CAST(:user_id AS uuid)
+                FROM projects WHERE id = :source_id AND NOT is_deleted
+                """),
+            {**params, "name": clone.name, "description": clone.description},
+        )
+        if result.rowcount == 0:
+            await db.rollback()
+            return None
+        user_ids = {clone.requested_by}
+        counts = {"members_copied": 0, "tasks_copied": 0, "comments_copied": 0}
+        if progress is not None:
+            await progress("project", counts)
+
+        if clone.include_members:
+            # The source owner joins as an admin; nobody else becomes owner
+            result = await db.execute(
+                text("""
+                    INSERT INTO project_members (id, project_id, user_id, role)
+                    SELECT gen_random_uuid(), CAST(:project_id AS uuid), user_id,
+                           CASE WHEN role = 'owner' THEN 'admin' ELSE role END
+                    FROM project_members
+                    WHERE project_id = :source_id AND user_id <> :user_id
+                    UNION ALL
+                    SELECT gen_random_uuid(), CAST(:project_id AS uuid),
+                           owner_id, 'admin'
+                    FROM projects WHERE id = :source_id AND owner_id <> :user_id
+                    ON CONFLICT (project_id, user_id) DO NOTHING
+                    RETURNING user_id
+                    """),
+                params,
+            )
+            user_ids.update(result.scalars())
+            counts["members_copied"] = len(user_ids) - 1
+            if progress is not None:
+                await progress("members", counts)
+
+        if clone.include_tasks:
+            await db.execute(
+                text(f"""
+                    CREATE TEMP TABLE {CLONE_TASK_MAP_TABLE} (
+                        old_id uuid PRIMARY KEY,
+                        new_id uuid NOT NULL
+                    ) ON COMMIT DROP
+                    """),
+            )
+            await db.execute(
+                text(f"""
+                    INSERT INTO {CLONE_TASK_MAP_TABLE} (old_id, new_id)
+                    SELECT id, gen_random_uuid() FROM tasks
+                    WHERE project_id = :source_id AND NOT is_deleted
+                    """),
+                params,
+            )
+            result = await db.execute(
+                text(f"""
+                    INSERT INTO tasks (id, title, description, status, priority,
+                                       position, due_date, project_id,
+                                       creator_id, assignee_id)
+                    SELECT m.new_id, t.title, t.description, t.status,
+                           t.priority, t.position, t.due_date,
+                           CAST(:project_id AS uuid), CAST(:user_id AS uuid),
+                           CASE WHEN CAST(:include_members AS boolean)
+                                THEN t.assignee_id END
+                    FROM {CLONE_TASK_MAP_TABLE} m
+                    JOIN tasks t ON t.id = m.old_id
+                    """),
+                {**params, "include_members": clone.include_members},
+            )
+            counts["tasks_copied"] = result.rowcount
+            if progress is not None:
+                await progress("tasks", counts)
+
+            if clone.include_comments:
+                result = await db.execute(
+                    text(f"""
+                        INSERT INTO comments (id, content, task_id, user_id,
+                                              created_at, updated_at)
+                        SELECT gen_random_uuid(), c.content, m.new_id,
+                               c.user_id, c.created_at, c.updated_at
+                        FROM {CLONE_TASK_MAP_TABLE} m
+                        JOIN comments c ON c.task_id = m.old_id
+                        """),
+                )
+                counts["comments_copied"] = result.rowcount
+                if progress is not None:
+                    await progress("comments", counts)
+
+        await db.execute(
+            update(ProjectClone)
+            .where(ProjectClone.id == clone.id)
+            .values(
+                status="done",
+                step=None,
+                project_id=project_id,
+                finished_at=func.now(),
+                **counts,
+            )
+        )
+        await db.commit()
+        count_cache.invalidate(
+            Project.__tablename__,
+            ProjectMember.__tablename__,
+            Task.__tablename__,
+            Comment.__tablename__,
+        )
+        return user_ids
+
+    async def fail(self, db: AsyncSession, clone_id: uuid.UUID, error: str) -> None:
+        await db.execute(
+            update(ProjectClone)
+            .where(ProjectClone.id == clone_id)
+            .values(status="failed", error=error[:2000])
+        )
+        await db.commit()
+
+    async def get_unfinished_ids(
+        self, db: AsyncSession, stale_before: datetime
+    ) -> List[uuid.UUID]:
+        """Clones to (re)start: pending or stuck since ``stale_before``"""
+        result = await db.execute(
+            select(ProjectClone.id)
+            .where(ProjectClone.status.in_(("pending", "running")))
+            .where(ProjectClone.updated_at < stale_before)
+            .order_by(ProjectClone.created_at)
+        )
+        return list(result.scalars())
@@ -0,0 +1,206 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import delete, false, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.counting import count_cache
+from app.models.comment import Comment
+from app.models.notification import Notification
+from app.models.project import Project, ProjectDeletion, ProjectMember
+from app.models.task import Task
+from app.repositories.base import BaseRepository
+
+# Statuses of a deletion that still has work to do
+UNFINISHED_STATUSES = ("pending", "running", "failed")
+
+
+class ProjectDeletionRepository(BaseRepository[ProjectDeletion, BaseModel, BaseModel]):
+    """Soft-deleted projects and the batched removal of their contents"""
+
+    def __init__(self):
+        super().__init__(ProjectDeletion)
+
+    async def mark_project_deleted(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: uuid.UUID,
+        requested_by: Optional[uuid.UUID],
+    ) -> Optional[ProjectDeletion]:
+        """
+        Flag a project deleted and record a pending deletion, in one transaction.
+
+        Touches one project row and one deletion row, however big the project.
+
+        Returns:
+            The deletion, or None if the project is missing or already deleted
+        """
+        result = await db.execute(
+            update(Project)
+            .where(Project.id == project_id, Project.is_deleted == false())
+            .values(is_deleted=True, deleted_at=func.now(), version=Project.version + 1)
+            .returning(Project.id)
+        )
+        if result.scalar_one_or_none() is None:
+            await db.rollback()
+            return None
+
+        tasks_total = await db.scalar(
+            select(func.count()).select_from(Task).where(Task.project_id == project_id)
+        )
+        values = {
+            "status": "pending",
+            "requested_by": requested_by,
+            "tasks_total": tasks_total,
+            "tasks_deleted": 0,
+            "comments_deleted": 0,
+            "notifications_deleted": 0,
+            "last_task_id": None,
+            "error": None,
+            "finished_at": None,
+        }
+        stmt = pg_insert(ProjectDeletion).values(
+            id=uuid.uuid4(), project_id=project_id, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectDeletion.project_id], set_=values
+        ).returning(ProjectDeletion)
+        deletion = (await db.execute(stmt)).scalar_one()
+        await db.commit()
+        count_cache.invalidate(Project.__tablename__)
+        return deletion
+
+    async def get_by_project(
+        self, db: AsyncSession, project_id: uuid.UUID
+    ) -> Optional[ProjectDeletion]:
+        result = await db.execute(
+            select(ProjectDeletion).where(ProjectDeletion.project_id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim(
+        self, db: AsyncSession, project_id: uuid.UUID, stale_before: datetime
+    ) -> Optional[ProjectDeletion]:
+        """
+        Mark a deletion running, unless another worker is already on it.
+
+        A running deletion without progress since ``stale_before`` is taken
+        over (its worker died); it resumes after ``last_task_id``.
+        """
+        result = await db.execute(
+            update(ProjectDeletion)
+            .where(
+                ProjectDeletion.project_id == project_id,
+                or_(
+                    ProjectDeletion.status.in_(("pending", "failed")),
+                    (ProjectDeletion.status == "running")
+                    & (ProjectDeletion.updated_at < stale_before),
+                ),
+            )
+            .values(status="running", error=None)
+            .returning(ProjectDeletion)
+        )
+        deletion = result.scalar_one_or_none()
+        await db.commit()
+        return deletion
+
+    async def delete_task_batch(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: uuid.UUID,
+        after: Optional[uuid.UUID],
+        batch_size: int,
+    ) -> Tuple[int, Optional[uuid.UUID]]:
+        """
+        Delete the next ``batch_size`` tasks by id, with their comments and
+        notifications, and record the progress; one short transaction.
+
+        Walks ``ix_tasks_project_id_id`` from ``after`` (keyset), so each
+        batch costs the same however many tasks went before it.
+
+        Returns:
+            (tasks deleted, last task id), (0, after) when none are left
+        """
+        query = select(Task.id).where(Task.project_id == project_id)
+        if after is not None:
+            query = query.where(Task.id > after)
+        task_ids = list(
+            (await db.execute(query.order_by(Task.id).limit(batch_size))).scalars()
+        )
+        if not task_ids:
+            return 0, after
+
+        comments = await db.execute(
+            delete(Comment).where(Comment.task_id.in_(task_ids))
+        )
+        notifications = await db.execute(
+            delete(Notification).where(
+                Notification.link.in_([f"/tasks/{task_id}" for task_id in task_ids])
+            )
+        )
+        tasks = await db.execute(delete(Task).where(Task.id.in_(task_ids)))
+        await db.execute(
+            update(ProjectDeletion)
+            .where(ProjectDeletion.project_id == project_id)
+            .values(
+                tasks_deleted=ProjectDeletion.tasks_deleted + tasks.rowcount,
+                comments_deleted=ProjectDeletion.comments_deleted + comments.rowcount,
+                notifications_deleted=(
+                    ProjectDeletion.notifications_deleted + notifications.rowcount
+                ),
+                last_task_id=task_ids[-1],
+            )
+        )
+        await db.commit()
+        count_cache.invalidate(
+            Task.__tablename__, Comment.__tablename__, Notification.__tablename__
+        )
+        return tasks.rowcount, task_ids[-1]
+
+    async def finish(self, db: AsyncSession, project_id: uuid.UUID) -> None:
+        """Remove the emptied project itself and mark the deletion done"""
+        notifications = await db.execute(
+            delete(Notification).where(Notification.link == f"/projects/{project_id}")
+        )
+        await db.execute(
+            delete(ProjectMember).where(ProjectMember.project_id == project_id)
+        )
+        await db.execute(delete(Project).where(Project.id == project_id))
+        await db.execute(
+            update(ProjectDeletion)
+            .where(ProjectDeletion.project_id == project_id)
+            .values(
+                status="done",
+                notifications_deleted=(
+                    ProjectDeletion.notifications_deleted + notifications.rowcount
+                ),
+                finished_at=func.now(),
+            )
+        )
+        await db.commit()
+        count_cache.invalidate(Notification.__tablename__)
+
+    async def fail(self, db: AsyncSession, project_id: uuid.UUID, error: str) -> None:
+        await db.execute(
+            update(ProjectDeletion)
+            .where(ProjectDeletion.project_id == project_id)
+            .values(status="failed", error=error[:2000])
+        )
+        await db.commit()
+
+    async def get_unfinished_project_ids(
+        self, db: AsyncSession, stale_before: datetime
+    ) -> List[uuid.UUID]:
+        """Deletions to (re)start: pending, failed or stuck since ``stale_before``"""
+        result = await db.execute(
+            select(ProjectDeletion.project_id)
+            .where(ProjectDeletion.status.in_(UNFINISHED_STATUSES))
+            .where(ProjectDeletion.updated_at < stale_before)
+            .order_by(ProjectDeletion.created_at)
+        )
+        return list(result.scalars())
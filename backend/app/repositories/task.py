@@ -0,0 +1,297 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    RowMapping,
+    Select,
+    column,
+    func,
+    insert,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.repositories.base import BaseRepository
+from app.schemas.task import TaskCreate, TaskFilters, TaskResponse, TaskUpdate
+
+# Projects a query is limited to: ids, or a subquery producing them
+ProjectIds = Union[Select, Sequence[uuid.UUID]]
+
+# Bulk imports are COPYed here first, then merged into tasks in one statement
+IMPORT_STAGING_TABLE = "task_import_staging"
+IMPORT_STAGING_COLUMNS = [
+    "row_number",
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "project_id",
+    "creator_id",
+    "assignee_id",
+]
+
+
+class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
+    """Task-specific repository"""
+
+    def __init__(self):
+        super().__init__(Task)
+
+    def export_columns(self) -> List[str]:
+        """Columns written by task exports, matching TaskResponse"""
+        return list(TaskResponse.model_fields)
+
+    def export_query(self, project_id: uuid.UUID) -> Select:
+        """Column query for streaming all tasks of a project"""
+        columns = Task.__table__.c
+        return (
+            select(*(columns[name] for name in self.export_columns()))
+            .where(Task.project_id == project_id, self.live_clause())
+            .order_by(Task.created_at, Task.id)
+        )
+
+    def filter_clauses(self, filters: TaskFilters) -> List[ColumnElement[bool]]:
+        """WHERE clauses for a TaskFilters predicate"""
+        clauses = []
+        for field in ("status", "priority", "assignee_id", "project_id"):
+            value = getattr(filters, field)
+            if value is not None:
+                clauses.append(getattr(Task, field) == value)
+        if filters.search:
+            clauses.append(Task.title.ilike(f"%{filters.search}%"))
+        return clauses
+
+    def list_clauses(
+        self,
+        filters: Optional[TaskFilters],
+        project_ids: Optional[ProjectIds],
+        task_ids: Optional[Sequence[uuid.UUID]] = None,
+    ) -> List[ColumnElement[bool]]:
+        """WHERE clauses for listing live tasks, limited to some projects"""
+        clauses = [self.live_clause()]
+        if filters is not None:
+            clauses.extend(self.filter_clauses(filters))
+        if task_ids is not None:
+            clauses.append(Task.id.in_(task_ids))
+        if project_ids is not None:
+            clauses.append(Task.project_id.in_(project_ids))
+        return clauses
+
+    async def get_collection_stats_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[TaskFilters] = None,
+        project_ids: Optional[ProjectIds] = None,
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Count and newest ``updated_at`` of the tasks a listing would cover.
+
+        Args:
+            db: Database session
+            filters: Task predicate
+            project_ids: Project ids (or subquery) the caller may see
+
+        Returns:
+            (count, max updated_at)
+        """
+        result = await db.execute(
+            select(func.count(), func.max(Task.updated_at)).where(
+                *self.list_clauses(filters, project_ids)
+            )
+        )
+        count, max_updated_at = result.one()
+        return count, max_updated_at
+
+    async def get_multi_fields_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[TaskFilters] = None,
+        project_ids: Optional[ProjectIds] = None,
+        task_ids: Optional[Sequence[uuid.UUID]] = None,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str = "-created_at",
+    ) -> List[RowMapping]:
+        """
+        List tasks as row mappings with only the requested columns.
+
+        Args:
+            db: Database session
+            fields: Columns to select, all TaskResponse columns if empty
+            filters: Task predicate
+            project_ids: Project ids (or subquery) the caller may see
+            task_ids: Only these tasks
+            skip: Number of tasks to skip
+            limit: Maximum number of tasks to return
+            order_by: Field name to order by (prefix with '-' for DESC)
+
+        Returns:
+            List of row mappings
+        """
+        query = self.projection(fields or list(TaskResponse.model_fields))
+        query = query.where(*self.list_clauses(filters, project_ids, task_ids))
+        # id breaks ties so pages don't overlap
+        query = self._apply_ordering(query, order_by).order_by(Task.id)
+        query = query.offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        return list(result.mappings().all())
+
+    def warmup_statements(self) -> List[Executable]:
+        """Add the task list page and its count/validator query"""
+        clauses = self.list_clauses(TaskFilters(), [uuid.uuid4()])
+        return super().warmup_statements() + [
+            self._apply_ordering(
+                self.projection(list(TaskResponse.model_fields)).where(*clauses),
+                "-created_at",
+            )
+            .order_by(Task.id)
+            .offset(0)
+            .limit(100),
+            select(func.count(), func.max(Task.updated_at)).where(*clauses),
+        ]
+
+    async def bulk_update(
+        self,
+        db: AsyncSession,
+        *,
+        values: Dict[str, Any],
+        task_ids: Optional[Sequence[uuid.UUID]] = None,
+        filters: Optional[TaskFilters] = None,
+        project_ids: Optional[ProjectIds] = None,
+        max_rows: Optional[int] = None,
+    ) -> Optional[List[RowMapping]]:
+        """
+        Update many tasks with a single UPDATE ... RETURNING.
+
+        Args:
+            db: Database session
+            values: Column values to set on every matched task
+            task_ids: Select tasks by id
+            filters: Select tasks by predicate
+            project_ids: Project ids (or subquery) the caller may modify;
+                tasks outside it are left untouched
+            max_rows: Most tasks the update may change. At most one more row
+                is locked and updated to detect an overflow, which is then
+                rolled back
+
+        Returns:
+            The updated tasks as row mappings with TaskResponse columns, or
+            None if more than ``max_rows`` tasks matched and nothing changed
+        """
+        columns = Task.__table__.c
+        clauses = self.list_clauses(filters, project_ids, task_ids)
+        if max_rows is not None:
+            matched = (
+                select(Task.id).where(*clauses).limit(max_rows + 1).with_for_update()
+            )
+            clauses = [Task.id.in_(matched.scalar_subquery())]
+        stmt = (
+            update(Task)
+            .where(*clauses)
+            .values(**values, version=Task.version + 1)
+            .returning(*(columns[name] for name in TaskResponse.model_fields))
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await db.execute(stmt)
+        rows = result.mappings().all()
+        if max_rows is not None and len(rows) > max_rows:
+            await db.rollback()
+            return None
+        await db.commit()
+        self.invalidate_counts()
+        return list(rows)
+
+    async def create_import_staging(self, db: AsyncSession) -> None:
+        """Create the transaction-scoped staging table for a bulk import"""
+        await db.execute(
+            text(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {IMPORT_STAGING_TABLE} (
+                    row_number integer NOT NULL,
+                    id uuid NOT NULL,
+                    title varchar(500) NOT NULL,
+                    description text,
+                    status varchar(50) NOT NULL,
+                    priority varchar(50) NOT NULL,
+                    due_date timestamptz,
+                    project_id uuid NOT NULL,
+                    creator_id uuid NOT NULL,
+                    assignee_id uuid
+                ) ON COMMIT DROP
+                """),
+        )
+
+    async def copy_to_import_staging(
+        self, db: AsyncSession, records: Sequence[tuple]
+    ) -> None:
+        """
+        Load validated rows into the staging table.
+
+        Uses COPY when the driver is asyncpg and a multi-row INSERT otherwise.
+        Records are tuples in IMPORT_STAGING_COLUMNS order.
+        """
+        if not records:
+            return
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if hasattr(driver_connection, "copy_records_to_table"):
+            await driver_connection.copy_records_to_table(
+                IMPORT_STAGING_TABLE,
+                records=records,
+                columns=IMPORT_STAGING_COLUMNS,
+            )
+            return
+
+        staging = table(
+            IMPORT_STAGING_TABLE, *(column(name) for name in IMPORT_STAGING_COLUMNS)
+        )
+        await db.execute(
+            insert(staging),
+            [dict(zip(IMPORT_STAGING_COLUMNS, record)) for record in records],
+        )
+
+    async def merge_import_staging(
+        self, db: AsyncSession, project_id: uuid.UUID
+    ) -> int:
+        """
+        Move staged rows into tasks and empty the staging table.
+
+        Imported tasks are appended after the project's current last position,
+        in file order.
+
+        Returns:
+            Number of tasks inserted
+        """
+        result = await db.execute(
+            text(f"""
+                WITH base AS (
+                    SELECT COALESCE(MAX(position), -1) AS position
+                    FROM tasks WHERE project_id = :project_id
+                )
+                INSERT INTO tasks (id, title, description, status, priority,
+                                   position, due_date, project_id, creator_id,
+                                   assignee_id)
+                SELECT s.id, s.title, s.description, s.status, s.priority,
+                       base.position + ROW_NUMBER() OVER (ORDER BY s.row_number),
+                       s.due_date, s.project_id, s.creator_id, s.assignee_id
+                FROM {IMPORT_STAGING_TABLE} s CROSS JOIN base
+                """),
+            {"project_id": project_id},
+        )
+        await db.execute(text(f"TRUNCATE {IMPORT_STAGING_TABLE}"))
+        self.invalidate_counts()
+        return result.rowcount
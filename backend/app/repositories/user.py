@@ -1,11 +1,13 @@
-from typing import List, Optional
-from sqlalchemy import select, and_, or_
-from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
-from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import Executable, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.security import get_password_hash, verify_password
+from app.models.user import User
 from app.repositories import BaseRepository
+from app.schemas.user import UserCreate, UserUpdate
 
 
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
@@ -39,6 +41,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         db_obj = User(**create_data)
         db.add(db_obj)
         await db.commit()
+        self.invalidate_counts()
         await db.refresh(db_obj)
         return db_obj
 
@@ -74,6 +77,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
 
         user.is_active = False
         await db.commit()
+        self.invalidate_counts()
         await db.refresh(user)
         return True
 
@@ -85,6 +89,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
 
         user.is_active = True
         await db.commit()
+        self.invalidate_counts()
         await db.refresh(user)
         return True
 
@@ -121,6 +126,20 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         result = await db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none() is not None
 
+    def warmup_statements(self) -> List[Executable]:
+        """Add the login, auth and search lookups to the base statements"""
+        placeholder_id = uuid.uuid4()
+        return super().warmup_statements() + [
+            select(User).where(User.email == "warmup@example.com"),
+            select(User).where(and_(User.id == placeholder_id, User.is_active == True)),
+            select(User)
+            .where(or_(User.email.ilike("%warmup%"), User.full_name.ilike("%warmup%")))
+            .where(User.is_active == True)
+            .offset(0)
+            .limit(1)
+            .order_by(User.email),
+        ]
+
     async def get_users_with_pagination(
         self,
         db: AsyncSession,
@@ -139,3 +158,25 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         return await self.get_multi(
             db, skip=skip, limit=limit, filters=filters, order_by="-created_at"
         )
+
+    async def get_ids_by_emails(
+        self, db: AsyncSession, emails: Iterable[str]
+    ) -> Dict[str, uuid.UUID]:
+        """Map email addresses to user IDs in a single query"""
+        emails = set(emails)
+        if not emails:
+            return {}
+        result = await db.execute(
+            select(User.email, User.id).where(User.email.in_(emails))
+        )
+        return {email: user_id for email, user_id in result.all()}
+
+    async def get_existing_ids(
+        self, db: AsyncSession, user_ids: Iterable[uuid.UUID]
+    ) -> Set[uuid.UUID]:
+        """Which of the given user IDs exist, in a single query"""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return set()
+        result = await db.execute(select(User.id).where(User.id.in_(user_ids)))
+        return set(result.scalars())
@@ -4,77 +4,86 @@ Pydantic schemas for request/response validation.
 These schemas define the structure of data sent to and from the API.
 """
 
-from app.schemas.user import (
-    UserBase,
-    UserCreate,
-    UserUpdate,
-    UserPasswordUpdate,
-    UserResponse,
-    UserSummary,
-)
-
-from app.schemas.token import (
-    Token,
-    TokenData,
-    RefreshTokenRequest,
-    RefreshTokenResponse,
-    RevokeTokenRequest,
-)
-
 from app.schemas.auth import (
     LoginRequest,
     LoginResponse,
-    RegisterRequest,
-    RegisterResponse,
     LogoutRequest,
     LogoutResponse,
-    PasswordResetRequest,
-    PasswordResetConfirm,
     PasswordChangeRequest,
+    PasswordResetConfirm,
+    PasswordResetRequest,
+    RegisterRequest,
+    RegisterResponse,
     VerifyTokenResponse,
 )
-
+from app.schemas.batch import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+)
+from app.schemas.comment import (
+    CommentBase,
+    CommentCreate,
+    CommentResponse,
+    CommentUpdate,
+    CommentWithUser,
+)
+from app.schemas.notification import (
+    NotificationBase,
+    NotificationBulkUpdate,
+    NotificationCreate,
+    NotificationResponse,
+    NotificationUpdate,
+)
 from app.schemas.project import (
     ProjectBase,
+    ProjectCloneCreate,
+    ProjectCloneResponse,
     ProjectCreate,
-    ProjectUpdate,
-    ProjectResponse,
-    ProjectWithOwner,
-    ProjectWithStats,
-    ProjectSummary,
+    ProjectDeletionResponse,
     ProjectMemberBase,
     ProjectMemberCreate,
-    ProjectMemberUpdate,
     ProjectMemberResponse,
+    ProjectMemberUpdate,
     ProjectMemberWithUser,
+    ProjectResponse,
+    ProjectSummary,
+    ProjectUpdate,
+    ProjectWithOwner,
+    ProjectWithStats,
 )
-
 from app.schemas.task import (
     TaskBase,
+    TaskBulkChanges,
+    TaskBulkUpdate,
+    TaskBulkUpdateResult,
     TaskCreate,
-    TaskUpdate,
+    TaskFilters,
+    TaskImportResult,
+    TaskImportRowError,
     TaskPositionUpdate,
     TaskResponse,
+    TaskSummary,
+    TaskTombstone,
+    TaskUpdate,
     TaskWithRelations,
     TaskWithStats,
-    TaskSummary,
-    TaskFilters,
 )
-
-from app.schemas.comment import (
-    CommentBase,
-    CommentCreate,
-    CommentUpdate,
-    CommentResponse,
-    CommentWithUser,
+from app.schemas.token import (
+    RefreshTokenRequest,
+    RefreshTokenResponse,
+    RevokeTokenRequest,
+    Token,
+    TokenData,
 )
-
-from app.schemas.notification import (
-    NotificationBase,
-    NotificationCreate,
-    NotificationUpdate,
-    NotificationResponse,
-    NotificationBulkUpdate,
+from app.schemas.user import (
+    UserBase,
+    UserCreate,
+    UserPasswordUpdate,
+    UserResponse,
+    UserSummary,
+    UserUpdate,
 )
 
 __all__ = [
@@ -107,6 +116,9 @@ __all__ = [
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectResponse",
+    "ProjectDeletionResponse",
+    "ProjectCloneCreate",
+    "ProjectCloneResponse",
     "ProjectWithOwner",
     "ProjectWithStats",
     "ProjectSummary",
@@ -125,6 +137,12 @@ __all__ = [
     "TaskWithStats",
     "TaskSummary",
     "TaskFilters",
+    "TaskImportRowError",
+    "TaskImportResult",
+    "TaskBulkChanges",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateResult",
+    "TaskTombstone",
     # Comment schemas
     "CommentBase",
     "CommentCreate",
@@ -137,4 +155,9 @@ __all__ = [
     "NotificationUpdate",
     "NotificationResponse",
     "NotificationBulkUpdate",
+    # Batch schemas
+    "BatchRequestItem",
+    "BatchRequest",
+    "BatchResponseItem",
+    "BatchResponse",
 ]
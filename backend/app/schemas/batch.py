@@ -0,0 +1,48 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.core.config import settings
+
+# Request headers a sub-request may set itself (lowercase)
+ITEM_HEADERS = frozenset({"if-match", "if-none-match", "if-modified-since"})
+
+
+class BatchRequestItem(BaseModel):
+    id: Optional[str] = Field(None, max_length=100)
+    method: str = Field(default="GET", pattern="^(GET|POST|PUT|PATCH|DELETE)$")
+    path: str = Field(..., min_length=1, max_length=2000)  # Relative to /api/v1
+    query: Optional[Dict[str, Any]] = None
+    headers: Optional[Dict[str, str]] = None
+    body: Any = None
+
+    @field_validator("headers")
+    @classmethod
+    def check_headers(
+        cls, headers: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        if headers is None:
+            return None
+        headers = {name.lower(): value for name, value in headers.items()}
+        if not_allowed := sorted(headers.keys() - ITEM_HEADERS):
+            raise ValueError(f"Headers not allowed in a batch item: {not_allowed}")
+        if not all(value.isascii() for value in headers.values()):
+            raise ValueError("Header values must be ASCII")
+        return headers
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_REQUESTS
+    )
+
+
+class BatchResponseItem(BaseModel):
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]
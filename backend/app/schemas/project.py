@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
+from pydantic import BaseModel, ConfigDict, Field
+
 from app.schemas.user import UserSummary
 
 
@@ -20,6 +21,8 @@ class ProjectUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     status: Optional[str] = Field(None, pattern="^(active|archived)$")
+    # Expected current version; a mismatch is rejected with 409
+    version: Optional[int] = Field(None, ge=1)
 
 
 class ProjectResponse(ProjectBase):
@@ -27,8 +30,56 @@ class ProjectResponse(ProjectBase):
 
     id: UUID
     owner_id: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ProjectDeletionResponse(BaseModel):
+    """Progress of a project deletion running in the background."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    project_id: UUID
+    status: str  # pending, running, done, failed
+    tasks_total: int
+    tasks_deleted: int
+    comments_deleted: int
+    notifications_deleted: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class ProjectCloneCreate(BaseModel):
+    # Defaults to "<source name> (copy)"
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    include_members: bool = True
+    include_tasks: bool = True
+    # Ignored without include_tasks
+    include_comments: bool = False
+
+
+class ProjectCloneResponse(BaseModel):
+    """Progress of a project clone; ``project_id`` is set once it's done."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    source_project_id: UUID
+    project_id: Optional[UUID] = None
+    status: str  # pending, running, done, failed
+    step: Optional[str] = None  # project, members, tasks, comments
+    tasks_total: int
+    members_copied: int
+    tasks_copied: int
+    comments_copied: int
+    error: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+    finished_at: Optional[datetime] = None
 
 
 class ProjectWithOwner(ProjectResponse):
@@ -1,8 +1,8 @@
-from typing import Optional
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.schemas.project import ProjectSummary
 from app.schemas.user import UserSummary
@@ -28,6 +28,8 @@ class TaskUpdate(BaseModel):
     priority: Optional[str] = Field(None, pattern="^(low|medium|high|urgent)$")
     assignee_id: Optional[UUID] = None
     due_date: Optional[datetime] = None
+    # Expected current version; a mismatch is rejected with 409
+    version: Optional[int] = Field(None, ge=1)
 
 
 class TaskPositionUpdate(BaseModel):
@@ -43,6 +45,7 @@ class TaskResponse(TaskBase):
     creator_id: UUID
     assignee_id: Optional[UUID] = None
     position: int
+    version: int
     created_at: datetime
     updated_at: datetime
 
@@ -72,3 +75,62 @@ class TaskFilters(BaseModel):
     assignee_id: Optional[UUID] = None
     project_id: Optional[UUID] = None
     search: Optional[str] = None
+
+
+class TaskImportRowError(BaseModel):
+    row: int  # 1-based data row, not counting a CSV header
+    errors: list[dict]
+
+
+class TaskImportResult(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[TaskImportRowError] = []
+    errors_truncated: bool = False
+
+
+class TaskBulkChanges(BaseModel):
+    """Fields a bulk update may set; only fields sent are changed."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    status: Optional[str] = Field(None, pattern="^(todo|in_progress|review|done)$")
+    priority: Optional[str] = Field(None, pattern="^(low|medium|high|urgent)$")
+    assignee_id: Optional[UUID] = None  # Explicit null unassigns
+    due_date: Optional[datetime] = None
+
+
+class TaskBulkUpdate(BaseModel):
+    """Apply the same changes to tasks selected by ids or by filters."""
+
+    task_ids: Optional[list[UUID]] = Field(None, min_length=1, max_length=5000)
+    filters: Optional[TaskFilters] = None
+    changes: TaskBulkChanges
+
+    @model_validator(mode="after")
+    def check_selection(self) -> "TaskBulkUpdate":
+        if (self.task_ids is None) == (self.filters is None):
+            raise ValueError("Provide exactly one of task_ids or filters")
+        if self.filters is not None and not self.filters.model_dump(exclude_none=True):
+            raise ValueError("filters must contain at least one criterion")
+        if not self.changes.model_fields_set:
+            raise ValueError("changes must set at least one field")
+        for field in ("status", "priority"):
+            if field in self.changes.model_fields_set and (
+                getattr(self.changes, field) is None
+            ):
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class TaskBulkUpdateResult(BaseModel):
+    updated: int
+    tasks: list[TaskResponse]
+
+
+class TaskTombstone(BaseModel):
+    """A deleted task, for clients removing it from their local copy."""
+
+    id: UUID
+    project_id: UUID
+    deleted_at: datetime
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr, ConfigDict, field_validator
-from typing import Optional
 import uuid
 from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 
 
 class UserBase(BaseModel):
@@ -51,6 +52,17 @@ class UserResponse(UserBase):
     updated_at: datetime
 
 
+class UserSummary(BaseModel):
+    """Compact user representation embedded in other resources."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    email: EmailStr
+    full_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+
 class UserLogin(BaseModel):
     """Schema for user login."""
 
@@ -71,6 +83,9 @@ class UserPasswordChange(BaseModel):
         return v
 
 
+UserPasswordUpdate = UserPasswordChange
+
+
 class UserProfileUpdate(BaseModel):
     """Schema for updating user profile (excludes sensitive fields)."""
 
@@ -93,13 +108,21 @@ class TokenData(BaseModel):
 
 
 class UserListResponse(BaseModel):
-    """Schema for paginated user list response."""
+    """
+    Schema for paginated user list response.
+
+    ``total`` and ``pages`` are None when the listing only reports
+    ``has_more``, and approximate when ``total_estimated`` is set
+    (see ``app.core.counting``).
+    """
 
     items: list[UserResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    total_estimated: bool = False
+    has_more: Optional[bool] = None
 
 
 class UserFilter(BaseModel):
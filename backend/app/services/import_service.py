@@ -0,0 +1,267 @@
+# app/services/import_service.py
+"""
+Bulk task import from CSV or NDJSON.
+
+The upload is parsed incrementally and handled ``IMPORT_CHUNK_SIZE`` rows at
+a time. For each chunk:
+
+1. Assignee emails are resolved to user IDs in one query
+2. Every row is validated against ``TaskCreate``; failures are collected per
+   row and the row is skipped
+3. Assignee IDs given directly are checked to exist in one query, so an
+   unknown one is a row error rather than a foreign key violation
+4. Valid rows are COPYed into a temporary staging table and merged into
+   ``tasks`` with a single ``INSERT ... SELECT``
+
+The whole import runs in one transaction. With ``atomic=True`` nothing is
+imported if any row failed.
+"""
+
+import codecs
+import csv
+import uuid
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pydantic_core
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.task import TaskRepository
+from app.repositories.user import UserRepository
+from app.schemas.task import TaskCreate, TaskImportResult, TaskImportRowError
+
+# (1-based row number, raw field values)
+RawRow = Tuple[int, Dict[str, Any]]
+
+IMPORT_FIELDS = {
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "assignee_id",
+    "assignee_email",
+}
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+async def iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines, keeping line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in body:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[RawRow]:
+    """
+    Parse CSV with a header row into dicts.
+
+    Lines are joined until their quotes balance, so quoted fields may
+    contain newlines.
+    """
+    header = None
+    record = ""
+    number = 0
+    async for line in lines:
+        record += line
+        if record.count('"') % 2:
+            continue  # Inside a quoted field that spans lines
+        if record.strip():
+            values = next(csv.reader([record]))
+            if header is None:
+                header = [name.strip() for name in values]
+            else:
+                number += 1
+                yield number, dict(zip(header, values))
+        record = ""
+    if record.strip() and header is not None:
+        number += 1
+        yield number, dict(zip(header, next(csv.reader([record]))))
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[RawRow]:
+    """Parse one JSON object per line; invalid lines become error rows."""
+    number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            value = pydantic_core.from_json(line)
+        except ValueError as e:
+            value = e
+        yield number, value if isinstance(value, dict) else {"__invalid__": value}
+
+
+class ImportService:
+    def __init__(
+        self, task_repository: TaskRepository, user_repository: UserRepository
+    ):
+        self.task_repository = task_repository
+        self.user_repository = user_repository
+
+    async def import_tasks(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: uuid.UUID,
+        creator_id: uuid.UUID,
+        body: AsyncIterator[bytes],
+        import_format: ImportFormat,
+        atomic: bool = False,
+        chunk_size: int | None = None,
+    ) -> TaskImportResult:
+        """
+        Import tasks into a project from a CSV or NDJSON byte stream.
+
+        Args:
+            db: Database session
+            project_id: Project receiving the tasks
+            creator_id: User recorded as creator of every task
+            body: Upload as an async iterator of byte chunks
+            import_format: csv or ndjson
+            atomic: Import nothing if any row fails validation
+            chunk_size: Rows per validation/COPY chunk
+
+        Returns:
+            Counts and per-row errors
+        """
+        chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        parse = iter_csv_rows if import_format == ImportFormat.CSV else iter_ndjson_rows
+        result = TaskImportResult()
+
+        await self.task_repository.create_import_staging(db)
+        try:
+            chunk: List[RawRow] = []
+            async for row in parse(iter_lines(body)):
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    await self._import_chunk(db, project_id, creator_id, chunk, result)
+                    chunk = []
+            if chunk:
+                await self._import_chunk(db, project_id, creator_id, chunk, result)
+
+            if atomic and result.failed:
+                await db.rollback()
+                result.imported = 0
+            else:
+                await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return result
+
+    async def _import_chunk(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        creator_id: uuid.UUID,
+        chunk: List[RawRow],
+        result: TaskImportResult,
+    ) -> None:
+        emails = {
+            email.strip()
+            for _, raw in chunk
+            if isinstance(email := raw.get("assignee_email"), str) and email.strip()
+        }
+        email_ids = await self.user_repository.get_ids_by_emails(db, emails)
+
+        validated = [
+            (number, *self._validate_row(raw, project_id, email_ids))
+            for number, raw in chunk
+        ]
+        # Unassigned rows and IDs resolved from emails need no lookup
+        resolved = {None, *email_ids.values()}
+        known_ids = resolved | await self.user_repository.get_existing_ids(
+            db,
+            {task.assignee_id for _, task, _ in validated if task is not None}
+            - resolved,
+        )
+
+        records = []
+        for number, task, errors in validated:
+            if not errors and task.assignee_id not in known_ids:
+                errors = [{"loc": ["assignee_id"], "msg": "Unknown user"}]
+            if errors:
+                self._add_error(result, number, errors)
+                continue
+            records.append(
+                (
+                    number,
+                    uuid.uuid4(),
+                    task.title,
+                    task.description,
+                    task.status,
+                    task.priority,
+                    task.due_date,
+                    project_id,
+                    creator_id,
+                    task.assignee_id,
+                )
+            )
+
+        await self.task_repository.copy_to_import_staging(db, records)
+        result.imported += await self.task_repository.merge_import_staging(
+            db, project_id
+        )
+
+    def _validate_row(
+        self,
+        raw: Dict[str, Any],
+        project_id: uuid.UUID,
+        email_ids: Dict[str, uuid.UUID],
+    ) -> Tuple[TaskCreate | None, List[dict]]:
+        if "__invalid__" in raw:
+            return None, [
+                {"loc": [], "msg": f"Not a JSON object: {raw['__invalid__']}"}
+            ]
+
+        # CSV has no nulls: empty cells mean "not set"
+        data = {
+            key: None if value == "" else value
+            for key, value in raw.items()
+            if key in IMPORT_FIELDS
+        }
+        email = data.pop("assignee_email", None)
+        if email is not None and not isinstance(email, str):
+            return None, [
+                {"loc": ["assignee_email"], "msg": "Input should be a valid string"}
+            ]
+        if email and not data.get("assignee_id"):
+            assignee_id = email_ids.get(email.strip())
+            if assignee_id is None:
+                return None, [{"loc": ["assignee_email"], "msg": "Unknown user"}]
+            data["assignee_id"] = assignee_id
+        # Let model defaults apply to missing status/priority
+        data = {key: value for key, value in data.items() if value is not None}
+        data["project_id"] = project_id
+
+        try:
+            return TaskCreate.model_validate(data), []
+        except ValidationError as e:
+            return None, [
+                {"loc": list(error["loc"]), "msg": error["msg"]}
+                for error in e.errors(include_url=False)
+            ]
+
+    def _add_error(
+        self, result: TaskImportResult, number: int, errors: List[dict]
+    ) -> None:
+        result.failed += 1
+        if len(result.errors) < settings.IMPORT_MAX_ERRORS:
+            result.errors.append(TaskImportRowError(row=number, errors=errors))
+        else:
+            result.errors_truncated = True
@@ -0,0 +1,141 @@
+# app/services/notification_service.py
+"""
+Notification fan-out for task events.
+
+Services publish one event per operation, so a bulk update of 500 tasks is a
+single event rather than 500. Events are handled on the in-process background
+runner: every event in a batch is grouped by assignee and project and turned
+into one notification per pair, and the whole batch is written with one
+INSERT. Grouped notifications link to their project, which is also how a
+project deletion finds them. Events the runner can't take (queue full, runner
+not started) go to the ``realtime`` Celery queue instead.
+"""
+
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import pydantic_core
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.background import background_runner
+from app.db.session import get_sessionmaker
+from app.repositories.notification import NotificationRepository
+
+TASK_EVENTS_JOB = "task_events"
+TASKS_BULK_UPDATED = "tasks.bulk_updated"
+
+# Task titles listed in a grouped notification before "and N more"
+MAX_LISTED_TASKS = 10
+
+
+def publish_task_event(
+    event_type: str,
+    *,
+    actor_id: uuid.UUID,
+    tasks: Sequence[Mapping[str, Any]],
+    changes: Dict[str, Any],
+) -> bool:
+    """
+    Publish one event covering any number of tasks.
+
+    Args:
+        event_type: e.g. ``tasks.bulk_updated``
+        actor_id: User who made the change
+        tasks: Affected tasks (id, title, project_id, assignee_id)
+        changes: Values that were set
+
+    Returns:
+        True if the event was queued
+    """
+    event = {
+        "type": event_type,
+        "actor_id": str(actor_id),
+        "changes": pydantic_core.to_jsonable_python(changes),
+        "tasks": [
+            {
+                "id": str(task["id"]),
+                "title": task["title"],
+                "project_id": str(task["project_id"]),
+                "assignee_id": (
+                    str(task["assignee_id"]) if task["assignee_id"] else None
+                ),
+            }
+            for task in tasks
+        ],
+    }
+    return background_runner.dispatch(TASK_EVENTS_JOB, event)
+
+
+def group_by_assignee_and_project(
+    tasks: Sequence[Dict[str, Any]],
+) -> Dict[Tuple[str, str], List[dict]]:
+    """Group event tasks by (assignee id, project id), skipping unassigned tasks."""
+    groups: Dict[Tuple[str, str], List[dict]] = defaultdict(list)
+    for task in tasks:
+        if task["assignee_id"]:
+            groups[(task["assignee_id"], task["project_id"])].append(task)
+    return groups
+
+
+def build_notifications(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One notification row per assignee and project affected by an event."""
+    changes = event["changes"]
+    assigned = changes.get("assignee_id") is not None
+    # The recipient is the assignee, so only the other changes are listed
+    summary = ", ".join(
+        f"{field}: {value}"
+        for field, value in changes.items()
+        if field != "assignee_id"
+    )
+
+    rows = []
+    for (assignee_id, project_id), tasks in group_by_assignee_and_project(
+        event["tasks"]
+    ).items():
+        if assignee_id == event["actor_id"]:
+            continue  # Don't notify people about their own changes
+        count = len(tasks)
+        if count == 1:
+            title = tasks[0]["title"]
+            link = f"/tasks/{tasks[0]['id']}"
+        else:
+            title = f"{count} tasks"
+            link = f"/projects/{project_id}"
+
+        lines = [f"- {task['title']}" for task in tasks[:MAX_LISTED_TASKS]]
+        if count > MAX_LISTED_TASKS:
+            lines.append(f"... and {count - MAX_LISTED_TASKS} more")
+
+        rows.append(
+            {
+                "user_id": uuid.UUID(assignee_id),
+                "type": "task_assigned" if assigned else "tasks_updated",
+                "title": (
+                    f"You were assigned {title}" if assigned else f"Updated: {title}"
+                )[:255],
+                "message": "\n".join(([summary] if summary else []) + lines),
+                "link": link,
+            }
+        )
+    return rows
+
+
+@background_runner.job(
+    TASK_EVENTS_JOB,
+    batch_size=100,
+    batch_window=0.05,
+    celery_task="app.tasks.notification_tasks.handle_task_events",
+)
+async def handle_task_events(
+    events: List[Dict[str, Any]],
+    *,
+    sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> None:
+    """Write the notifications for a batch of task events in one INSERT."""
+    rows = [row for event in events for row in build_notifications(event)]
+    if not rows:
+        return
+    sessionmaker = sessionmaker or get_sessionmaker()
+    async with sessionmaker() as db:
+        await NotificationRepository().create_many(db, rows=rows)
@@ -0,0 +1,138 @@
+# app/services/project_clone_service.py
+"""
+Copying projects, e.g. from a template, entirely inside PostgreSQL.
+
+``POST /projects/{id}/clone`` records a ``ProjectClone`` with the options.
+The copy itself is a handful of ``INSERT ... SELECT`` statements in one
+transaction (``ProjectCloneRepository.copy_project``): the project, its
+members, its live tasks under fresh ids and their comments, re-pointed
+through a temporary old-to-new id map. However many tasks a template has,
+no row travels to the application.
+
+Small projects (up to ``PROJECT_CLONE_INLINE_MAX_TASKS`` tasks) are copied
+during the request. Bigger ones are copied by this job; the clone row is
+updated after each step from a second session, so
+``GET /projects/clones/{id}`` shows progress while the copy's own
+transaction is still uncommitted. A clone interrupted by a restart left
+nothing behind and is started again by ``resume_project_clones``.
+
+When the in-process runner is stopped or its queue is full, the job is sent
+to the maintenance worker (``clone_projects``) instead.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.background import background_runner
+from app.core.config import settings
+from app.core.permissions import membership_cache
+from app.db.session import get_sessionmaker
+from app.repositories.project_clone import ProjectCloneRepository
+
+logger = logging.getLogger(__name__)
+
+PROJECT_CLONE_JOB = "project_clone"
+
+
+def request_clone(clone_id: uuid.UUID) -> bool:
+    """
+    Queue a recorded clone for the background job.
+
+    Returns:
+        False if the job could not be queued; the pending clone is then
+        started by the next ``resume_project_clones`` run
+    """
+    queued = background_runner.dispatch(PROJECT_CLONE_JOB, str(clone_id))
+    if not queued:
+        logger.warning(f"Clone {clone_id} not queued; left for resume_project_clones")
+    return queued
+
+
+def _stale_before() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(
+        seconds=settings.PROJECT_CLONE_STALE_AFTER
+    )
+
+
+async def run_clone(
+    clone_id: uuid.UUID,
+    *,
+    sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None,
+    repository: Optional[ProjectCloneRepository] = None,
+) -> bool:
+    """
+    Copy a project as recorded in a pending clone.
+
+    Args:
+        clone_id: Clone created by ``ProjectCloneRepository.create_clone``
+        sessionmaker: Session factory (Celery workers pass their own)
+        repository: Clone repository to use
+
+    Returns:
+        False if the clone was running elsewhere, done, or its source is gone
+    """
+    sessionmaker = sessionmaker or get_sessionmaker()
+    repository = repository or ProjectCloneRepository()
+
+    async with sessionmaker() as db, sessionmaker() as progress_db:
+        clone = await repository.claim(db, clone_id, _stale_before())
+        if clone is None:
+            return False
+
+        async def progress(step: str, counts: Dict[str, int]) -> None:
+            await repository.record_progress(progress_db, clone_id, step, **counts)
+
+        try:
+            if not await repository.lock(db, clone_id):
+                await db.rollback()
+                return False
+            user_ids = await repository.copy_project(db, clone, progress=progress)
+        except Exception as e:
+            await db.rollback()
+            await repository.fail(db, clone_id, str(e))
+            raise
+        if user_ids is None:
+            await repository.fail(db, clone_id, "Source project not found")
+            return False
+
+    await membership_cache.invalidate(*user_ids)
+    logger.info(f"Cloned project {clone.source_project_id} ({clone_id})")
+    return True
+
+
+@background_runner.job(
+    PROJECT_CLONE_JOB,
+    concurrency=2,
+    celery_task="app.tasks.maintenance_tasks.clone_projects",
+)
+async def handle_project_clones(clone_ids: List[str]) -> None:
+    """Copy queued clones one after another."""
+    for clone_id in clone_ids:
+        await run_clone(uuid.UUID(clone_id))
+
+
+async def resume_project_clones(
+    sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> int:
+    """
+    Run clones that are pending or were interrupted by a crash.
+
+    Returns:
+        Number of projects cloned
+    """
+    sessionmaker = sessionmaker or get_sessionmaker()
+    async with sessionmaker() as db:
+        clone_ids = await ProjectCloneRepository().get_unfinished_ids(
+            db, _stale_before()
+        )
+    cloned = 0
+    for clone_id in clone_ids:
+        try:
+            cloned += await run_clone(clone_id, sessionmaker=sessionmaker)
+        except Exception as e:
+            logger.error(f"Cloning project ({clone_id}) failed: {str(e)}")
+    return cloned
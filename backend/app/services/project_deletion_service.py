@@ -0,0 +1,144 @@
+# app/services/project_deletion_service.py
+"""
+Background removal of deleted projects' contents.
+
+``DELETE /projects/{id}`` only flags the project deleted and records a
+pending ``ProjectDeletion``; members lose access at once. This job then
+deletes the project's tasks in keyset order, ``PROJECT_DELETE_BATCH_SIZE``
+at a time, each batch with its comments and notifications in one short
+transaction. Nothing loads the children into the session, and no transaction
+holds locks on more than one batch of rows.
+
+Progress is stored on the deletion row after every batch, together with the
+last task id deleted, so ``GET /projects/{id}/deletion`` can report it and a
+deletion interrupted by a restart resumes where it stopped
+(``resume_project_deletions``, run periodically by the maintenance worker).
+
+The job runs on the maintenance worker by default (``purge_projects``), so
+a long purge never competes with requests for the API's event loop; set
+``BACKGROUND_JOB_MODES`` to run it in-process instead.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.background import CELERY, background_runner
+from app.core.config import settings
+from app.db.session import get_sessionmaker
+from app.repositories.project_deletion import ProjectDeletionRepository
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DELETION_JOB = "project_deletion"
+
+
+def request_purge(project_id: uuid.UUID) -> bool:
+    """
+    Queue the removal of a soft-deleted project's contents.
+
+    Returns:
+        False if the job could not be queued; the pending deletion is then
+        picked up by the next ``resume_project_deletions`` run
+    """
+    queued = background_runner.dispatch(PROJECT_DELETION_JOB, str(project_id))
+    if not queued:
+        logger.warning(
+            f"Deletion of project {project_id} not queued; "
+            "left for resume_project_deletions"
+        )
+    return queued
+
+
+def _stale_before() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(
+        seconds=settings.PROJECT_DELETE_STALE_AFTER
+    )
+
+
+async def purge_project(
+    project_id: uuid.UUID,
+    *,
+    sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None,
+    batch_size: Optional[int] = None,
+    repository: Optional[ProjectDeletionRepository] = None,
+) -> bool:
+    """
+    Delete a soft-deleted project's tasks, comments and notifications in
+    batches, then the project itself.
+
+    Args:
+        project_id: Project flagged by ``mark_project_deleted``
+        sessionmaker: Session factory (Celery workers pass their own)
+        batch_size: Tasks per transaction, ``PROJECT_DELETE_BATCH_SIZE`` if unset
+        repository: Deletion repository to use
+
+    Returns:
+        False if the deletion was already running elsewhere or is done
+    """
+    sessionmaker = sessionmaker or get_sessionmaker()
+    batch_size = batch_size or settings.PROJECT_DELETE_BATCH_SIZE
+    repository = repository or ProjectDeletionRepository()
+
+    async with sessionmaker() as db:
+        deletion = await repository.claim(db, project_id, _stale_before())
+        if deletion is None:
+            return False
+        cursor = deletion.last_task_id
+        try:
+            while True:
+                deleted, cursor = await repository.delete_task_batch(
+                    db, project_id=project_id, after=cursor, batch_size=batch_size
+                )
+                if deleted < batch_size:
+                    break
+                if settings.PROJECT_DELETE_BATCH_PAUSE:
+                    # Let other transactions and autovacuum in between batches
+                    await asyncio.sleep(settings.PROJECT_DELETE_BATCH_PAUSE)
+            await repository.finish(db, project_id)
+        except Exception as e:
+            await db.rollback()
+            await repository.fail(db, project_id, str(e))
+            raise
+
+    logger.info(f"Deleted project {project_id}")
+    return True
+
+
+@background_runner.job(
+    PROJECT_DELETION_JOB,
+    concurrency=1,
+    mode=CELERY,
+    celery_task="app.tasks.maintenance_tasks.purge_projects",
+)
+async def handle_project_deletions(project_ids: List[str]) -> None:
+    """Purge queued projects one after another."""
+    for project_id in project_ids:
+        await purge_project(uuid.UUID(project_id))
+
+
+async def resume_project_deletions(
+    sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> int:
+    """
+    Purge deletions that are pending, failed or stuck after a crash.
+
+    Returns:
+        Number of projects purged
+    """
+    sessionmaker = sessionmaker or get_sessionmaker()
+    async with sessionmaker() as db:
+        project_ids = await ProjectDeletionRepository().get_unfinished_project_ids(
+            db, _stale_before()
+        )
+    purged = 0
+    for project_id in project_ids:
+        try:
+            purged += await purge_project(project_id, sessionmaker=sessionmaker)
+        except Exception as e:
+            logger.error(f"Deleting project {project_id} failed: {str(e)}")
+    return purged
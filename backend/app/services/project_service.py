@@ -0,0 +1,236 @@
+# app/services/project_service.py
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import expected_versions, version_conflict
+from app.core.config import settings
+from app.core.permissions import membership_cache
+from app.models.project import ProjectClone, ProjectDeletion
+from app.repositories.project import ProjectRepository
+from app.repositories.project_clone import ProjectCloneRepository
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.schemas.project import ProjectCloneCreate, ProjectResponse, ProjectUpdate
+from app.schemas.user import UserResponse
+from app.services.project_clone_service import request_clone, run_clone
+from app.services.project_deletion_service import request_purge
+
+# Member roles allowed to change a project's settings
+PROJECT_EDITOR_ROLES = ("owner", "admin")
+
+# ProjectUpdate allows null for these, but the columns don't
+NOT_NULL_PROJECT_FIELDS = ("name", "status")
+
+
+class ProjectService:
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        deletion_repository: ProjectDeletionRepository,
+        clone_repository: ProjectCloneRepository,
+    ):
+        self.project_repository = project_repository
+        self.deletion_repository = deletion_repository
+        self.clone_repository = clone_repository
+
+    def _not_found(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+
+    async def get_project_version(
+        self, db: AsyncSession, project_id: uuid.UUID, current_user: UserResponse
+    ) -> RowMapping:
+        """Check the user can see a project and return its version and updated_at."""
+        if (
+            not current_user.is_superuser
+            and not await self.project_repository.is_member(
+                db, project_id, current_user.id
+            )
+        ):
+            raise self._not_found()
+        row = await self.project_repository.get_fields(
+            db, project_id, ["id", "version", "updated_at"]
+        )
+        if row is None:
+            raise self._not_found()
+        return row
+
+    async def get_project(self, db: AsyncSession, project_id: uuid.UUID) -> RowMapping:
+        """Get a project's columns (access is checked by get_project_version)."""
+        row = await self.project_repository.get_fields(
+            db, project_id, list(ProjectResponse.model_fields)
+        )
+        if row is None:
+            raise self._not_found()
+        return row
+
+    async def update_project(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        data: ProjectUpdate,
+        current_user: UserResponse,
+        *,
+        if_match: Optional[str] = None,
+    ) -> RowMapping:
+        """
+        Update a project's settings in one statement, guarded by its version.
+
+        Only the owner, project admins and superusers may update a project.
+        Version mismatches are 412 with ``If-Match`` and 409 with ``version``
+        in the body.
+        """
+        if not current_user.is_superuser:
+            role = await self.project_repository.get_member_role(
+                db, project_id, current_user.id
+            )
+            if role is None:
+                raise self._not_found()
+            if role not in PROJECT_EDITOR_ROLES:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Only project owners and admins can edit the project",
+                )
+
+        values = data.model_dump(exclude_unset=True, exclude={"version"})
+        for field in NOT_NULL_PROJECT_FIELDS:
+            if field in values and values[field] is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=f"{field} cannot be null",
+                )
+        if not values:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No changes"
+            )
+
+        versions = expected_versions(if_match, data.version, "project")
+        row = await self.project_repository.update_versioned(
+            db,
+            id=project_id,
+            values=values,
+            versions=versions,
+            fields=list(ProjectResponse.model_fields),
+        )
+        if row is not None:
+            return row
+
+        current = await self.project_repository.get_fields(db, project_id, ["version"])
+        if current is None:
+            raise self._not_found()
+        raise version_conflict(if_match, current["version"], "project")
+
+    async def delete_project(
+        self, db: AsyncSession, project_id: uuid.UUID, current_user: UserResponse
+    ) -> ProjectDeletion:
+        """
+        Delete a project (owner or superuser) without waiting for its contents.
+
+        The project is flagged deleted and hidden from its members right away;
+        tasks, comments and notifications are removed in the background.
+        """
+        if not current_user.is_superuser:
+            role = await self.project_repository.get_member_role(
+                db, project_id, current_user.id
+            )
+            if role is None:
+                raise self._not_found()
+            if role != "owner":
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Only the project owner can delete the project",
+                )
+
+        member_ids = await self.project_repository.get_member_user_ids(db, project_id)
+        deletion = await self.deletion_repository.mark_project_deleted(
+            db, project_id=project_id, requested_by=current_user.id
+        )
+        if deletion is None:
+            raise self._not_found()
+        await membership_cache.invalidate(*member_ids)
+        request_purge(project_id)
+        return deletion
+
+    async def get_deletion(
+        self, db: AsyncSession, project_id: uuid.UUID, current_user: UserResponse
+    ) -> ProjectDeletion:
+        """Progress of a project deletion, for whoever requested it."""
+        deletion = await self.deletion_repository.get_by_project(db, project_id)
+        if deletion is None or not (
+            current_user.is_superuser or deletion.requested_by == current_user.id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Deletion not found"
+            )
+        return deletion
+
+    async def clone_project(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        data: ProjectCloneCreate,
+        current_user: UserResponse,
+    ) -> ProjectClone:
+        """
+        Copy a project the user can see; the user owns the copy.
+
+        Projects with up to ``PROJECT_CLONE_INLINE_MAX_TASKS`` tasks to copy
+        are cloned before returning (status ``done``); bigger ones are queued
+        and the clone is returned ``pending``.
+        """
+        if (
+            not current_user.is_superuser
+            and not await self.project_repository.is_member(
+                db, project_id, current_user.id
+            )
+        ):
+            raise self._not_found()
+        source = await self.project_repository.get_fields(db, project_id, ["name"])
+        if source is None:
+            raise self._not_found()
+
+        include_tasks = data.include_tasks
+        tasks_total = (
+            await self.clone_repository.count_source_tasks(db, project_id)
+            if include_tasks
+            else 0
+        )
+        clone = await self.clone_repository.create_clone(
+            db,
+            source_project_id=project_id,
+            requested_by=current_user.id,
+            name=data.name or f"{source['name']} (copy)"[:255],
+            description=data.description,
+            include_members=data.include_members,
+            include_tasks=include_tasks,
+            include_comments=include_tasks and data.include_comments,
+            tasks_total=tasks_total,
+        )
+
+        if tasks_total > settings.PROJECT_CLONE_INLINE_MAX_TASKS:
+            request_clone(clone.id)
+            return clone
+
+        await run_clone(clone.id)
+        await db.refresh(clone)
+        if clone.status == "failed":
+            # The source was deleted in the meantime
+            raise self._not_found()
+        return clone
+
+    async def get_clone(
+        self, db: AsyncSession, clone_id: uuid.UUID, current_user: UserResponse
+    ) -> ProjectClone:
+        """Progress of a project clone, for whoever requested it."""
+        clone = await self.clone_repository.get(db, clone_id)
+        if clone is None or not (
+            current_user.is_superuser or clone.requested_by == current_user.id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Clone not found"
+            )
+        return clone
@@ -0,0 +1,288 @@
+# app/services/task_service.py
+import uuid
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import RowMapping, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import expected_versions, version_conflict
+from app.core.config import settings
+from app.models.task import Task
+from app.repositories.project import ProjectRepository
+from app.repositories.task import TaskRepository
+from app.repositories.user import UserRepository
+from app.schemas.task import (
+    TaskBulkUpdate,
+    TaskFilters,
+    TaskResponse,
+    TaskTombstone,
+    TaskUpdate,
+)
+from app.schemas.user import UserResponse
+from app.services.notification_service import TASKS_BULK_UPDATED, publish_task_event
+
+# TaskUpdate allows null for these, but the columns don't
+NOT_NULL_TASK_FIELDS = ("title", "status", "priority")
+
+
+class TaskService:
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        project_repository: ProjectRepository,
+        user_repository: UserRepository,
+    ):
+        self.task_repository = task_repository
+        self.project_repository = project_repository
+        self.user_repository = user_repository
+
+    async def _visible_project_ids(
+        self, db: AsyncSession, current_user: UserResponse, check_access: bool = True
+    ) -> Optional[List[uuid.UUID]]:
+        """
+        Projects the user may see, or None when access isn't restricted.
+
+        Comes from the membership cache, so listing queries filter on a list
+        of ids instead of joining the membership tables every time.
+        """
+        if current_user.is_superuser or not check_access:
+            return None
+        return list(await self.project_repository.get_member_roles(db, current_user.id))
+
+    async def get_task_version(
+        self, db: AsyncSession, task_id: uuid.UUID, current_user: UserResponse
+    ) -> RowMapping:
+        """
+        Check the user can see a task and return its version and updated_at.
+
+        Cheap enough to run before deciding whether to build the response.
+        """
+        rows = await self.task_repository.get_multi_fields_filtered(
+            db,
+            fields=["id", "version", "updated_at"],
+            filters=None,
+            project_ids=await self._visible_project_ids(db, current_user),
+            limit=1,
+            task_ids=[task_id],
+        )
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            )
+        return rows[0]
+
+    async def get_task(
+        self,
+        db: AsyncSession,
+        task_id: uuid.UUID,
+        *,
+        fields: Optional[Sequence[str]] = None,
+    ) -> RowMapping:
+        """Get a task's columns (access is checked by get_task_version)."""
+        row = await self.task_repository.get_fields(
+            db, task_id, fields or list(TaskResponse.model_fields)
+        )
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            )
+        return row
+
+    async def update_task(
+        self,
+        db: AsyncSession,
+        task_id: uuid.UUID,
+        data: TaskUpdate,
+        current_user: UserResponse,
+        *,
+        if_match: Optional[str] = None,
+    ) -> RowMapping:
+        """
+        Update a task in one statement, guarded by its version.
+
+        The expected version comes from ``If-Match`` (mismatch: 412) or from
+        ``version`` in the body (mismatch: 409). No row lock is taken: the
+        UPDATE only matches while the version is unchanged.
+        """
+        values = data.model_dump(exclude_unset=True, exclude={"version"})
+        for field in NOT_NULL_TASK_FIELDS:
+            if field in values and values[field] is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=f"{field} cannot be null",
+                )
+        if not values:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No changes"
+            )
+
+        versions = expected_versions(if_match, data.version, "task")
+
+        assignee_id = values.get("assignee_id")
+        if assignee_id and not await self.user_repository.exists(db, assignee_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Assignee not found",
+            )
+
+        project_ids = await self._visible_project_ids(db, current_user)
+        row = await self.task_repository.update_versioned(
+            db,
+            id=task_id,
+            values=values,
+            versions=versions,
+            fields=list(TaskResponse.model_fields),
+            where=(
+                [Task.project_id.in_(project_ids)] if project_ids is not None else []
+            ),
+        )
+        if row is not None:
+            return row
+
+        # Nothing matched: missing or hidden (404), or changed meanwhile
+        current = await self.get_task_version(db, task_id, current_user)
+        raise version_conflict(if_match, current["version"], "task")
+
+    async def delete_task(
+        self,
+        db: AsyncSession,
+        task_id: uuid.UUID,
+        current_user: UserResponse,
+        *,
+        if_match: Optional[str] = None,
+    ) -> None:
+        """
+        Soft-delete a task, guarded by ``If-Match`` like ``update_task``.
+
+        The task leaves every listing at once and is reported as a tombstone
+        until the purge job removes it.
+        """
+        versions = expected_versions(if_match, None, "task")
+        project_ids = await self._visible_project_ids(db, current_user)
+        row = await self.task_repository.update_versioned(
+            db,
+            id=task_id,
+            values={"is_deleted": True, "deleted_at": func.now()},
+            versions=versions,
+            fields=["id"],
+            where=(
+                [Task.project_id.in_(project_ids)] if project_ids is not None else []
+            ),
+        )
+        if row is not None:
+            return
+
+        current = await self.get_task_version(db, task_id, current_user)
+        raise version_conflict(if_match, current["version"], "task")
+
+    async def get_tombstones(
+        self,
+        db: AsyncSession,
+        current_user: UserResponse,
+        *,
+        since: Optional[datetime] = None,
+        after_id: Optional[uuid.UUID] = None,
+        limit: int = 100,
+    ) -> List[RowMapping]:
+        """Tasks deleted in projects the user can see, oldest deletion first."""
+        project_ids = await self._visible_project_ids(db, current_user)
+        return await self.task_repository.get_tombstones(
+            db,
+            since=since,
+            after_id=after_id,
+            limit=limit,
+            fields=list(TaskTombstone.model_fields),
+            where=(
+                [Task.project_id.in_(project_ids)] if project_ids is not None else []
+            ),
+        )
+
+    async def get_list_stats(
+        self,
+        db: AsyncSession,
+        filters: TaskFilters,
+        current_user: UserResponse,
+        *,
+        check_access: bool = True,
+    ) -> Tuple[int, Optional[datetime]]:
+        """Count and newest updated_at of the tasks list_tasks would cover."""
+        return await self.task_repository.get_collection_stats_filtered(
+            db,
+            filters=filters,
+            project_ids=await self._visible_project_ids(db, current_user, check_access),
+        )
+
+    async def list_tasks(
+        self,
+        db: AsyncSession,
+        filters: TaskFilters,
+        current_user: UserResponse,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str = "-created_at",
+        check_access: bool = True,
+    ) -> List[RowMapping]:
+        """
+        List tasks visible to the user via service layer.
+
+        Only ``fields`` are selected, so list views that don't need e.g. the
+        description never read it from the database.
+        """
+        return await self.task_repository.get_multi_fields_filtered(
+            db,
+            fields=fields,
+            filters=filters,
+            project_ids=await self._visible_project_ids(db, current_user, check_access),
+            skip=skip,
+            limit=limit,
+            order_by=order_by,
+        )
+
+    async def bulk_update(
+        self, db: AsyncSession, data: TaskBulkUpdate, current_user: UserResponse
+    ) -> List[RowMapping]:
+        """
+        Apply one set of changes to many tasks via service layer.
+
+        Runs as a single UPDATE ... RETURNING limited to projects the user can
+        access, then publishes one event for all updated tasks. Filters that
+        match more than ``BULK_UPDATE_MAX_ROWS`` tasks are rejected with 422
+        and change nothing.
+        """
+        values = data.changes.model_dump(exclude_unset=True)
+
+        assignee_id = values.get("assignee_id")
+        if assignee_id and not await self.user_repository.exists(db, assignee_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Assignee not found",
+            )
+
+        rows = await self.task_repository.bulk_update(
+            db,
+            values=values,
+            task_ids=data.task_ids,
+            filters=data.filters,
+            project_ids=await self._visible_project_ids(db, current_user),
+            max_rows=settings.BULK_UPDATE_MAX_ROWS,
+        )
+        if rows is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=(
+                    f"More than {settings.BULK_UPDATE_MAX_ROWS} tasks match; "
+                    "narrow the filters or select tasks by task_ids"
+                ),
+            )
+        if rows:
+            publish_task_event(
+                TASKS_BULK_UPDATED,
+                actor_id=current_user.id,
+                tasks=rows,
+                changes=values,
+            )
+        return rows
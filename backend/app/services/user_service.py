@@ -1,13 +1,13 @@
 # app/services/user_service.py
-from typing import List, Optional
+from typing import List
 from uuid import UUID
-from sqlalchemy.ext.asyncio import AsyncSession
+
 from fastapi import HTTPException, status
-from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserFilter, UserLogin
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token, verify_password
 from app.repositories.user import UserRepository
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.models.user import User
-from backend.app.core.config import settings
+from app.schemas.user import UserCreate, UserFilter, UserLogin, UserResponse, UserUpdate
 
 
 class UserService:
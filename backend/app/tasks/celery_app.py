@@ -1,5 +1,104 @@
+# app/tasks/celery_app.py
+"""
+Celery application configured from Settings.
+
+Work is split across three queues so a bulk email blast never sits in front of
+latency-sensitive notifications:
+
+- ``realtime``: user-facing side effects (notifications), default queue
+- ``bulk``: high-volume fan-out (email batches)
+- ``maintenance``: periodic cleanup and other long-running jobs
+
+Run one worker pool per queue class so prefetching stays fair, e.g.:
+
+    celery -A app.tasks.celery_app.celery worker -Q realtime -c 8 --prefetch-multiplier 4
+    celery -A app.tasks.celery_app.celery worker -Q bulk,maintenance -c 2
+
+Results are ignored unless a task opts in with ``ignore_result=False``. With
+``ENVIRONMENT=testing`` (or ``CELERY_TASK_ALWAYS_EAGER``) tasks run inline
+against in-memory transports.
+"""
+
 from celery import Celery
+from kombu import Queue
+
+from app.core.config import settings
+
+REALTIME_QUEUE = "realtime"
+BULK_QUEUE = "bulk"
+MAINTENANCE_QUEUE = "maintenance"
+
+# Routing rules per task module (glob patterns on task names)
+TASK_ROUTES = {
+    "app.tasks.notification_tasks.*": {"queue": REALTIME_QUEUE},
+    "app.tasks.email_tasks.*": {"queue": BULK_QUEUE},
+    "app.tasks.maintenance_tasks.*": {"queue": MAINTENANCE_QUEUE},
+}
 
-celery = Celery("tasks", broker="redis://redis:6379/1", backend="redis://redis:6379/2")
+celery = Celery(
+    "tasks",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+    include=[
+        "app.tasks.email_tasks",
+        "app.tasks.notification_tasks",
+        "app.tasks.maintenance_tasks",
+    ],
+)
 
-celery.autodiscover_tasks(["app.tasks"])
+celery.conf.update(
+    # Queues and routing
+    task_queues=(
+        Queue(REALTIME_QUEUE, routing_key=REALTIME_QUEUE),
+        Queue(BULK_QUEUE, routing_key=BULK_QUEUE),
+        Queue(MAINTENANCE_QUEUE, routing_key=MAINTENANCE_QUEUE),
+    ),
+    task_default_queue=REALTIME_QUEUE,
+    task_default_routing_key=REALTIME_QUEUE,
+    task_routes=TASK_ROUTES,
+    task_default_priority=5,
+    broker_transport_options={
+        "visibility_timeout": settings.CELERY_VISIBILITY_TIMEOUT,
+        "queue_order_strategy": "priority",
+        "priority_steps": list(range(10)),
+        "sep": ":",
+    },
+    # Serialization and payloads
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_compression=settings.CELERY_TASK_COMPRESSION,
+    result_compression=settings.CELERY_TASK_COMPRESSION,
+    # Delivery guarantees: ack after the task finishes, and hand tasks back to
+    # the broker if the worker process dies mid-task
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=settings.CELERY_PREFETCH_MULTIPLIER,
+    # Most tasks are fire-and-forget; don't write results nobody reads
+    task_ignore_result=True,
+    task_store_errors_even_if_ignored=False,
+    result_expires=3600,
+    # Keep long-lived workers from growing without bound
+    worker_max_tasks_per_child=1000,
+    broker_connection_retry_on_startup=True,
+    timezone="UTC",
+    enable_utc=True,
+    # Periodic jobs (run ``celery beat`` alongside the maintenance worker)
+    beat_schedule={
+        "resume-project-deletions": {
+            "task": "app.tasks.maintenance_tasks.resume_project_deletions",
+            "schedule": settings.PROJECT_DELETE_STALE_AFTER,
+        },
+        "resume-project-clones": {
+            "task": "app.tasks.maintenance_tasks.resume_project_clones",
+            "schedule": settings.PROJECT_CLONE_STALE_AFTER,
+        },
+        "purge-soft-deleted": {
+            "task": "app.tasks.maintenance_tasks.purge_soft_deleted",
+            "schedule": 3600,
+        },
+    },
+    # Test mode
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    task_eager_propagates=settings.CELERY_TASK_ALWAYS_EAGER,
+)
@@ -0,0 +1,35 @@
+# app/tasks/database.py
+"""
+Running the async services from synchronous Celery tasks.
+
+Each call gets ``asyncio.run`` on a short-lived engine without pooling, since
+asyncpg connections can't outlive the event loop they were opened on.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+def run_async(work: Callable[[async_sessionmaker[AsyncSession]], Awaitable[T]]) -> T:
+    """Run ``work`` with a session factory on a fresh engine and event loop."""
+
+    async def runner() -> T:
+        engine = create_async_engine(
+            str(settings.DATABASE_URL).replace(
+                "postgresql://", "postgresql+asyncpg://"
+            ),
+            poolclass=NullPool,
+        )
+        try:
+            return await work(async_sessionmaker(engine, expire_on_commit=False))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(runner())
@@ -0,0 +1,127 @@
+# app/tasks/email_tasks.py
+"""
+Celery tasks for outbound email.
+
+Recipients are split into batches of ``settings.EMAIL_BATCH_SIZE`` and each
+batch is delivered by one ``send_email_batch`` task over the worker's pooled
+backend connection. Only the transiently failed part of a batch is retried,
+with exponential backoff and jitter.
+"""
+
+import logging
+import random
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from celery import group
+
+from app.core.config import settings
+from app.tasks.celery_app import celery
+from app.utils.email import (
+    EmailMessage,
+    build_digests,
+    chunked,
+    get_email_backend,
+    render_bulk,
+    render_email,
+    uses_recipient_variables,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRY_BACKOFF_BASE_SECONDS = 10
+RETRY_BACKOFF_MAX_SECONDS = 600
+
+
+def _retry_countdown(retries: int) -> float:
+    """Exponential backoff with full jitter."""
+    ceiling = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2**retries)
+    return random.uniform(0, ceiling)
+
+
+def dispatch_messages(messages: Sequence[EmailMessage]) -> int:
+    """
+    Queue rendered messages as batched delivery tasks.
+
+    Args:
+        messages: Rendered messages
+
+    Returns:
+        Number of batch tasks queued
+    """
+    batches = [
+        [asdict(message) for message in batch]
+        for batch in chunked(messages, settings.EMAIL_BATCH_SIZE)
+    ]
+    if batches:
+        group(send_email_batch.s(batch) for batch in batches).apply_async()
+    return len(batches)
+
+
+@celery.task(bind=True, max_retries=settings.EMAIL_MAX_RETRIES)
+def send_email_batch(self, messages: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Deliver one batch of rendered messages, retrying transient failures."""
+    result = get_email_backend().send_messages([EmailMessage(**m) for m in messages])
+
+    if result.rejected:
+        logger.warning(f"{len(result.rejected)} emails permanently rejected")
+
+    if result.failed:
+        if self.request.retries >= self.max_retries:
+            logger.error(
+                f"Giving up on {len(result.failed)} emails after "
+                f"{self.request.retries} retries"
+            )
+        else:
+            raise self.retry(
+                args=([asdict(message) for message in result.failed],),
+                countdown=_retry_countdown(self.request.retries),
+            )
+
+    return {
+        "sent": result.sent,
+        "failed": len(result.failed),
+        "rejected": len(result.rejected),
+    }
+
+
+@celery.task
+def send_templated_email(
+    template_name: str,
+    recipients: List[str],
+    context: Optional[Dict[str, Any]] = None,
+    per_recipient_context: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
+    """
+    Render a template for many recipients and queue batched delivery.
+
+    The template is rendered once when neither the context nor the template
+    itself depends on the recipient, which also lets the SendGrid backend send
+    the whole batch in one request. Otherwise it is rendered per recipient.
+
+    Returns:
+        Number of batch tasks queued
+    """
+    if not per_recipient_context and not uses_recipient_variables(template_name):
+        messages = render_bulk(template_name, recipients, context or {})
+    else:
+        messages = [
+            render_email(
+                template_name,
+                recipient,
+                {**(context or {}), **(per_recipient_context or {}).get(recipient, {})},
+            )
+            for recipient in recipients
+        ]
+    return dispatch_messages(messages)
+
+
+@celery.task
+def send_digest_emails(items: List[Tuple[str, Dict[str, Any]]]) -> int:
+    """
+    Send one digest per recipient for a list of (recipient, item) pairs.
+
+    Returns:
+        Number of batch tasks queued
+    """
+    return dispatch_messages(build_digests(items))
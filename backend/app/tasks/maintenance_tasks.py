@@ -0,0 +1,104 @@
+# app/tasks/maintenance_tasks.py
+"""
+Celery tasks for periodic cleanup and other long-running jobs.
+
+These run on the ``maintenance`` queue, driving the async services through
+``run_async``.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from app.core.config import settings
+from app.tasks.celery_app import celery
+from app.tasks.database import run_async
+
+logger = logging.getLogger(__name__)
+
+
+def _soft_delete_repositories():
+    from app.repositories.task import TaskRepository
+
+    # Projects are not listed: their deletion job removes them (and their
+    # tasks) once the contents are gone
+    return [TaskRepository()]
+
+
+@celery.task
+def purge_soft_deleted() -> int:
+    """Remove tombstones older than ``SOFT_DELETE_RETENTION_DAYS``, in batches."""
+    older_than = datetime.now(timezone.utc) - timedelta(
+        days=settings.SOFT_DELETE_RETENTION_DAYS
+    )
+
+    async def purge(sessionmaker) -> int:
+        purged = 0
+        async with sessionmaker() as db:
+            for repository in _soft_delete_repositories():
+                count = await repository.purge_deleted(
+                    db,
+                    older_than=older_than,
+                    batch_size=settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+                )
+                if count:
+                    logger.info(
+                        f"Purged {count} deleted {repository.model.__tablename__}"
+                    )
+                purged += count
+        return purged
+
+    return run_async(purge)
+
+
+@celery.task
+def purge_projects(project_ids: List[str]) -> int:
+    """Remove the contents of soft-deleted projects (``project_deletion`` jobs)."""
+    from app.services.project_deletion_service import purge_project
+
+    async def purge(sessionmaker) -> int:
+        purged = 0
+        for project_id in project_ids:
+            purged += await purge_project(
+                uuid.UUID(project_id), sessionmaker=sessionmaker
+            )
+        return purged
+
+    return run_async(purge)
+
+
+@celery.task
+def resume_project_deletions() -> int:
+    """Finish project deletions that are pending, failed or were interrupted."""
+    from app.services.project_deletion_service import resume_project_deletions
+
+    purged = run_async(resume_project_deletions)
+    if purged:
+        logger.info(f"Finished {purged} project deletions")
+    return purged
+
+
+@celery.task
+def clone_projects(clone_ids: List[str]) -> int:
+    """Copy projects for queued clones (``project_clone`` jobs)."""
+    from app.services.project_clone_service import run_clone
+
+    async def clone(sessionmaker) -> int:
+        cloned = 0
+        for clone_id in clone_ids:
+            cloned += await run_clone(uuid.UUID(clone_id), sessionmaker=sessionmaker)
+        return cloned
+
+    return run_async(clone)
+
+
+@celery.task
+def resume_project_clones() -> int:
+    """Run project clones that are pending or were interrupted."""
+    from app.services.project_clone_service import resume_project_clones
+
+    cloned = run_async(resume_project_clones)
+    if cloned:
+        logger.info(f"Finished {cloned} project clones")
+    return cloned
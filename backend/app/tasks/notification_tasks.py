@@ -0,0 +1,23 @@
+# app/tasks/notification_tasks.py
+"""
+Celery tasks for user-facing side effects, on the ``realtime`` queue.
+
+Task events are normally handled by the API's in-process runner. These tasks
+take them when the runner can't: its queue is full, it isn't started, or it
+is configured to send the job to Celery.
+"""
+
+from typing import Any, Dict, List
+
+from app.tasks.celery_app import celery
+from app.tasks.database import run_async
+
+
+@celery.task
+def handle_task_events(events: List[Dict[str, Any]]) -> None:
+    """Write the notifications for a batch of task events."""
+    from app.services.notification_service import handle_task_events
+
+    run_async(
+        lambda sessionmaker: handle_task_events(events, sessionmaker=sessionmaker)
+    )
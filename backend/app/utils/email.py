@@ -0,0 +1,484 @@
+# app/utils/email.py
+"""
+Email rendering and delivery.
+
+Templates are compiled once per process and cached. Delivery goes through a
+backend chosen by ``settings.EMAIL_BACKEND``:
+
+- ``sendgrid``: groups messages with identical content into one v3 ``mail/send``
+  call (up to 1000 personalizations) over a keep-alive HTTP client
+- ``smtp``: sends every message over one pooled SMTP connection
+- ``console``: logs messages instead of sending them (development default)
+
+Usage:
+    from app.utils.email import render_email, get_email_backend
+
+    message = render_email("welcome", "jane@example.com", {"full_name": "Jane"})
+    result = get_email_backend().send_messages([message])
+"""
+
+import logging
+import smtplib
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from email.message import EmailMessage as MIMEMessage
+from email.policy import SMTP as SMTP_POLICY
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+# SendGrid accepts at most 1000 personalizations per mail/send request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+# Implied template variables that differ from one recipient to the next
+RECIPIENT_VARIABLES = frozenset({"email"})
+
+
+# Email templates: subject, plain-text body and optional HTML body
+EMAIL_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "welcome": {
+        "subject": "Welcome to {{ project_name }}",
+        "text": "Hi {{ full_name or email }},\n\nYour account is ready.",
+        "html": "<p>Hi {{ full_name or email }},</p><p>Your account is ready.</p>",
+    },
+    "password_reset": {
+        "subject": "Reset your {{ project_name }} password",
+        "text": "Use this link to reset your password:\n{{ reset_url }}",
+        "html": '<p><a href="{{ reset_url }}">Reset your password</a></p>',
+    },
+    "task_assigned": {
+        "subject": "You were assigned: {{ task_title }}",
+        "text": '{{ actor }} assigned you "{{ task_title }}".\n{{ link }}',
+        "html": '<p>{{ actor }} assigned you <a href="{{ link }}">{{ task_title }}</a>.</p>',
+    },
+    "comment_added": {
+        "subject": "New comment on {{ task_title }}",
+        "text": "{{ actor }} commented:\n\n{{ content }}\n\n{{ link }}",
+        "html": '<p>{{ actor }} commented on <a href="{{ link }}">{{ task_title }}</a>:</p><blockquote>{{ content }}</blockquote>',
+    },
+    "digest": {
+        "subject": "{{ count }} update{{ 's' if count != 1 }} in {{ project_name }}",
+        "text": "{% for item in items %}- {{ item.title }}{% if item.link %} ({{ item.link }}){% endif %}\n{% endfor %}",
+        "html": '<ul>{% for item in items %}<li>{% if item.link %}<a href="{{ item.link }}">{{ item.title }}</a>{% else %}{{ item.title }}{% endif %}</li>{% endfor %}</ul>',
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _get_environment() -> "Environment":
+    # jinja2 is imported on first render so Celery workers and the API don't
+    # pay for it at import time
+    from jinja2 import DictLoader, Environment, StrictUndefined
+
+    return Environment(
+        loader=DictLoader(
+            {
+                f"{name}/{part}": source
+                for name, parts in EMAIL_TEMPLATES.items()
+                for part, source in parts.items()
+            }
+        ),
+        autoescape=lambda template_name: (
+            bool(template_name) and template_name.endswith("/html")
+        ),
+        undefined=StrictUndefined,
+        auto_reload=False,
+    )
+
+
+class EmailDeliveryError(Exception):
+    """Raised when an email cannot be delivered."""
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    """A fully rendered email addressed to a single recipient."""
+
+    to: str
+    subject: str
+    text: str
+    html: Optional[str] = None
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of sending a batch of messages."""
+
+    sent: int = 0
+    failed: List[EmailMessage] = field(default_factory=list)  # retryable
+    rejected: List[EmailMessage] = field(default_factory=list)  # permanent
+
+    def merge(self, other: "DeliveryResult") -> None:
+        self.sent += other.sent
+        self.failed.extend(other.failed)
+        self.rejected.extend(other.rejected)
+
+
+@lru_cache(maxsize=None)
+def get_template(
+    name: str,
+) -> Tuple["Template", "Template", Optional["Template"]]:
+    """
+    Get the compiled (subject, text, html) templates for a template name.
+
+    Templates are compiled on first use and cached for the life of the process.
+
+    Raises:
+        KeyError: If no template with this name exists
+    """
+    if name not in EMAIL_TEMPLATES:
+        raise KeyError(f"Unknown email template: {name}")
+
+    environment = _get_environment()
+    html = None
+    if "html" in EMAIL_TEMPLATES[name]:
+        html = environment.get_template(f"{name}/html")
+    return (
+        environment.get_template(f"{name}/subject"),
+        environment.get_template(f"{name}/text"),
+        html,
+    )
+
+
+@lru_cache(maxsize=None)
+def uses_recipient_variables(name: str) -> bool:
+    """
+    Whether any part of a template reads a recipient-specific variable.
+
+    Raises:
+        KeyError: If no template with this name exists
+    """
+    if name not in EMAIL_TEMPLATES:
+        raise KeyError(f"Unknown email template: {name}")
+
+    from jinja2 import meta
+
+    environment = _get_environment()
+    return any(
+        RECIPIENT_VARIABLES & meta.find_undeclared_variables(environment.parse(source))
+        for source in EMAIL_TEMPLATES[name].values()
+    )
+
+
+def render_email(
+    template_name: str, to: str, context: Optional[Dict[str, Any]] = None
+) -> EmailMessage:
+    """
+    Render a template for a single recipient.
+
+    Args:
+        template_name: Key of ``EMAIL_TEMPLATES``
+        to: Recipient address
+        context: Template variables (``project_name`` and ``email`` are implied)
+
+    Returns:
+        Rendered EmailMessage
+    """
+    subject, text, html = get_template(template_name)
+    values = {"project_name": settings.PROJECT_NAME, "email": to, **(context or {})}
+    return EmailMessage(
+        to=to,
+        subject=subject.render(values).strip(),
+        text=text.render(values),
+        html=html.render(values) if html else None,
+    )
+
+
+def render_bulk(
+    template_name: str, recipients: Iterable[str], context: Dict[str, Any]
+) -> List[EmailMessage]:
+    """
+    Render a template once and address a copy to every recipient.
+
+    Only use this when the content does not depend on the recipient (see
+    ``uses_recipient_variables``); the implied ``email`` variable is bound to
+    the first recipient.
+    """
+    recipients = list(recipients)
+    if not recipients:
+        return []
+    message = render_email(template_name, recipients[0], context)
+    return [replace(message, to=recipient) for recipient in recipients]
+
+
+def build_digests(
+    items: Iterable[Tuple[str, Dict[str, Any]]],
+    *,
+    template_name: str = "digest",
+) -> List[EmailMessage]:
+    """
+    Collapse pending per-recipient items into one digest email per recipient.
+
+    Args:
+        items: (recipient, item) pairs, where each item has ``title`` and
+            optionally ``link``
+        template_name: Digest template to render
+
+    Returns:
+        One EmailMessage per distinct recipient
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for recipient, item in items:
+        grouped[recipient].append(item)
+
+    return [
+        render_email(
+            template_name, recipient, {"items": entries, "count": len(entries)}
+        )
+        for recipient, entries in grouped.items()
+    ]
+
+
+def chunked(
+    messages: Sequence[EmailMessage], size: int
+) -> Iterable[List[EmailMessage]]:
+    """Split messages into lists of at most ``size`` items."""
+    for start in range(0, len(messages), size):
+        yield list(messages[start : start + size])
+
+
+class BaseEmailBackend:
+    """Interface for email delivery backends."""
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> DeliveryResult:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release pooled connections."""
+
+
+class ConsoleEmailBackend(BaseEmailBackend):
+    """Log messages instead of sending them."""
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> DeliveryResult:
+        for message in messages:
+            logger.info(f"📧 Email to {message.to}: {message.subject}")
+        return DeliveryResult(sent=len(messages))
+
+
+class SMTPEmailBackend(BaseEmailBackend):
+    """
+    Send messages over a single SMTP connection that is reused across batches.
+
+    The connection is opened lazily, so each forked Celery worker process gets
+    its own. A dropped connection is reopened once per message before the
+    message is reported as failed.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        timeout: float = 10.0,
+        from_email: str = "noreply@example.com",
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.from_email = from_email
+        self._connection: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._connection is None:
+            connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.use_tls:
+                connection.starttls()
+            if self.username and self.password:
+                connection.login(self.username, self.password)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.quit()
+        except (smtplib.SMTPException, OSError):
+            self._connection.close()
+        finally:
+            self._connection = None
+
+    def _build_body(self, message: EmailMessage) -> bytes:
+        """Serialize everything except the To header, which varies per recipient."""
+        mime = MIMEMessage()
+        mime["From"] = self.from_email
+        mime["Subject"] = message.subject
+        mime.set_content(message.text)
+        if message.html:
+            mime.add_alternative(message.html, subtype="html")
+        return mime.as_bytes(policy=SMTP_POLICY)
+
+    def _send_one(self, to: str, data: bytes) -> None:
+        try:
+            self._connect().sendmail(self.from_email, [to], data)
+        except smtplib.SMTPServerDisconnected:
+            # Pooled connection went stale; reconnect once
+            self._connection = None
+            self._connect().sendmail(self.from_email, [to], data)
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> DeliveryResult:
+        result = DeliveryResult()
+        # MIME serialization dominates SMTP cost; do it once per distinct body
+        bodies: Dict[Tuple[str, str, Optional[str]], bytes] = {}
+        for index, message in enumerate(messages):
+            key = (message.subject, message.text, message.html)
+            body = bodies.get(key)
+            if body is None:
+                body = bodies[key] = self._build_body(message)
+            try:
+                self._send_one(
+                    message.to, b"To: " + message.to.encode() + b"\r\n" + body
+                )
+                result.sent += 1
+            except smtplib.SMTPRecipientsRefused:
+                result.rejected.append(message)
+            except smtplib.SMTPResponseException as e:
+                if 400 <= e.smtp_code < 500:
+                    result.failed.append(message)
+                else:
+                    result.rejected.append(message)
+                self._reset()
+            except (smtplib.SMTPException, OSError) as e:
+                # Server unreachable: everything left in the batch is retryable
+                logger.warning(f"SMTP connection failed: {str(e)}")
+                self._connection = None
+                result.failed.extend(messages[index:])
+                break
+        return result
+
+    def _reset(self) -> None:
+        """Clear the SMTP transaction state after a rejected message."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.rset()
+        except (smtplib.SMTPException, OSError):
+            self._connection = None
+
+
+class SendGridEmailBackend(BaseEmailBackend):
+    """
+    Send messages through the SendGrid v3 API in batched requests.
+
+    Messages with identical subject and body share one request, with one
+    personalization per recipient so recipients never see each other.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        api_url: str = "https://api.sendgrid.com/v3/mail/send",
+        timeout: float = 10.0,
+        from_email: str = "noreply@example.com",
+    ):
+        import httpx
+
+        self.api_url = api_url
+        self.from_email = from_email
+        self._client = httpx.Client(
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _build_payload(self, messages: Sequence[EmailMessage]) -> Dict[str, Any]:
+        first = messages[0]
+        content = [{"type": "text/plain", "value": first.text}]
+        if first.html:
+            content.append({"type": "text/html", "value": first.html})
+        return {
+            "personalizations": [{"to": [{"email": m.to}]} for m in messages],
+            "from": {"email": self.from_email},
+            "subject": first.subject,
+            "content": content,
+        }
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> DeliveryResult:
+        groups: Dict[Tuple[str, str, Optional[str]], List[EmailMessage]] = defaultdict(
+            list
+        )
+        for message in messages:
+            groups[(message.subject, message.text, message.html)].append(message)
+
+        result = DeliveryResult()
+        for group in groups.values():
+            for batch in chunked(group, SENDGRID_MAX_PERSONALIZATIONS):
+                result.merge(self._post(batch))
+        return result
+
+    def _post(self, batch: List[EmailMessage]) -> DeliveryResult:
+        import httpx
+
+        try:
+            response = self._client.post(self.api_url, json=self._build_payload(batch))
+        except httpx.TransportError as e:
+            logger.warning(f"SendGrid request failed: {str(e)}")
+            return DeliveryResult(failed=batch)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            return DeliveryResult(failed=batch)
+        if response.status_code >= 400:
+            logger.error(
+                f"SendGrid rejected {len(batch)} messages: "
+                f"{response.status_code} {response.text[:200]}"
+            )
+            return DeliveryResult(rejected=batch)
+        return DeliveryResult(sent=len(batch))
+
+
+def create_email_backend(backend: Optional[str] = None) -> BaseEmailBackend:
+    """
+    Create an email backend from settings.
+
+    Args:
+        backend: Override ``settings.EMAIL_BACKEND``
+
+    Returns:
+        New backend instance
+    """
+    backend = backend or settings.EMAIL_BACKEND
+    if backend == "sendgrid":
+        if not settings.SENDGRID_API_KEY:
+            raise EmailDeliveryError("SENDGRID_API_KEY is not configured")
+        return SendGridEmailBackend(
+            settings.SENDGRID_API_KEY,
+            api_url=settings.SENDGRID_API_URL,
+            timeout=settings.EMAIL_TIMEOUT_SECONDS,
+            from_email=settings.FROM_EMAIL,
+        )
+    if backend == "smtp":
+        if not settings.SMTP_HOST:
+            raise EmailDeliveryError("SMTP_HOST is not configured")
+        return SMTPEmailBackend(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.EMAIL_TIMEOUT_SECONDS,
+            from_email=settings.FROM_EMAIL,
+        )
+    return ConsoleEmailBackend()
+
+
+@lru_cache(maxsize=1)
+def get_email_backend() -> BaseEmailBackend:
+    """Get the process-wide email backend, so connections are reused."""
+    return create_email_backend()
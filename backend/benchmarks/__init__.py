@@ -0,0 +1,7 @@
+"""
+Offline performance benchmarks.
+
+Each module is a standalone script, run from the backend directory:
+
+    python -m benchmarks.bench_email --count 100000
+"""
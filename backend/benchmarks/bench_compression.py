@@ -0,0 +1,209 @@
+# benchmarks/bench_compression.py
+"""
+Response compression: CPU cost against bytes saved for task lists.
+
+Part 1 compresses typical ``GET /tasks`` bodies (full rows and kanban sparse
+fieldsets, several page sizes) with every available encoding and level, and
+reports compressed size, time per response and bytes saved per CPU
+millisecond. brotli and zstd rows only appear when those packages are
+installed.
+
+Part 2 serves the same list over raw ASGI through the app's middleware stack
+and compares three paths:
+
+- ``identity``: client doesn't accept compression
+- ``middleware``: compressed on every request by ``CompressionMiddleware``
+- ``cached``: served by ``conditional_response``, compressed once per entry
+
+Usage:
+    python -m benchmarks.bench_compression --sizes 20 100 1000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI, Request  # noqa: E402
+
+from app.core import compression  # noqa: E402
+from app.core.cache import (  # noqa: E402
+    Validator,
+    conditional_response,
+    response_cache,
+)
+from app.core.compression import CompressionMiddleware  # noqa: E402
+from app.core.middleware import ConditionalGetMiddleware  # noqa: E402
+from app.core.responses import SchemaResponse, partial_schema  # noqa: E402
+from app.schemas import TaskResponse  # noqa: E402
+
+KANBAN_FIELDS = ("id", "title", "status", "priority", "position", "assignee_id")
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 9], "zstd": [1, 3, 9]}
+
+
+def make_tasks(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    project_id = uuid.uuid4()
+    users = [uuid.uuid4() for _ in range(10)]
+    statuses = ["todo", "in_progress", "review", "done"]
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Implement feature #{i} for the onboarding flow",
+            "description": (
+                f"Acceptance criteria for item {i}: the form validates input, "
+                "errors are shown inline and the result is persisted. "
+            )
+            * 3,
+            "status": statuses[i % 4],
+            "priority": ("low", "medium", "high")[i % 3],
+            "due_date": now + timedelta(days=i % 30) if i % 2 else None,
+            "project_id": project_id,
+            "creator_id": users[i % 10],
+            "assignee_id": users[(i + 3) % 10] if i % 4 else None,
+            "position": i,
+            "version": 1,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def encode_body(rows: list, fields) -> bytes:
+    schema = partial_schema(TaskResponse, fields)
+    return SchemaResponse(rows, schema).body
+
+
+def time_compress(body: bytes, encoding: str, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = compression.compress(body, encoding)
+        timings.append(time.perf_counter() - start)
+    return len(compressed), statistics.median(timings)
+
+
+def bench_encoders(sizes: list, repeat: int) -> None:
+    encodings = list(compression.STREAMS)
+    print(f"Encoders available: {', '.join(encodings)}")
+    for size in sizes:
+        rows = make_tasks(size)
+        for shape, fields in (("full", None), ("kanban", KANBAN_FIELDS)):
+            body = encode_body(rows, fields)
+            print(f"\ntasks x {size} ({shape}): {len(body):,} bytes")
+            for encoding in encodings:
+                setting = {
+                    "gzip": "COMPRESSION_GZIP_LEVEL",
+                    "br": "COMPRESSION_BROTLI_LEVEL",
+                    "zstd": "COMPRESSION_ZSTD_LEVEL",
+                }[encoding]
+                default = getattr(compression.settings, setting)
+                for level in LEVELS[encoding]:
+                    setattr(compression.settings, setting, level)
+                    size_out, seconds = time_compress(body, encoding, repeat)
+                    saved = len(body) - size_out
+                    print(
+                        f"  {encoding:<4} level {level:<2} {size_out:>9,} bytes  "
+                        f"ratio {len(body) / size_out:>5.1f}  "
+                        f"{1000 * seconds:>7.3f} ms  "
+                        f"{len(body) / seconds / 1e6:>7.1f} MB/s  "
+                        f"{saved / 1024 / (1000 * seconds):>8.1f} KB saved/ms"
+                    )
+                setattr(compression.settings, setting, default)
+
+
+def build_app(rows: list) -> FastAPI:
+    app = FastAPI()
+    validator = Validator.for_resource("bench", 1, rows[0]["updated_at"])
+
+    @app.get("/tasks")
+    async def tasks():
+        return SchemaResponse(rows, TaskResponse)
+
+    @app.get("/tasks/cached")
+    async def tasks_cached(request: Request):
+        async def build():
+            return SchemaResponse(rows, TaskResponse)
+
+        return await conditional_response(request, validator, build, scope="bench")
+
+    app.add_middleware(ConditionalGetMiddleware)
+    app.add_middleware(CompressionMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str, accept_encoding: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", accept_encoding)],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def bench_endpoints(sizes: list, repeat: int) -> None:
+    preferred = compression.available_encodings()[0]
+    print(f"\n🌐 Through the middleware stack (client accepts {preferred})")
+    for size in sizes:
+        response_cache.clear()
+        app = build_app(make_tasks(size))
+        print(f"\ntasks x {size}")
+        baseline = None
+        for mode, path, accept in (
+            ("identity", "/tasks", b"identity"),
+            ("middleware", "/tasks", preferred.encode()),
+            ("cached", "/tasks/cached", preferred.encode()),
+        ):
+            body = await call(app, path, accept)  # warm-up, fills the cache
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await call(app, path, accept)
+                timings.append(time.perf_counter() - start)
+            median_ms = 1000 * statistics.median(timings)
+            baseline = baseline or median_ms
+            print(
+                f"  {mode:<12} {median_ms:>8.3f} ms  x{baseline / median_ms:>5.2f}  "
+                f"({len(body):,} bytes on the wire)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response compression benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    print("🗜️  Compression cost vs bytes saved (median per response)\n")
+    bench_encoders(args.sizes, args.repeat)
+    asyncio.run(bench_endpoints(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
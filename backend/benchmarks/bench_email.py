@@ -0,0 +1,127 @@
+# benchmarks/bench_email.py
+"""
+Email throughput benchmark against the local sinks.
+
+Compares one connection/request per message with the pooled SMTP connection
+and batched SendGrid requests used by the Celery tasks. Naive modes run on a
+smaller sample and are reported as emails per second.
+
+Usage:
+    python -m benchmarks.bench_email --count 100000 --naive-count 2000
+"""
+
+import argparse
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.utils.email import (  # noqa: E402
+    SendGridEmailBackend,
+    SMTPEmailBackend,
+    build_digests,
+    chunked,
+    render_bulk,
+)
+from benchmarks.email_sink import EmailSink  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _report(name: str, count: int, elapsed: float, sink_count: int):
+    rate = count / elapsed if elapsed else float("inf")
+    print(
+        f"{name:<28} {count:>8} emails  {elapsed:>8.2f}s  {rate:>10.0f}/s  (sink: {sink_count})"
+    )
+
+
+def bench_smtp(sink: EmailSink, messages, batch_size: int, pooled: bool):
+    before = sink.smtp_stats.messages
+    start = time.perf_counter()
+    if pooled:
+        backend = SMTPEmailBackend("127.0.0.1", sink.smtp_port, use_tls=False)
+        for batch in chunked(messages, batch_size):
+            backend.send_messages(batch)
+        backend.close()
+    else:
+        for message in messages:
+            backend = SMTPEmailBackend("127.0.0.1", sink.smtp_port, use_tls=False)
+            backend.send_messages([message])
+            backend.close()
+    _report(
+        f"smtp {'pooled' if pooled else 'per-message'}",
+        len(messages),
+        time.perf_counter() - start,
+        sink.smtp_stats.messages - before,
+    )
+
+
+def bench_sendgrid(sink: EmailSink, messages, batch_size: int, batched: bool):
+    url = f"http://127.0.0.1:{sink.http_port}/v3/mail/send"
+    backend = SendGridEmailBackend("benchmark", api_url=url)
+    before = sink.http_stats.messages
+    start = time.perf_counter()
+    if batched:
+        for batch in chunked(messages, batch_size):
+            backend.send_messages(batch)
+    else:
+        for message in messages:
+            backend.send_messages([message])
+    _report(
+        f"sendgrid {'batched' if batched else 'per-message'}",
+        len(messages),
+        time.perf_counter() - start,
+        sink.http_stats.messages - before,
+    )
+    backend.close()
+
+
+def bench_render(count: int):
+    start = time.perf_counter()
+    items = [
+        (
+            f"user{i % (count // 10 or 1)}@example.com",
+            {"title": f"Task {i}", "link": f"/tasks/{i}"},
+        )
+        for i in range(count)
+    ]
+    digests = build_digests(items)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'digest render':<28} {count:>8} items   {elapsed:>8.2f}s  -> {len(digests)} digests"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Email throughput benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--naive-count", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    sink = EmailSink(smtp_port=_free_port(), http_port=_free_port())
+    sink.start_in_thread()
+
+    recipients = [f"user{i}@example.com" for i in range(args.count)]
+    messages = render_bulk(
+        "task_assigned",
+        recipients,
+        {"actor": "Benchmark", "task_title": "Load test", "link": "/tasks/1"},
+    )
+
+    print(f"📨 Email benchmark: {args.count} emails, batch size {args.batch_size}\n")
+    bench_render(args.count)
+    bench_smtp(sink, messages[: args.naive_count], args.batch_size, pooled=False)
+    bench_smtp(sink, messages, args.batch_size, pooled=True)
+    bench_sendgrid(sink, messages[: args.naive_count], args.batch_size, batched=False)
+    bench_sendgrid(sink, messages, args.batch_size, batched=True)
+
+
+if __name__ == "__main__":
+    main()
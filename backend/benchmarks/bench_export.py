@@ -0,0 +1,208 @@
+# benchmarks/bench_export.py
+"""
+Project export benchmark: throughput and memory of streaming exports.
+
+Seeds one project with ``--tasks`` tasks (server-side ``generate_series``, so
+seeding doesn't go through Python), then streams the export through
+``ExportService`` while sampling the process RSS after every chunk. The run
+fails if RSS grows more than ``--rss-budget-mb`` over the level measured
+after the first chunk, i.e. if memory grows with the number of rows.
+
+``--offset-rows`` additionally pages through the same tasks with
+``get_multi`` offset/limit for comparison.
+
+Needs a PostgreSQL database (``DATABASE_URL``).
+
+Usage:
+    python -m benchmarks.bench_export --tasks 1000000 --format csv
+    python -m benchmarks.bench_export --tasks 100000 --offset-rows 50000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import func, select, text  # noqa: E402
+
+from app.db.session import (  # noqa: E402
+    create_tables,
+    dispose_engine,
+    get_sessionmaker,
+)
+from app.models import Project, Task, User  # noqa: E402
+from app.repositories import (  # noqa: E402
+    CommentRepository,
+    ProjectRepository,
+    TaskRepository,
+)
+from app.services.export_service import (  # noqa: E402
+    ExportFormat,
+    ExportResource,
+    ExportService,
+)
+
+BENCH_NAMESPACE = uuid.UUID("6f1c7d1e-3f7b-4b43-9a59-0d5b0e7f2a10")
+USER_ID = uuid.uuid5(BENCH_NAMESPACE, "user")
+PROJECT_ID = uuid.uuid5(BENCH_NAMESPACE, "project")
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB (Linux)."""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+async def seed(task_count: int) -> None:
+    await create_tables()
+    async with get_sessionmaker()() as db:
+        existing = await db.scalar(
+            select(func.count()).select_from(Task).where(Task.project_id == PROJECT_ID)
+        )
+        if existing == task_count:
+            print(f"🌱 Reusing {existing} seeded tasks")
+            return
+
+        print(f"🌱 Seeding {task_count} tasks...")
+        start = time.perf_counter()
+        await db.execute(
+            text("DELETE FROM tasks WHERE project_id = :p"), {"p": PROJECT_ID}
+        )
+        if not await db.get(User, USER_ID):
+            db.add(
+                User(id=USER_ID, email="export-bench@example.com", hashed_password="x")
+            )
+            await db.flush()
+        if not await db.get(Project, PROJECT_ID):
+            db.add(Project(id=PROJECT_ID, name="Export benchmark", owner_id=USER_ID))
+            await db.flush()
+        await db.execute(
+            text("""
+                INSERT INTO tasks (id, title, description, status, priority,
+                                   position, project_id, creator_id,
+                                   created_at, updated_at)
+                SELECT gen_random_uuid(), 'Task ' || n,
+                       repeat('Lorem ipsum dolor sit amet ', 4),
+                       (ARRAY['todo','in_progress','review','done'])[n % 4 + 1],
+                       (ARRAY['low','medium','high','urgent'])[n % 4 + 1],
+                       n, CAST(:project_id AS uuid), CAST(:user_id AS uuid),
+                       now(), now()
+                FROM generate_series(1, :count) AS n
+                """),
+            {"project_id": PROJECT_ID, "user_id": USER_ID, "count": task_count},
+        )
+        await db.commit()
+        print(f"   done in {time.perf_counter() - start:.1f}s")
+
+
+async def bench_stream(
+    export_format: ExportFormat, batch_size: int, rss_budget_mb: float
+) -> bool:
+    service = ExportService(ProjectRepository(), TaskRepository(), CommentRepository())
+    chunks = 0
+    total_bytes = 0
+    baseline_rss = None
+    peak_rss = 0.0
+
+    start = time.perf_counter()
+    async for chunk in service.stream_export(
+        PROJECT_ID, ExportResource.TASKS, export_format, batch_size=batch_size
+    ):
+        chunks += 1
+        total_bytes += len(chunk)
+        current = rss_mb()
+        # The first data chunk sets the baseline (header chunk for CSV excluded)
+        if baseline_rss is None and chunks >= (
+            2 if export_format == ExportFormat.CSV else 1
+        ):
+            baseline_rss = current
+        peak_rss = max(peak_rss, current)
+    elapsed = time.perf_counter() - start
+
+    rows = await _task_count()
+    growth = peak_rss - (baseline_rss or peak_rss)
+    ok = growth <= rss_budget_mb
+    print(
+        f"{'✅' if ok else '❌'} stream {export_format.value:<6} {rows:>9} rows  "
+        f"{elapsed:>7.2f}s  {rows / elapsed:>9.0f} rows/s  "
+        f"{total_bytes / elapsed / 1e6:>6.1f} MB/s"
+    )
+    print(
+        f"   RSS baseline {baseline_rss or 0:.1f} MB, peak {peak_rss:.1f} MB, "
+        f"growth {growth:.1f} MB (budget {rss_budget_mb:.0f} MB)"
+    )
+    return ok
+
+
+async def bench_offset(rows: int, page_size: int) -> None:
+    repository = TaskRepository()
+    fetched = 0
+    peak_rss = rss_mb()
+    start = time.perf_counter()
+    async with get_sessionmaker()() as db:
+        while fetched < rows:
+            page = await repository.get_multi(
+                db,
+                skip=fetched,
+                limit=page_size,
+                filters={"project_id": PROJECT_ID},
+                order_by="created_at",
+            )
+            if not page:
+                break
+            fetched += len(page)
+            peak_rss = max(peak_rss, rss_mb())
+    elapsed = time.perf_counter() - start
+    print(
+        f"   offset paging {fetched:>9} rows  {elapsed:>7.2f}s  "
+        f"{fetched / elapsed:>9.0f} rows/s  (peak RSS {peak_rss:.1f} MB)"
+    )
+
+
+async def _task_count() -> int:
+    async with get_sessionmaker()() as db:
+        return await db.scalar(
+            select(func.count()).select_from(Task).where(Task.project_id == PROJECT_ID)
+        )
+
+
+async def run(args) -> bool:
+    try:
+        await seed(args.tasks)
+        ok = await bench_stream(
+            ExportFormat(args.format), args.batch_size, args.rss_budget_mb
+        )
+        if args.offset_rows:
+            await bench_offset(args.offset_rows, args.batch_size)
+        return ok
+    finally:
+        await dispose_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming export benchmark")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--rss-budget-mb", type=float, default=64)
+    parser.add_argument(
+        "--offset-rows",
+        type=int,
+        default=0,
+        help="Also page this many rows with get_multi offset/limit",
+    )
+    args = parser.parse_args()
+
+    print(f"📦 Export benchmark: {args.tasks} tasks as {args.format}\n")
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
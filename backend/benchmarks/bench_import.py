@@ -0,0 +1,205 @@
+# benchmarks/bench_import.py
+"""
+Bulk task import throughput in rows per second.
+
+Generates ``--rows`` task rows as CSV and NDJSON (a share of them invalid or
+with unknown assignees) and measures:
+
+- parse + validate: the CPU-bound part of the pipeline, no database needed
+- full import through ``ImportService`` (COPY + INSERT ... SELECT)
+- an ORM ``add_all`` + commit baseline on ``--orm-rows`` rows
+
+Database modes need PostgreSQL (``DATABASE_URL``); run with ``--no-db`` to
+only measure parsing and validation.
+
+Usage:
+    python -m benchmarks.bench_import --rows 200000
+    python -m benchmarks.bench_import --rows 100000 --no-db
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import delete  # noqa: E402
+
+from app.db.session import (  # noqa: E402
+    create_tables,
+    dispose_engine,
+    get_sessionmaker,
+)
+from app.models import Project, Task, User  # noqa: E402
+from app.repositories import TaskRepository, UserRepository  # noqa: E402
+from app.services.import_service import (  # noqa: E402
+    ImportFormat,
+    ImportService,
+    iter_csv_rows,
+    iter_lines,
+    iter_ndjson_rows,
+)
+
+BENCH_NAMESPACE = uuid.UUID("1b5f3c8e-8a0f-4f55-9d65-55f1d6a0c3b2")
+PROJECT_ID = uuid.uuid5(BENCH_NAMESPACE, "project")
+ASSIGNEES = [f"import-bench-{i}@example.com" for i in range(20)]
+FIELDS = ["title", "description", "status", "priority", "due_date", "assignee_email"]
+
+
+def make_rows(count: int) -> list:
+    statuses = ["todo", "in_progress", "review", "done"]
+    rows = []
+    for i in range(count):
+        rows.append(
+            {
+                # Every 100th row fails validation, every 250th has no such user
+                "title": "" if i % 100 == 99 else f"Imported task {i}",
+                "description": "Migrated from the old tracker",
+                "status": statuses[i % 4],
+                "priority": "medium",
+                "due_date": "2030-01-01T12:00:00Z" if i % 3 else "",
+                "assignee_email": (
+                    "nobody@example.com" if i % 250 == 249 else ASSIGNEES[i % 20]
+                ),
+            }
+        )
+    return rows
+
+
+def encode(rows: list, import_format: ImportFormat) -> bytes:
+    if import_format == ImportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+async def body_stream(data: bytes, chunk_size: int = 64 * 1024):
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+def _report(name: str, rows: int, elapsed: float, extra: str = ""):
+    print(
+        f"{name:<32} {rows:>9} rows  {elapsed:>7.2f}s  {rows / elapsed:>9.0f} rows/s  {extra}"
+    )
+
+
+async def bench_validate(data: bytes, import_format: ImportFormat, rows: int):
+    service = ImportService(TaskRepository(), UserRepository())
+    email_ids = {email: uuid.uuid4() for email in ASSIGNEES}
+    parse = iter_csv_rows if import_format == ImportFormat.CSV else iter_ndjson_rows
+    failed = 0
+    start = time.perf_counter()
+    async for _, raw in parse(iter_lines(body_stream(data))):
+        _, errors = service._validate_row(raw, PROJECT_ID, email_ids)
+        failed += bool(errors)
+    _report(
+        f"parse+validate {import_format.value}",
+        rows,
+        time.perf_counter() - start,
+        f"({failed} invalid)",
+    )
+
+
+async def setup_db() -> uuid.UUID:
+    await create_tables()
+    async with get_sessionmaker()() as db:
+        creator_id = uuid.uuid5(BENCH_NAMESPACE, ASSIGNEES[0])
+        for email in ASSIGNEES:
+            user_id = uuid.uuid5(BENCH_NAMESPACE, email)
+            if not await db.get(User, user_id):
+                db.add(User(id=user_id, email=email, hashed_password="x"))
+        await db.flush()
+        if not await db.get(Project, PROJECT_ID):
+            db.add(Project(id=PROJECT_ID, name="Import benchmark", owner_id=creator_id))
+        await db.commit()
+    await clear_tasks()
+    return creator_id
+
+
+async def clear_tasks():
+    async with get_sessionmaker()() as db:
+        await db.execute(delete(Task).where(Task.project_id == PROJECT_ID))
+        await db.commit()
+
+
+async def bench_import(data: bytes, import_format: ImportFormat, creator_id, rows):
+    service = ImportService(TaskRepository(), UserRepository())
+    async with get_sessionmaker()() as db:
+        start = time.perf_counter()
+        result = await service.import_tasks(
+            db,
+            project_id=PROJECT_ID,
+            creator_id=creator_id,
+            body=body_stream(data),
+            import_format=import_format,
+        )
+        elapsed = time.perf_counter() - start
+    _report(
+        f"import {import_format.value} (COPY)",
+        rows,
+        elapsed,
+        f"({result.imported} imported, {result.failed} failed)",
+    )
+    await clear_tasks()
+
+
+async def bench_orm(count: int, creator_id):
+    async with get_sessionmaker()() as db:
+        start = time.perf_counter()
+        db.add_all(
+            Task(
+                title=f"ORM task {i}",
+                description="Migrated from the old tracker",
+                project_id=PROJECT_ID,
+                creator_id=creator_id,
+                position=i,
+            )
+            for i in range(count)
+        )
+        await db.commit()
+        _report("orm add_all baseline", count, time.perf_counter() - start)
+    await clear_tasks()
+
+
+async def run(args):
+    rows = make_rows(args.rows)
+    payloads = {fmt: encode(rows, fmt) for fmt in ImportFormat}
+
+    for fmt, data in payloads.items():
+        await bench_validate(data, fmt, args.rows)
+
+    if args.no_db:
+        return
+    try:
+        creator_id = await setup_db()
+        for fmt, data in payloads.items():
+            await bench_import(data, fmt, creator_id, args.rows)
+        if args.orm_rows:
+            await bench_orm(args.orm_rows, creator_id)
+    finally:
+        await dispose_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import benchmark")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--orm-rows", type=int, default=10_000)
+    parser.add_argument("--no-db", action="store_true")
+    args = parser.parse_args()
+
+    print(f"📥 Import benchmark: {args.rows} rows\n")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+# benchmarks/bench_load.py
+"""
+HTTP load test: a realistic traffic mix against the whole application.
+
+Virtual users (``--users``) each authenticate as one of the users generated
+by ``scripts/seed_data.py bulk`` and loop over weighted operations for
+``--duration`` seconds after a ``--warmup``:
+
+- ``board``: a project's board, card fields only
+- ``board_poll``: the board again with ``If-None-Match``, as clients polling
+  for changes do (mostly 304s)
+- ``my_tasks``: open tasks assigned to the user, by due date
+- ``task``: one task from the last board
+- ``move``: a task to another column, ``GET`` then ``PATCH`` with ``If-Match``
+- ``tombstones``: tasks deleted in the last day, for syncing clients
+- ``batch``: project, board and own tasks in one ``POST /batch``
+
+There are no login, comment, notification or WebSocket routes mounted yet:
+tokens are minted with ``create_access_token`` and those operations belong
+in ``OPERATIONS`` once the routes exist.
+
+Requests go through the ASGI app in-process (lifespan, middleware and all,
+no network) unless ``--base-url`` points at a running server; in-process the
+load generator shares the event loop with the app, so absolute throughput is
+lower than a served deployment's. Needs PostgreSQL and Redis at
+``DATABASE_URL``/``REDIS_URL``, e.g. ``docker-compose up -d postgres redis``.
+
+Reports throughput and p50/p95/p99 per operation. ``--output`` saves them as
+JSON; ``--baseline`` compares against a saved run and exits 1 when an
+operation's p95 got slower, or its throughput lower, by more than
+``--max-regression``.
+
+Usage:
+    python scripts/seed_data.py bulk --users 1000 --projects 200 --reset
+    python -m benchmarks.bench_load --users 50 --duration 60 --output load.json
+    python -m benchmarks.bench_load --users 50 --baseline load.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db.session import get_sessionmaker  # noqa: E402
+from app.main import app  # noqa: E402
+from scripts.seed_data import EMAIL_DOMAIN  # noqa: E402
+
+API = settings.API_V1_STR
+BOARD_FIELDS = "id,title,status,priority,position,assignee_id,version"
+STATUSES = ("todo", "in_progress", "review", "done")
+
+# Operation name -> relative weight in the mix
+OPERATIONS = {
+    "board": 30,
+    "board_poll": 25,
+    "my_tasks": 10,
+    "task": 12,
+    "move": 10,
+    "tombstones": 5,
+    "batch": 8,
+}
+
+# Expected under concurrent writes to the same task; not errors
+CONFLICT_STATUSES = {409, 412}
+
+
+@dataclass
+class VirtualUser:
+    user_id: str
+    project_ids: List[str]
+    rng: random.Random
+    headers: Dict[str, str]
+    # Last board seen per project: tasks to read and move, and its ETag
+    boards: Dict[str, List[dict]] = field(default_factory=dict)
+    etags: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Stats:
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: Dict[str, Dict[int, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+    recording: bool = False
+
+    def record(self, operation: str, seconds: float, status_code: int) -> None:
+        if self.recording:
+            self.latencies[operation].append(seconds)
+            self.statuses[operation][status_code] += 1
+
+    def record_failure(self, operation: str) -> None:
+        """A request that got no response (status 0 in the report)."""
+        if self.recording:
+            self.statuses[operation][0] += 1
+
+
+async def load_users(count: int, seed: int) -> List[VirtualUser]:
+    """Generated users that can see at least one project, with their projects."""
+    async with get_sessionmaker()() as db:
+        rows = (
+            await db.execute(
+                text("""
+                    SELECT u.id, array_agg(a.project_id ORDER BY a.project_id)
+                    FROM users u
+                    JOIN (
+                        SELECT owner_id AS user_id, id AS project_id
+                        FROM projects WHERE NOT is_deleted
+                        UNION
+                        SELECT user_id, project_id FROM project_members
+                    ) AS a ON a.user_id = u.id
+                    WHERE u.email LIKE :emails
+                    GROUP BY u.id
+                    ORDER BY u.id
+                    LIMIT :count
+                    """),
+                {"emails": f"%@{EMAIL_DOMAIN}", "count": count},
+            )
+        ).all()
+    return [
+        VirtualUser(
+            user_id=str(user_id),
+            project_ids=[str(project_id) for project_id in project_ids],
+            rng=random.Random(f"{seed}:{n}"),
+            headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+        )
+        for n, (user_id, project_ids) in enumerate(rows)
+    ]
+
+
+async def timed(
+    client: httpx.AsyncClient, stats: Stats, operation: str, method: str, url: str, **kw
+) -> httpx.Response:
+    start = time.perf_counter()
+    response = await client.request(method, url, **kw)
+    stats.record(operation, time.perf_counter() - start, response.status_code)
+    return response
+
+
+async def load_board(client, stats, user: VirtualUser, operation: str) -> None:
+    project_id = user.rng.choice(user.project_ids)
+    headers = dict(user.headers)
+    if operation == "board_poll" and project_id in user.etags:
+        headers["If-None-Match"] = user.etags[project_id]
+    response = await timed(
+        client,
+        stats,
+        operation,
+        "GET",
+        f"{API}/projects/{project_id}/tasks",
+        params={"fields": BOARD_FIELDS, "limit": 100},
+        headers=headers,
+    )
+    if response.status_code == 200:
+        user.boards[project_id] = response.json()
+        if "ETag" in response.headers:
+            user.etags[project_id] = response.headers["ETag"]
+
+
+def pick_task(user: VirtualUser) -> Optional[dict]:
+    boards = [tasks for tasks in user.boards.values() if tasks]
+    if not boards:
+        return None
+    return user.rng.choice(user.rng.choice(boards))
+
+
+async def run_operation(client, stats, user: VirtualUser, operation: str) -> None:
+    if operation in ("board", "board_poll"):
+        await load_board(client, stats, user, operation)
+    elif operation == "my_tasks":
+        await timed(
+            client,
+            stats,
+            operation,
+            "GET",
+            f"{API}/tasks",
+            params={
+                "assignee_id": user.user_id,
+                "status": "todo",
+                "order_by": "due_date",
+            },
+            headers=user.headers,
+        )
+    elif operation in ("task", "move"):
+        task = pick_task(user)
+        if task is None:
+            await load_board(client, stats, user, "board")
+            return
+        response = await timed(
+            client,
+            stats,
+            "task",
+            "GET",
+            f"{API}/tasks/{task['id']}",
+            headers=user.headers,
+        )
+        if operation == "move" and response.status_code == 200:
+            status = user.rng.choice([s for s in STATUSES if s != task["status"]])
+            response = await timed(
+                client,
+                stats,
+                operation,
+                "PATCH",
+                f"{API}/tasks/{task['id']}",
+                json={"status": status},
+                headers={**user.headers, "If-Match": response.headers["ETag"]},
+            )
+            if response.status_code == 200:
+                task["status"] = status
+    elif operation == "tombstones":
+        since = datetime.now(timezone.utc) - timedelta(days=1)
+        await timed(
+            client,
+            stats,
+            operation,
+            "GET",
+            f"{API}/tasks/tombstones",
+            params={"since": since.isoformat()},
+            headers=user.headers,
+        )
+    elif operation == "batch":
+        project_id = user.rng.choice(user.project_ids)
+        requests = [
+            {"path": f"/projects/{project_id}"},
+            {
+                "path": f"/projects/{project_id}/tasks",
+                "query": {"fields": BOARD_FIELDS, "limit": 100},
+            },
+            {
+                "path": "/tasks",
+                "query": {"assignee_id": user.user_id, "status": "todo"},
+            },
+        ]
+        await timed(
+            client,
+            stats,
+            operation,
+            "POST",
+            f"{API}/batch",
+            json={"requests": requests},
+            headers=user.headers,
+        )
+
+
+async def user_loop(client, stats, user, deadline: float, think_time: float) -> None:
+    names, weights = list(OPERATIONS), list(OPERATIONS.values())
+    while time.perf_counter() < deadline:
+        operation = user.rng.choices(names, weights)[0]
+        try:
+            await run_operation(client, stats, user, operation)
+        except httpx.HTTPError:
+            stats.record_failure(operation)
+        if think_time:
+            await asyncio.sleep(user.rng.expovariate(1 / think_time))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(stats: Stats, seconds: float) -> Dict[str, dict]:
+    summary = {}
+    for operation in OPERATIONS:
+        if operation not in stats.statuses:
+            continue
+        latencies = sorted(stats.latencies.get(operation, [])) or [0.0]
+        statuses = stats.statuses[operation]
+        errors = sum(
+            count
+            for code, count in statuses.items()
+            if (code >= 400 or code == 0) and code not in CONFLICT_STATUSES
+        )
+        responses = sum(statuses.values()) - statuses.get(0, 0)
+        summary[operation] = {
+            "requests": responses,
+            "throughput": responses / seconds,
+            "p50_ms": 1000 * statistics.median(latencies),
+            "p95_ms": 1000 * percentile(latencies, 0.95),
+            "p99_ms": 1000 * percentile(latencies, 0.99),
+            "max_ms": 1000 * latencies[-1],
+            "errors": errors,
+            "conflicts": sum(statuses.get(code, 0) for code in CONFLICT_STATUSES),
+            "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        }
+    return summary
+
+
+def print_summary(summary: Dict[str, dict]) -> None:
+    print(
+        f"   {'operation':<12} {'req':>7} {'req/s':>8} {'p50':>8} {'p95':>8} "
+        f"{'p99':>8} {'errors':>7}"
+    )
+    for operation, row in summary.items():
+        print(
+            f"   {operation:<12} {row['requests']:>7} {row['throughput']:>8.1f} "
+            f"{row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms {row['p99_ms']:>6.1f}ms "
+            f"{row['errors']:>7}"
+        )
+    total = sum(row["throughput"] for row in summary.values())
+    print(f"\n   total {total:.1f} req/s")
+
+
+def compare(summary: Dict[str, dict], baseline: dict, max_regression: float) -> bool:
+    """Print changes against a baseline run; False if anything regressed."""
+    ok = True
+    print(f"\n📏 Against baseline ({baseline['meta'].get('commit') or 'unknown'}):")
+    for operation, row in summary.items():
+        before = baseline["operations"].get(operation)
+        if before is None:
+            print(f"   {operation:<12} (not in baseline)")
+            continue
+        p95 = row["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        rate = (
+            row["throughput"] / before["throughput"] - 1
+            if before["throughput"]
+            else 0.0
+        )
+        regressed = p95 > max_regression or -rate > max_regression
+        ok = ok and not regressed
+        print(
+            f"   {operation:<12} p95 {p95:>+7.1%}  throughput {rate:>+7.1%}"
+            f"{'  ❌' if regressed else ''}"
+        )
+    return ok
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict[str, dict]:
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    async with app.router.lifespan_context(app):
+        users = await load_users(args.users, args.seed)
+        if not users:
+            sys.exit("No generated users with projects; run scripts/seed_data.py bulk")
+        print(f"👥 {len(users)} virtual users, {args.duration:.0f}s after warmup\n")
+
+        stats = Stats()
+        limits = httpx.Limits(max_connections=len(users))
+        async with httpx.AsyncClient(
+            transport=transport, base_url=base_url, limits=limits, timeout=30
+        ) as client:
+            start = time.perf_counter()
+            deadline = start + args.warmup + args.duration
+            loops = [
+                asyncio.create_task(
+                    user_loop(client, stats, user, deadline, args.think_time / 1000)
+                )
+                for user in users
+            ]
+            await asyncio.sleep(args.warmup)
+            stats.recording = True
+            measured_from = time.perf_counter()
+            await asyncio.gather(*loops)
+            elapsed = time.perf_counter() - measured_from
+
+    return summarize(stats, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load test")
+    parser.add_argument("--users", type=int, default=20, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Seconds")
+    parser.add_argument(
+        "--think-time", type=float, default=0, help="Mean ms between requests"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-url", help="Load a running server instead")
+    parser.add_argument("--output", type=Path, help="Save results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare with saved results")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print("🚦 HTTP load test\n")
+    summary = asyncio.run(run(args))
+    print_summary(summary)
+
+    if args.output:
+        result = {
+            "meta": {
+                "commit": git_commit(),
+                "date": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "target": args.base_url or "asgi",
+                "users": args.users,
+                "duration": args.duration,
+                "think_time_ms": args.think_time,
+                "seed": args.seed,
+            },
+            "operations": summary,
+        }
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"💾 Saved to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if not compare(summary, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
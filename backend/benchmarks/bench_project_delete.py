@@ -0,0 +1,193 @@
+# benchmarks/bench_project_delete.py
+"""
+Project deletion benchmark: request latency and batch sizes for big projects.
+
+Seeds a project with ``--tasks`` tasks, ``--comments`` comments per task and
+one notification per task (server-side ``generate_series``), then:
+
+1. Times ``mark_project_deleted``, i.e. what ``DELETE /projects/{id}`` waits
+   for before answering 202
+2. Runs the background purge and reports total time, rows per second and the
+   slowest batch, which bounds how long any lock is held
+3. With ``--compare-cascade``, reseeds and deletes the project with a single
+   ``DELETE FROM projects`` relying on ``ON DELETE CASCADE``, the one-giant-
+   transaction baseline
+
+Needs a PostgreSQL database (``DATABASE_URL``).
+
+Usage:
+    python -m benchmarks.bench_project_delete --tasks 100000 --comments 2
+    python -m benchmarks.bench_project_delete --batch-sizes 500 1000 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import delete, text  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db.session import (  # noqa: E402
+    create_tables,
+    dispose_engine,
+    get_sessionmaker,
+)
+from app.models import Project, ProjectDeletion, User  # noqa: E402
+from app.repositories import ProjectDeletionRepository  # noqa: E402
+from app.services.project_deletion_service import purge_project  # noqa: E402
+
+BENCH_NAMESPACE = uuid.UUID("0c5a1f0e-7d0b-4f0e-b3f2-3c6d2a8e9b41")
+USER_ID = uuid.uuid5(BENCH_NAMESPACE, "user")
+
+
+async def seed(project_id: uuid.UUID, task_count: int, comments: int) -> None:
+    start = time.perf_counter()
+    async with get_sessionmaker()() as db:
+        if not await db.get(User, USER_ID):
+            db.add(
+                User(id=USER_ID, email="delete-bench@example.com", hashed_password="x")
+            )
+            await db.flush()
+        db.add(Project(id=project_id, name="Delete benchmark", owner_id=USER_ID))
+        await db.flush()
+        await db.execute(
+            text("""
+                INSERT INTO tasks (id, title, status, priority, position,
+                                   project_id, creator_id, version,
+                                   created_at, updated_at)
+                SELECT gen_random_uuid(), 'Task ' || n, 'todo', 'medium', n,
+                       CAST(:project_id AS uuid), CAST(:user_id AS uuid), 1,
+                       now(), now()
+                FROM generate_series(1, :count) AS n
+                """),
+            {"project_id": project_id, "user_id": USER_ID, "count": task_count},
+        )
+        await db.execute(
+            text("""
+                INSERT INTO comments (id, content, task_id, user_id,
+                                      created_at, updated_at)
+                SELECT gen_random_uuid(), 'Comment ' || c, t.id,
+                       CAST(:user_id AS uuid), now(), now()
+                FROM tasks t, generate_series(1, :comments) AS c
+                WHERE t.project_id = :project_id
+                """),
+            {"project_id": project_id, "user_id": USER_ID, "comments": comments},
+        )
+        await db.execute(
+            text("""
+                INSERT INTO notifications (id, type, title, link, read, user_id,
+                                           created_at, updated_at)
+                SELECT gen_random_uuid(), 'task_assigned', t.title,
+                       '/tasks/' || t.id, false, CAST(:user_id AS uuid),
+                       now(), now()
+                FROM tasks t WHERE t.project_id = :project_id
+                """),
+            {"project_id": project_id, "user_id": USER_ID},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE tasks, comments, notifications"))
+    rows = task_count * (2 + comments)
+    print(f"🌱 Seeded {rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+
+class TimedRepository(ProjectDeletionRepository):
+    """Records how long every batch transaction takes."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_seconds = []
+
+    async def delete_task_batch(self, db, **kwargs):
+        start = time.perf_counter()
+        result = await super().delete_task_batch(db, **kwargs)
+        self.batch_seconds.append(time.perf_counter() - start)
+        return result
+
+
+async def bench_batched(task_count: int, comments: int, batch_size: int) -> None:
+    project_id = uuid.uuid4()
+    await seed(project_id, task_count, comments)
+
+    repository = TimedRepository()
+    async with get_sessionmaker()() as db:
+        start = time.perf_counter()
+        deletion = await repository.mark_project_deleted(
+            db, project_id=project_id, requested_by=USER_ID
+        )
+        mark_ms = 1000 * (time.perf_counter() - start)
+    print(f"   mark deleted (request path)  {mark_ms:>8.1f} ms")
+
+    start = time.perf_counter()
+    await purge_project(project_id, batch_size=batch_size, repository=repository)
+    elapsed = time.perf_counter() - start
+
+    async with get_sessionmaker()() as db:
+        deletion = await repository.get_by_project(db, project_id)
+        rows = (
+            deletion.tasks_deleted
+            + deletion.comments_deleted
+            + deletion.notifications_deleted
+        )
+        await db.execute(
+            delete(ProjectDeletion).where(ProjectDeletion.project_id == project_id)
+        )
+        await db.commit()
+
+    batches = repository.batch_seconds
+    print(
+        f"   batched purge ({batch_size:>5}/batch) {elapsed:>8.2f} s  "
+        f"{rows / elapsed:>9.0f} rows/s  {len(batches)} batches, "
+        f"median {1000 * statistics.median(batches):.1f} ms, "
+        f"max {1000 * max(batches):.1f} ms  [{deletion.status}]"
+    )
+
+
+async def bench_cascade(task_count: int, comments: int) -> None:
+    project_id = uuid.uuid4()
+    await seed(project_id, task_count, comments)
+    async with get_sessionmaker()() as db:
+        start = time.perf_counter()
+        await db.execute(delete(Project).where(Project.id == project_id))
+        await db.execute(
+            text(
+                "DELETE FROM notifications WHERE link LIKE '/tasks/%' AND user_id = :u"
+            ),
+            {"u": USER_ID},
+        )
+        await db.commit()
+        elapsed = time.perf_counter() - start
+    print(f"   single cascading DELETE      {elapsed:>8.2f} s  (one transaction)")
+
+
+async def run(args) -> None:
+    try:
+        await create_tables()
+        settings.PROJECT_DELETE_BATCH_PAUSE = 0
+        for batch_size in args.batch_sizes:
+            await bench_batched(args.tasks, args.comments, batch_size)
+        if args.compare_cascade:
+            await bench_cascade(args.tasks, args.comments)
+    finally:
+        await dispose_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project deletion benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--comments", type=int, default=1, help="Comments per task")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000])
+    parser.add_argument("--compare-cascade", action="store_true")
+    args = parser.parse_args()
+
+    print(f"🗑️  Project deletion benchmark: {args.tasks:,} tasks\n")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+# benchmarks/bench_repository.py
+"""
+Data-access microbenchmarks, tracked across commits.
+
+Times the hot operations of the repository layer at several table sizes:
+``BaseRepository`` get, filtered get_multi, get_count, create, update,
+bulk_create and bulk_delete, and ``UserRepository.search_users``. Each size
+gets its own schema, filled once by ``scripts/seed_data.py``'s generator
+and reused by later runs. Alongside, without a database:
+``UserResponse.model_validate`` over lists of users (and a list
+``TypeAdapter`` for reference), and JWT create/verify.
+
+Every benchmark runs ``--rounds`` timed rounds after a warmup; fast ones
+repeat the call within a round, calibrated to ~5 ms. Reported per
+benchmark: min, median, mean, stddev and operations per second (from the
+median), like pytest-benchmark.
+
+``--save`` stores the run as ``benchmarks/results/<commit>.json`` (with
+``-dirty`` for uncommitted changes); ``--compare REF`` compares the run with
+the saved results of a commit (or a JSON file) and exits 1 when a median got
+slower by more than ``--max-regression``. ``--diff OLD NEW`` compares two
+saved runs without running anything.
+
+Needs a PostgreSQL database (``DATABASE_URL``) unless ``--no-db``.
+
+Usage:
+    python -m benchmarks.bench_repository --sizes 1000 100000 --save
+    python -m benchmarks.bench_repository --no-db --compare HEAD~1
+    python -m benchmarks.bench_repository --diff 1a2b3c4 5d6e7f8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+from sqlalchemy import delete, func, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import (  # noqa: E402
+    create_access_token,
+    get_user_id_from_token,
+)
+from app.db import Base  # noqa: E402
+from app.models import User  # noqa: E402
+from app.repositories import UserRepository  # noqa: E402
+from app.schemas import UserResponse  # noqa: E402
+from scripts.seed_data import BulkConfig, Dataset, generate  # noqa: E402
+
+BENCH_NAMESPACE = uuid.UUID("4b1e9c2d-8f3a-4e6b-9d07-5a2c8e1f6b93")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+BULK_SIZE = 100
+# Fast benchmarks repeat the call until a round takes about this long
+ROUND_SECONDS = 0.005
+# Emails of rows benchmarks create; removed after each size
+CREATED_EMAILS = "bench-%@example.com"
+
+
+class UserRow(BaseModel):
+    """Column values of a created user (UserCreate carries a password)."""
+
+    email: str
+    hashed_password: str = "x"
+    full_name: Optional[str] = None
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    median = statistics.median(times)
+    return {
+        "min": min(times),
+        "median": median,
+        "mean": statistics.fmean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": len(times),
+        "ops": 1 / median if median else 0.0,
+    }
+
+
+def measure_sync(call: Callable[[], Any], rounds: int) -> List[float]:
+    """Seconds per call, over rounds of calibrated length."""
+    start = time.perf_counter()
+    call()
+    iterations = max(1, int(ROUND_SECONDS / (time.perf_counter() - start or 1e-9)))
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        times.append((time.perf_counter() - start) / iterations)
+    return times
+
+
+async def measure(
+    call: Callable[..., Awaitable[Any]],
+    rounds: int,
+    setup: Optional[Callable[[], Awaitable[tuple]]] = None,
+) -> List[float]:
+    """Seconds per awaited call; ``setup`` builds each call's arguments untimed."""
+    times = []
+    for round_ in range(rounds + 1):
+        args = await setup() if setup else ()
+        start = time.perf_counter()
+        await call(*args)
+        if round_:  # the first call warms up caches and prepared statements
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def make_users(count: int) -> List[User]:
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id=uuid.uuid5(BENCH_NAMESPACE, str(i)),
+            email=f"user{i}@example.com",
+            hashed_password="x",
+            full_name=f"User {i}",
+            avatar_url=None,
+            is_active=True,
+            is_superuser=False,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def bench_cpu(list_sizes: List[int], rounds: int) -> Dict[str, dict]:
+    results = {}
+    adapter = TypeAdapter(List[UserResponse])
+    for size in list_sizes:
+        users = make_users(size)
+        results[f"UserResponse.model_validate[{size}]"] = summarize(
+            measure_sync(
+                lambda: [UserResponse.model_validate(user) for user in users], rounds
+            )
+        )
+        results[f"TypeAdapter(list[UserResponse])[{size}]"] = summarize(
+            measure_sync(lambda: adapter.validate_python(users), rounds)
+        )
+
+    token = create_access_token(uuid.uuid5(BENCH_NAMESPACE, "token"))
+    results["jwt.create_access_token"] = summarize(
+        measure_sync(lambda: create_access_token(uuid.uuid4()), rounds)
+    )
+    results["jwt.get_user_id_from_token"] = summarize(
+        measure_sync(lambda: get_user_id_from_token(token), rounds)
+    )
+    return results
+
+
+async def prepare_schema(size: int) -> str:
+    """Schema with ``size`` generated users, reused when already filled."""
+    schema = f"bench_repository_{size}"
+    engine = create_async_engine(
+        settings.get_database_url_async(),
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            await connection.run_sync(Base.metadata.create_all)
+            existing = await connection.scalar(select(func.count()).select_from(User))
+        if existing == size:
+            print(f"🌱 Reusing {size:,} users in {schema}")
+            return schema
+        print(f"🌱 Generating {size:,} users in {schema}...")
+        await generate(
+            settings.DATABASE_URL,
+            BulkConfig(
+                users=size,
+                projects=0,
+                notifications_per_user=0,
+                workers=os.cpu_count() or 1,
+            ),
+            schema=schema,
+            reset=True,
+        )
+    finally:
+        await engine.dispose()
+    return schema
+
+
+async def bench_db(size: int, rounds: int) -> Dict[str, dict]:
+    schema = await prepare_schema(size)
+    engine = create_async_engine(
+        settings.get_database_url_async(),
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    repository = UserRepository()
+    dataset = Dataset(BulkConfig(users=size))
+    counter = iter(range(sys.maxsize))
+    results = {}
+
+    def new_row() -> UserRow:
+        return UserRow(email=f"bench-{next(counter)}@example.com", full_name="Bench")
+
+    async def bulk_ids(db: AsyncSession) -> tuple:
+        users = await repository.bulk_create(
+            db, objects_in=[new_row() for _ in range(BULK_SIZE)]
+        )
+        return (db, [user.id for user in users])
+
+    try:
+        async with sessionmaker() as db:
+            user_id = dataset.user_id(size // 2)
+            user = await repository.get(db, user_id)
+            cases = {
+                "get": (lambda: repository.get(db, user_id), None),
+                "get_multi(filters)": (
+                    lambda: repository.get_multi(
+                        db, filters={"is_active": True}, order_by="email", limit=50
+                    ),
+                    None,
+                ),
+                "get_count": (
+                    lambda: repository.get_count(db, filters={"is_active": True}),
+                    None,
+                ),
+                "search_users": (
+                    lambda: repository.search_users(db, f"user{size // 3}"),
+                    None,
+                ),
+                "create": (lambda: repository.create(db, obj_in=new_row()), None),
+                "update": (
+                    lambda: repository.update(
+                        db, db_obj=user, obj_in={"full_name": f"Bench {next(counter)}"}
+                    ),
+                    None,
+                ),
+                f"bulk_create[{BULK_SIZE}]": (
+                    lambda: repository.bulk_create(
+                        db, objects_in=[new_row() for _ in range(BULK_SIZE)]
+                    ),
+                    None,
+                ),
+                f"bulk_delete[{BULK_SIZE}]": (
+                    lambda db, ids: repository.bulk_delete(db, ids=ids),
+                    lambda: bulk_ids(db),
+                ),
+            }
+            for name, (call, setup) in cases.items():
+                times = await measure(call, rounds, setup)
+                results[f"{name}[{size}]"] = summarize(times)
+            await db.execute(delete(User).where(User.email.like(CREATED_EMAILS)))
+            await db.commit()
+    finally:
+        await engine.dispose()
+    return results
+
+
+def print_results(results: Dict[str, dict]) -> None:
+    print(
+        f"   {'benchmark':<44} {'min':>10} {'median':>10} {'mean':>10} "
+        f"{'stddev':>10} {'ops/s':>10}"
+    )
+    for name, row in results.items():
+        print(
+            f"   {name:<44} {format_time(row['min']):>10} "
+            f"{format_time(row['median']):>10} {format_time(row['mean']):>10} "
+            f"{format_time(row['stddev']):>10} {row['ops']:>10,.0f}"
+        )
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def current_commit() -> str:
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    return f"{commit}-dirty" if git("status", "--porcelain", "--", ".") else commit
+
+
+def load_results(ref: str) -> dict:
+    """Saved results by file path or by commit (anything git rev-parse takes)."""
+    path = Path(ref)
+    if not path.is_file():
+        commit = git("rev-parse", "--short", ref) or ref
+        path = RESULTS_DIR / f"{commit}.json"
+    if not path.is_file():
+        sys.exit(f"No saved results for {ref} ({path}); run with --save there")
+    return json.loads(path.read_text())
+
+
+def compare(new: dict, old: dict, max_regression: float) -> bool:
+    """Print median changes from ``old`` to ``new``; False if anything regressed."""
+    ok = True
+    print(f"\n📏 {old['meta']['commit']} → {new['meta']['commit']} (median):")
+    for name, row in new["benchmarks"].items():
+        before = old["benchmarks"].get(name)
+        if before is None:
+            print(f"   {name:<44} (new)")
+            continue
+        change = row["median"] / before["median"] - 1
+        regressed = change > max_regression
+        ok = ok and not regressed
+        print(
+            f"   {name:<44} {format_time(before['median']):>10} → "
+            f"{format_time(row['median']):>10} {change:>+8.1%}"
+            f"{'  ❌' if regressed else ''}"
+        )
+    return ok
+
+
+async def run(args) -> Dict[str, dict]:
+    print("🧮 Schemas and JWT")
+    results = bench_cpu(args.list_sizes, args.rounds)
+    if not args.no_db:
+        for size in args.sizes:
+            print(f"🗄️  Repository at {size:,} users")
+            results.update(await bench_db(size, args.rounds))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Data-access microbenchmarks")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 100_000], help="Users"
+    )
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--no-db", action="store_true", help="Skip the repository")
+    parser.add_argument("--save", action="store_true", help="Save under the commit")
+    parser.add_argument("--compare", metavar="REF", help="Commit or results file")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--max-regression", type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.diff:
+        old, new = (load_results(ref) for ref in args.diff)
+        sys.exit(0 if compare(new, old, args.max_regression) else 1)
+
+    print("⏱️  Data-access microbenchmarks\n")
+    benchmarks = asyncio.run(run(args))
+    print()
+    print_results(benchmarks)
+    result = {
+        "meta": {
+            "commit": current_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rounds": args.rounds,
+        },
+        "benchmarks": benchmarks,
+    }
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{result['meta']['commit']}.json"
+        path.write_text(json.dumps(result, indent=2))
+        print(f"\n💾 Saved to {path}")
+
+    if args.compare:
+        if not compare(result, load_results(args.compare), args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
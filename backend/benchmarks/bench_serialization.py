@@ -0,0 +1,201 @@
+# benchmarks/bench_serialization.py
+"""
+List endpoint serialization benchmark.
+
+Serves in-memory ORM rows through a FastAPI app and calls it over raw ASGI, so
+the numbers cover the whole route (response model handling, encoding, headers)
+without network or database noise. Compared paths:
+
+- ``model_validate``: service returns ``[Schema.model_validate(row)]`` and
+  FastAPI validates again via ``response_model`` and encodes with ``json``
+- ``response_model+orjson``: same, with the app's default ``JSONResponse``
+- ``SchemaResponse(validate)``: one ``TypeAdapter`` pass straight to bytes
+- ``SchemaResponse``: trusted rows read into dicts, encoded by orjson
+
+Every path must produce the same JSON document.
+
+Usage:
+    python -m benchmarks.bench_serialization --sizes 100 1000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse as StdlibJSONResponse  # noqa: E402
+
+from app.core.responses import JSONResponse, SchemaResponse  # noqa: E402
+from app.models import Project, Task, User  # noqa: E402
+from app.schemas import TaskWithRelations, UserResponse  # noqa: E402
+
+
+def make_users(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id=uuid.uuid4(),
+            email=f"user{i}@example.com",
+            hashed_password="x",
+            full_name=f"User {i}",
+            avatar_url=None,
+            is_active=True,
+            is_superuser=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_tasks(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    users = make_users(10)
+    project = Project(
+        id=uuid.uuid4(), name="Benchmark", status="active", owner_id=users[0].id
+    )
+    tasks = []
+    for i in range(count):
+        creator, assignee = users[i % 10], users[(i + 3) % 10] if i % 4 else None
+        tasks.append(
+            Task(
+                id=uuid.uuid4(),
+                title=f"Task {i}",
+                description="Lorem ipsum dolor sit amet " * 4,
+                status="todo",
+                priority="medium",
+                position=i,
+                version=1,
+                project_id=project.id,
+                creator_id=creator.id,
+                assignee_id=assignee.id if assignee else None,
+                due_date=now + timedelta(days=i % 30),
+                created_at=now,
+                updated_at=now,
+                creator=creator,
+                assignee=assignee,
+                project=project,
+            )
+        )
+    return tasks
+
+
+def build_app(rows: dict) -> FastAPI:
+    app = FastAPI()
+
+    for name, schema in (("users", UserResponse), ("tasks", TaskWithRelations)):
+        items = rows[name]
+
+        def endpoints(items=items, schema=schema):
+            async def validated():
+                return [schema.model_validate(item) for item in items]
+
+            async def adapter():
+                return SchemaResponse(items, schema, validate=True)
+
+            async def trusted():
+                return SchemaResponse(items, schema)
+
+            return validated, adapter, trusted
+
+        validated, adapter, trusted = endpoints()
+        app.get(
+            f"/{name}/model_validate",
+            response_model=list[schema],
+            response_class=StdlibJSONResponse,
+        )(validated)
+        app.get(
+            f"/{name}/response_model+orjson",
+            response_model=list[schema],
+            response_class=JSONResponse,
+        )(validated)
+        app.get(f"/{name}/SchemaResponse(validate)")(adapter)
+        app.get(f"/{name}/SchemaResponse")(trusted)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def bench(sizes: list, repeat: int) -> None:
+    modes = [
+        "model_validate",
+        "response_model+orjson",
+        "SchemaResponse(validate)",
+        "SchemaResponse",
+    ]
+    for size in sizes:
+        app = build_app({"users": make_users(size), "tasks": make_tasks(size)})
+        for resource in ("users", "tasks"):
+            print(f"\n{resource} x {size}")
+            expected = None
+            baseline = None
+            for mode in modes:
+                path = f"/{resource}/{mode}"
+                body = await call(app, path)  # warm-up, and correctness check
+                document = json.loads(body)
+                if expected is None:
+                    expected = document
+                elif document != expected:
+                    raise AssertionError(f"{path} returned a different document")
+
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    await call(app, path)
+                    timings.append(time.perf_counter() - start)
+                median_ms = 1000 * statistics.median(timings)
+                baseline = baseline or median_ms
+                print(
+                    f"  {mode:<26} {median_ms:>8.2f} ms  "
+                    f"{size / median_ms * 1000:>10.0f} items/s  "
+                    f"x{baseline / median_ms:>5.1f}  ({len(body)} bytes)"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List serialization benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    print("⏱️  List endpoint serialization (median per request)")
+    asyncio.run(bench(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# benchmarks/bench_startup.py
+"""
+Import-time budget for the application entry points.
+
+Each entry point is imported in a fresh interpreter with ``python -X importtime``.
+Time spent in interpreter start-up (``site``, ``encodings``, ...) is excluded
+by subtracting the modules an empty interpreter already loads. The median over
+``--runs`` is compared with the budget, and entry points must not pull in
+modules they have no use for (e.g. asyncpg before the engine is first used).
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 7 --top 15 --json startup.json
+
+Exits with status 1 when any entry point is over budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class EntryPoint:
+    name: str
+    code: str
+    budget_ms: float
+    forbidden: Set[str] = field(default_factory=set)
+
+
+ENTRY_POINTS = [
+    EntryPoint(
+        "settings",
+        "import app.core.config",
+        budget_ms=300,
+        forbidden={"sqlalchemy", "fastapi", "celery"},
+    ),
+    EntryPoint(
+        "models (alembic, seed_data)",
+        "import app.models",
+        budget_ms=600,
+        forbidden={"fastapi", "asyncpg", "celery", "httpx"},
+    ),
+    EntryPoint(
+        "celery worker cold start",
+        "from app.tasks.celery_app import celery; "
+        "celery.loader.import_default_modules()",
+        budget_ms=900,
+        forbidden={"fastapi", "asyncpg", "httpx", "jinja2"},
+    ),
+    EntryPoint(
+        "api worker boot",
+        "import app.main",
+        budget_ms=1500,
+        forbidden={"asyncpg", "httpx", "jinja2"},
+    ),
+]
+
+
+@dataclass
+class Measurement:
+    name: str
+    median_ms: float
+    runs_ms: List[float]
+    budget_ms: float
+    heaviest: List[Tuple[str, float]]
+    forbidden_loaded: List[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.median_ms <= self.budget_ms and not self.forbidden_loaded
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, str, float, float]]:
+    """Parse ``-X importtime`` output into (depth, module, self_us, cumulative_us)."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), float(self_us), float(cumulative_us)))
+    return entries
+
+
+def _run(code: str) -> List[Tuple[int, str, float, float]]:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing failed:\n{result.stderr[-2000:]}")
+    return _parse_importtime(result.stderr)
+
+
+def measure(entry: EntryPoint, runs: int, top: int, baseline: Set[str]) -> Measurement:
+    totals = []
+    for _ in range(runs):
+        entries = _run(entry.code)
+        totals.append(
+            sum(
+                cumulative
+                for depth, name, _, cumulative in entries
+                if depth == 0 and name not in baseline
+            )
+            / 1000
+        )
+
+    loaded = {name for _, name, _, _ in entries}
+    self_times: Dict[str, float] = {}
+    for _, name, self_us, _ in entries:
+        if name not in baseline:
+            package = name.split(".")[0]
+            self_times[package] = self_times.get(package, 0.0) + self_us / 1000
+
+    return Measurement(
+        name=entry.name,
+        median_ms=round(statistics.median(totals), 1),
+        runs_ms=[round(t, 1) for t in totals],
+        budget_ms=entry.budget_ms,
+        heaviest=sorted(self_times.items(), key=lambda item: -item[1])[:top],
+        forbidden_loaded=sorted(
+            module for module in entry.forbidden if module in loaded
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget check")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget, e.g. for slower CI machines",
+    )
+    args = parser.parse_args()
+
+    # Warm the bytecode cache once so runs measure imports, not compilation
+    subprocess.run(
+        [sys.executable, "-m", "compileall", "-q", "app"], cwd=BACKEND_DIR, check=True
+    )
+    baseline = {name for _, name, _, _ in _run("pass")}
+
+    results = []
+    for entry in ENTRY_POINTS:
+        entry.budget_ms *= args.scale
+        result = measure(entry, args.runs, args.top, baseline)
+        results.append(result)
+
+        status = "✅" if result.ok else "❌"
+        print(
+            f"{status} {result.name:<30} {result.median_ms:>8.1f} ms "
+            f"(budget {result.budget_ms:.0f} ms)"
+        )
+        for package, self_ms in result.heaviest:
+            print(f"      {package:<28} {self_ms:>8.1f} ms")
+        if result.forbidden_loaded:
+            print(f"      unexpected imports: {', '.join(result.forbidden_loaded)}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([{**asdict(r), "ok": r.ok} for r in results], indent=2)
+        )
+
+    sys.exit(0 if all(r.ok for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
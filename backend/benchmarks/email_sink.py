@@ -0,0 +1,189 @@
+# benchmarks/email_sink.py
+"""
+Local SMTP and SendGrid-compatible HTTP sinks.
+
+Both sinks accept and count messages without delivering them, so the email
+backends can be exercised and benchmarked offline. ``--fail-rate`` makes the
+HTTP sink answer a share of requests with 503 to exercise retries.
+
+Usage:
+    python -m benchmarks.email_sink --smtp-port 2525 --http-port 8025
+
+    SMTP_HOST=localhost SMTP_PORT=2525 SMTP_USE_TLS=false ...
+    SENDGRID_API_KEY=test SENDGRID_API_URL=http://localhost:8025/v3/mail/send ...
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class SinkStats:
+    messages: int = 0
+    requests: int = 0
+    connections: int = 0
+
+
+class SMTPSinkProtocol(asyncio.Protocol):
+    """Just enough SMTP to accept ``smtplib`` traffic."""
+
+    def __init__(self, stats: SinkStats):
+        self.stats = stats
+        self.buffer = b""
+        self.in_data = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.stats.connections += 1
+        transport.write(b"220 sink ESMTP\r\n")
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        while True:
+            if self.in_data:
+                end = self.buffer.find(b"\r\n.\r\n")
+                if end == -1:
+                    return
+                self.buffer = self.buffer[end + 5 :]
+                self.in_data = False
+                self.stats.messages += 1
+                self.transport.write(b"250 OK queued\r\n")
+                continue
+
+            end = self.buffer.find(b"\r\n")
+            if end == -1:
+                return
+            line, self.buffer = self.buffer[:end], self.buffer[end + 2 :]
+            self._handle(line[:4].upper())
+
+    def _handle(self, command: bytes):
+        if command == b"EHLO":
+            self.transport.write(b"250-sink\r\n250 8BITMIME\r\n")
+        elif command == b"DATA":
+            self.in_data = True
+            self.transport.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+        elif command == b"QUIT":
+            self.transport.write(b"221 Bye\r\n")
+            self.transport.close()
+        else:
+            # HELO, MAIL, RCPT, RSET, NOOP
+            self.transport.write(b"250 OK\r\n")
+
+
+class HTTPSinkProtocol(asyncio.Protocol):
+    """Keep-alive HTTP/1.1 server that answers like SendGrid's mail/send."""
+
+    def __init__(self, stats: SinkStats, fail_rate: float = 0.0):
+        self.stats = stats
+        self.fail_rate = fail_rate
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.stats.connections += 1
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        while True:
+            header_end = self.buffer.find(b"\r\n\r\n")
+            if header_end == -1:
+                return
+            headers = self.buffer[:header_end].decode("latin-1").split("\r\n")
+            length = 0
+            for header in headers[1:]:
+                name, _, value = header.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+            body_end = header_end + 4 + length
+            if len(self.buffer) < body_end:
+                return
+            body, self.buffer = (
+                self.buffer[header_end + 4 : body_end],
+                self.buffer[body_end:],
+            )
+            self._respond(body)
+
+    def _respond(self, body: bytes):
+        self.stats.requests += 1
+        if self.fail_rate and random.random() < self.fail_rate:
+            self.transport.write(
+                b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n"
+            )
+            return
+        try:
+            payload = json.loads(body)
+            self.stats.messages += len(payload.get("personalizations", []))
+        except ValueError:
+            self.transport.write(
+                b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n"
+            )
+            return
+        self.transport.write(b"HTTP/1.1 202 Accepted\r\nContent-Length: 0\r\n\r\n")
+
+
+class EmailSink:
+    """Run the SMTP and HTTP sinks on one event loop."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        smtp_port: int = 2525,
+        http_port: int = 8025,
+        fail_rate: float = 0.0,
+    ):
+        self.host = host
+        self.smtp_port = smtp_port
+        self.http_port = http_port
+        self.fail_rate = fail_rate
+        self.smtp_stats = SinkStats()
+        self.http_stats = SinkStats()
+        self._ready = threading.Event()
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        smtp = await loop.create_server(
+            lambda: SMTPSinkProtocol(self.smtp_stats), self.host, self.smtp_port
+        )
+        http = await loop.create_server(
+            lambda: HTTPSinkProtocol(self.http_stats, self.fail_rate),
+            self.host,
+            self.http_port,
+        )
+        self._ready.set()
+        async with smtp, http:
+            await asyncio.gather(smtp.serve_forever(), http.serve_forever())
+
+    def start_in_thread(self) -> "EmailSink":
+        """Start the sinks on a daemon thread and wait until they listen."""
+        thread = threading.Thread(target=asyncio.run, args=(self.serve(),), daemon=True)
+        thread.start()
+        self._ready.wait(timeout=5)
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SMTP/SendGrid email sink")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--smtp-port", type=int, default=2525)
+    parser.add_argument("--http-port", type=int, default=8025)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    sink = EmailSink(args.host, args.smtp_port, args.http_port, args.fail_rate)
+    print(f"📭 SMTP sink on {args.host}:{args.smtp_port}")
+    print(f"📭 HTTP sink on http://{args.host}:{args.http_port}/v3/mail/send")
+    try:
+        asyncio.run(sink.serve())
+    except KeyboardInterrupt:
+        print(
+            f"\nReceived {sink.smtp_stats.messages} SMTP and "
+            f"{sink.http_stats.messages} HTTP messages"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,154 @@
 # scripts/seed_data.py
 """
-Seed initial data into the database.
+Seed data into the database.
+
+Without arguments, creates the admin and test users for development
+(``make seed``).
+
+``bulk`` generates a synthetic dataset for benchmarks and the EXPLAIN suite:
+users, projects with members, tasks, comments and notifications, in the
+sizes given on the command line. The rows depend only on the options and
+``--seed``: every user and project draws from its own random generator and
+ids are derived from the seed, so reruns with any ``--workers`` count produce
+the same data. ``--skew`` makes project sizes and user activity Zipf-
+distributed (project 0 and user 0 are the biggest) instead of uniform.
+
+Rows are COPYed in batches by ``--workers`` processes with a connection
+each. Passwords are hashed once per distinct password: user ``n`` logs in as
+``user<n>@seed.example.com`` with ``Password<n % passwords>!``. Load into an
+empty schema (``--reset`` truncates the tables first, dev users included);
+the tables are ANALYZEd at the end.
+
+Usage:
+    python scripts/seed_data.py
+    python scripts/seed_data.py bulk --users 2000 --projects 500
+    # ~10M rows
+    python scripts/seed_data.py bulk --users 100000 --projects 20000 \\
+        --tasks-per-project 200 --comments 1 --notifications 20 --skew 1.1
 """
 
+import argparse
+import asyncio
+import bisect
+import dataclasses
+import hashlib
+import itertools
+import math
+import os
+import random
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import uuid
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.security import get_password_hash
 from app.db import SessionLocal
 from app.models.user import User
-from app.core.security import get_password_hash
-import uuid
+
+EMAIL_DOMAIN = "seed.example.com"
+DAY = 86400
+
+# Columns COPYed per table, in the order the rows are built
+COLUMNS = {
+    "users": (
+        "id",
+        "email",
+        "hashed_password",
+        "full_name",
+        "is_active",
+        "is_superuser",
+        "created_at",
+        "updated_at",
+    ),
+    "projects": (
+        "id",
+        "name",
+        "description",
+        "status",
+        "owner_id",
+        "created_at",
+        "updated_at",
+        "version",
+        "is_deleted",
+    ),
+    "project_members": (
+        "id",
+        "project_id",
+        "user_id",
+        "role",
+        "joined_at",
+        "created_at",
+        "updated_at",
+    ),
+    "tasks": (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "position",
+        "project_id",
+        "creator_id",
+        "assignee_id",
+        "due_date",
+        "created_at",
+        "updated_at",
+        "version",
+        "is_deleted",
+        "deleted_at",
+    ),
+    "comments": ("id", "content", "task_id", "user_id", "created_at", "updated_at"),
+    "notifications": (
+        "id",
+        "type",
+        "title",
+        "message",
+        "link",
+        "read",
+        "user_id",
+        "created_at",
+        "updated_at",
+    ),
+}
+
+# Tables each kind of shard writes, in foreign key order
+SHARD_TABLES = {
+    "users": ("users",),
+    "projects": ("projects", "project_members", "tasks", "comments"),
+    "notifications": ("notifications",),
+}
+# Shards of a phase run in parallel; phases run one after the other
+PHASES = (("users",), ("projects", "notifications"))
+
+# Cumulative percentages, looked up with bisect
+TASK_STATUSES = ("todo", "in_progress", "review", "done")
+TASK_STATUS_WEIGHTS = tuple(itertools.accumulate((35, 20, 10, 35)))
+TASK_PRIORITIES = ("low", "medium", "high", "urgent")
+TASK_PRIORITY_WEIGHTS = tuple(itertools.accumulate((25, 45, 22, 8)))
+NOTIFICATION_TITLES = {
+    "task_assigned": "Task assigned",
+    "tasks_updated": "Tasks updated",
+}
+
+FIRST_NAMES = ("Ada", "Alan", "Barbara", "Edsger", "Grace", "Ken", "Linus", "Margaret")
+LAST_NAMES = ("Hopper", "Knuth", "Lamport", "Liskov", "Ritchie", "Thompson", "Turing")
+WORDS = (
+    "api", "audit", "backlog", "billing", "build", "cache", "client", "config",
+    "dashboard", "data", "deploy", "design", "docs", "email", "export", "fix",
+    "flow", "import", "index", "invoice", "login", "metrics", "migrate", "mobile",
+    "onboarding", "page", "payment", "query", "release", "report", "review",
+    "search", "security", "server", "settings", "signup", "sync", "test", "ui",
+    "update", "upload", "user", "webhook", "widget", "workflow",
+)  # fmt: skip
 
 
 async def create_superuser():
@@ -108,6 +244,466 @@ async def create_test_users():
         return created_users
 
 
+def credentials(n: int, passwords: int = 1) -> Tuple[str, str]:
+    """Email and password of generated user ``n``."""
+    return f"user{n}@{EMAIL_DOMAIN}", f"Password{n % max(passwords, 1)}!"
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkConfig:
+    """Sizes and shape of a generated dataset; ``seed`` fixes its content."""
+
+    users: int = 1000
+    projects: int = 200
+    members_per_project: int = 5
+    tasks_per_project: int = 50
+    # Average per task; counts are spread geometrically around it
+    comments_per_task: float = 1.0
+    notifications_per_user: int = 20
+    # Zipf exponent for project sizes and user activity, 0 for uniform
+    skew: float = 0.0
+    # The highest positions of each project are soft-deleted
+    deleted_fraction: float = 0.04
+    passwords: int = 1
+    seed: int = 0
+    workers: int = 1
+    batch_size: int = 10_000
+    # Timestamps fall before this; midnight UTC today when not given
+    anchor: Optional[datetime] = None
+
+
+def _zipf_cumulative(count: int, skew: float) -> Optional[List[float]]:
+    if not skew or count <= 0:
+        return None
+    return list(itertools.accumulate((n + 1) ** -skew for n in range(count)))
+
+
+def _words(rng: random.Random, count: int) -> str:
+    # Indexing by random() is several times cheaper than rng.choices
+    return " ".join([WORDS[int(rng.random() * len(WORDS))] for _ in range(count)])
+
+
+def _pick(rng: random.Random, values: Sequence[str], cum_percent: Sequence[int]):
+    return values[bisect.bisect(cum_percent, rng.random() * 100)]
+
+
+class Dataset:
+    """The rows of a ``BulkConfig``, generated per user or per project."""
+
+    def __init__(self, config: BulkConfig, password_hashes: Sequence[str] = ("x",)):
+        self.config = config
+        self.password_hashes = password_hashes
+        self.anchor = config.anchor or datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self._user_weights = _zipf_cumulative(config.users, config.skew)
+        self._project_weights = _zipf_cumulative(config.projects, config.skew)
+
+    def _id(self, kind: str, *parts: int) -> uuid.UUID:
+        key = f"{self.config.seed}:{kind}:" + ":".join(map(str, parts))
+        return uuid.UUID(bytes=hashlib.md5(key.encode()).digest())
+
+    def _rng(self, kind: str, index: int) -> random.Random:
+        return random.Random(f"{self.config.seed}:{kind}:{index}")
+
+    def user_id(self, n: int) -> uuid.UUID:
+        return self._id("user", n)
+
+    def project_id(self, n: int) -> uuid.UUID:
+        return self._id("project", n)
+
+    def task_id(self, project: int, position: int) -> uuid.UUID:
+        return self._id("task", project, position)
+
+    def _share(self, weights: Optional[List[float]], index: int, mean: int) -> int:
+        """Rows of item ``index`` when the items average ``mean`` rows."""
+        if weights is None:
+            return mean
+        weight = weights[index] - (weights[index - 1] if index else 0.0)
+        return round(mean * len(weights) * weight / weights[-1])
+
+    def task_count(self, project: int) -> int:
+        return self._share(
+            self._project_weights, project, self.config.tasks_per_project
+        )
+
+    def notification_count(self, user: int) -> int:
+        return self._share(self._user_weights, user, self.config.notifications_per_user)
+
+    def total(self, kind: str) -> int:
+        """Number of users or projects a kind of shard is split over."""
+        return self.config.projects if kind == "projects" else self.config.users
+
+    def _pick_user(self, rng: random.Random) -> int:
+        if self._user_weights is None:
+            return rng.randrange(self.config.users)
+        point = rng.random() * self._user_weights[-1]
+        return min(bisect.bisect(self._user_weights, point), self.config.users - 1)
+
+    def _later(self, rng: random.Random, start: datetime) -> datetime:
+        """A time between ``start`` and the anchor."""
+        span = max((self.anchor - start).total_seconds(), 0.0)
+        return start + timedelta(seconds=rng.uniform(0, span))
+
+    def rows(self, kind: str, index: int) -> Dict[str, List[tuple]]:
+        if kind == "users":
+            return {"users": [self.user_row(index)]}
+        if kind == "projects":
+            return self.project_rows(index)
+        return {"notifications": self.notification_rows(index)}
+
+    def user_row(self, n: int) -> tuple:
+        rng = self._rng("user", n)
+        created_at = self.anchor - timedelta(seconds=rng.randrange(1, 730 * DAY))
+        email, _ = credentials(n)
+        return (
+            self.user_id(n),
+            email,
+            self.password_hashes[n % len(self.password_hashes)],
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            True,
+            False,
+            created_at,
+            created_at,
+        )
+
+    def project_rows(self, n: int) -> Dict[str, List[tuple]]:
+        """A project with its members, tasks and their comments."""
+        config = self.config
+        rng = self._rng("project", n)
+        rows: Dict[str, List[tuple]] = {table: [] for table in SHARD_TABLES["projects"]}
+        project_id = self.project_id(n)
+        owner = self._pick_user(rng)
+        created_at = self.anchor - timedelta(seconds=rng.randrange(1, 365 * DAY))
+        rows["projects"].append(
+            (
+                project_id,
+                f"{_words(rng, 2).capitalize()} {n}",
+                _words(rng, 10) if rng.random() < 0.5 else None,
+                "archived" if rng.random() < 0.1 else "active",
+                self.user_id(owner),
+                created_at,
+                created_at,
+                1,
+                False,
+            )
+        )
+
+        members: List[int] = []
+        wanted = min(config.members_per_project, config.users - 1)
+        # Bounded, since heavy skew makes the last few distinct users rare
+        for _ in range(wanted * 20):
+            if len(members) == wanted:
+                break
+            user = self._pick_user(rng)
+            if user != owner and user not in members:
+                members.append(user)
+        for position, user in enumerate(members):
+            joined_at = self._later(rng, created_at)
+            rows["project_members"].append(
+                (
+                    self._id("member", n, position),
+                    project_id,
+                    self.user_id(user),
+                    "admin" if position == 0 else "member",
+                    joined_at,
+                    joined_at,
+                    joined_at,
+                )
+            )
+
+        people = [self.user_id(user) for user in (owner, *members)]
+        count = self.task_count(n)
+        deleted_from = count - round(count * config.deleted_fraction)
+        comment_scale = config.comments_per_task + 0.5
+        for position in range(count):
+            task_id = self.task_id(n, position)
+            task_created_at = self._later(rng, created_at)
+            updated_at = self._later(rng, task_created_at)
+            deleted = position >= deleted_from
+            rows["tasks"].append(
+                (
+                    task_id,
+                    f"{_words(rng, 3).capitalize()} {position}",
+                    _words(rng, 20) if rng.random() < 0.3 else None,
+                    _pick(rng, TASK_STATUSES, TASK_STATUS_WEIGHTS),
+                    _pick(rng, TASK_PRIORITIES, TASK_PRIORITY_WEIGHTS),
+                    position,
+                    project_id,
+                    rng.choice(people),
+                    rng.choice(people) if rng.random() < 0.8 else None,
+                    (
+                        task_created_at + timedelta(days=rng.randint(1, 60))
+                        if rng.random() < 0.7
+                        else None
+                    ),
+                    task_created_at,
+                    updated_at,
+                    1,
+                    deleted,
+                    updated_at if deleted else None,
+                )
+            )
+            if config.comments_per_task <= 0:
+                continue
+            for comment in range(int(rng.expovariate(1 / comment_scale))):
+                commented_at = self._later(rng, task_created_at)
+                rows["comments"].append(
+                    (
+                        self._id("comment", n, position, comment),
+                        _words(rng, 12).capitalize(),
+                        task_id,
+                        rng.choice(people),
+                        commented_at,
+                        commented_at,
+                    )
+                )
+        return rows
+
+    def notification_rows(self, n: int) -> List[tuple]:
+        """A user's notifications, mostly recent, each linking to some task."""
+        config = self.config
+        rng = self._rng("notifications", n)
+        user_id = self.user_id(n)
+        rows = []
+        for position in range(self.notification_count(n)):
+            kind = "task_assigned" if rng.random() < 0.7 else "tasks_updated"
+            link = None
+            if config.projects:
+                project = rng.randrange(config.projects)
+                tasks = self.task_count(project)
+                if tasks:
+                    link = f"/tasks/{self.task_id(project, rng.randrange(tasks))}"
+            created_at = self.anchor - timedelta(
+                seconds=min(rng.expovariate(1 / (14 * DAY)), 365 * DAY)
+            )
+            rows.append(
+                (
+                    self._id("notification", n, position),
+                    kind,
+                    NOTIFICATION_TITLES[kind],
+                    None,
+                    link,
+                    rng.random() < 0.8,
+                    user_id,
+                    created_at,
+                    created_at,
+                )
+            )
+        return rows
+
+
+def _asyncpg_dsn(url: str) -> str:
+    return url.replace("postgresql+asyncpg://", "postgresql://")
+
+
+async def _connect(dsn: str, schema: Optional[str]) -> asyncpg.Connection:
+    return await asyncpg.connect(
+        dsn, server_settings={"search_path": schema} if schema else None
+    )
+
+
+async def _copy_shard(
+    dataset: Dataset,
+    dsn: str,
+    schema: Optional[str],
+    kind: str,
+    start: int,
+    stop: int,
+) -> Dict[str, int]:
+    """COPY the rows of users or projects ``start``..``stop`` in batches."""
+    tables = SHARD_TABLES[kind]
+    buffers: Dict[str, List[tuple]] = {table: [] for table in tables}
+    counts = dict.fromkeys(tables, 0)
+    connection = await _connect(dsn, schema)
+
+    async def flush() -> None:
+        # In foreign key order, so referenced rows are always in first
+        for table, records in buffers.items():
+            if records:
+                await connection.copy_records_to_table(
+                    table, records=records, columns=COLUMNS[table]
+                )
+                counts[table] += len(records)
+                records.clear()
+
+    try:
+        buffered = 0
+        for index in range(start, stop):
+            for table, records in dataset.rows(kind, index).items():
+                buffers[table].extend(records)
+                buffered += len(records)
+            if buffered >= dataset.config.batch_size:
+                await flush()
+                buffered = 0
+        await flush()
+    finally:
+        await connection.close()
+    return counts
+
+
+# Per-process state of the worker pool, set up by _init_worker
+_worker_dataset: Optional[Dataset] = None
+
+
+def _init_worker(config: BulkConfig, password_hashes: Sequence[str]) -> None:
+    global _worker_dataset
+    _worker_dataset = Dataset(config, password_hashes)
+
+
+def _load_shard(
+    dsn: str, schema: Optional[str], kind: str, start: int, stop: int
+) -> Dict[str, int]:
+    return asyncio.run(_copy_shard(_worker_dataset, dsn, schema, kind, start, stop))
+
+
+def _shards(count: int, workers: int) -> List[Tuple[int, int]]:
+    # Several shards per worker so a skewed (big) shard doesn't idle the rest
+    size = max(1, math.ceil(count / (workers * 8)))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+async def generate(
+    database_url: str,
+    config: BulkConfig,
+    *,
+    schema: Optional[str] = None,
+    reset: bool = False,
+) -> Dict[str, int]:
+    """
+    Load the dataset of ``config`` into a database.
+
+    Args:
+        database_url: PostgreSQL URL, with or without the ``+asyncpg`` driver
+        config: What to generate
+        schema: Schema to load into instead of the default search path
+        reset: Truncate the tables first
+
+    Returns:
+        Rows written per table
+    """
+    dsn = _asyncpg_dsn(database_url)
+    password_hashes = [
+        get_password_hash(credentials(n, config.passwords)[1])
+        for n in range(max(config.passwords, 1))
+    ]
+    dataset = Dataset(config, password_hashes)
+    # Workers must agree on the anchor even if the load crosses midnight
+    config = dataclasses.replace(config, anchor=dataset.anchor)
+
+    if reset:
+        connection = await _connect(dsn, schema)
+        try:
+            await connection.execute(f"TRUNCATE {', '.join(COLUMNS)} CASCADE")
+        finally:
+            await connection.close()
+
+    counts = dict.fromkeys(COLUMNS, 0)
+    executor = None
+    if config.workers > 1:
+        executor = ProcessPoolExecutor(
+            config.workers, initializer=_init_worker, initargs=(config, password_hashes)
+        )
+    try:
+        loop = asyncio.get_running_loop()
+        for phase in PHASES:
+            shards = [
+                (kind, start, stop)
+                for kind in phase
+                for start, stop in _shards(dataset.total(kind), config.workers)
+            ]
+            if executor is None:
+                results = [
+                    await _copy_shard(dataset, dsn, schema, *shard) for shard in shards
+                ]
+            else:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, _load_shard, dsn, schema, *shard)
+                        for shard in shards
+                    )
+                )
+            for result in results:
+                for table, count in result.items():
+                    counts[table] += count
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    connection = await _connect(dsn, schema)
+    try:
+        await connection.execute(f"ANALYZE {', '.join(COLUMNS)}")
+    finally:
+        await connection.close()
+    return counts
+
+
+async def bulk(args) -> None:
+    """Generate a synthetic dataset from the command line options."""
+    config = BulkConfig(
+        users=args.users,
+        projects=args.projects,
+        members_per_project=args.members,
+        tasks_per_project=args.tasks_per_project,
+        comments_per_task=args.comments,
+        notifications_per_user=args.notifications,
+        skew=args.skew,
+        deleted_fraction=args.deleted,
+        passwords=args.passwords,
+        seed=args.seed,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+    print(f"🌱 Generating a dataset (seed {config.seed}, {config.workers} workers)...")
+    start = time.perf_counter()
+    counts = await generate(
+        args.database_url or settings.DATABASE_URL,
+        config,
+        schema=args.schema,
+        reset=args.reset,
+    )
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"   {table:<16} {count:>12,}")
+    total = sum(counts.values())
+    print(f"\n🎉 {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    email, password = credentials(0, config.passwords)
+    print(f"🔑 Users log in as {email} / {password} (user<n>@...)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Seed the database")
+    commands = parser.add_subparsers(dest="command")
+    generator = commands.add_parser("bulk", help="Generate a synthetic dataset")
+    generator.add_argument("--users", type=int, default=1000)
+    generator.add_argument("--projects", type=int, default=200)
+    generator.add_argument("--members", type=int, default=5, help="Per project")
+    generator.add_argument("--tasks-per-project", type=int, default=50)
+    generator.add_argument(
+        "--comments", type=float, default=1.0, help="Average per task"
+    )
+    generator.add_argument("--notifications", type=int, default=20, help="Per user")
+    generator.add_argument(
+        "--skew", type=float, default=0.0, help="Zipf exponent, 0 for uniform"
+    )
+    generator.add_argument(
+        "--deleted", type=float, default=0.04, help="Soft-deleted share of tasks"
+    )
+    generator.add_argument(
+        "--passwords", type=int, default=1, help="Distinct passwords (bcrypt runs)"
+    )
+    generator.add_argument("--seed", type=int, default=0)
+    generator.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    generator.add_argument("--batch-size", type=int, default=10_000)
+    generator.add_argument("--schema", help="Load into this schema")
+    generator.add_argument("--database-url", help="Defaults to DATABASE_URL")
+    generator.add_argument(
+        "--reset", action="store_true", help="Truncate the tables first"
+    )
+    return parser.parse_args()
+
+
 async def main():
     """Main seeding function."""
     print("🌱 Seeding initial data...")
@@ -119,9 +715,9 @@ async def main():
         # Create test users
         users = await create_test_users()
 
-        print(f"\n🎉 Seeding complete!")
+        print("\n🎉 Seeding complete!")
         print(f"📊 Created {len(users) + 1} users total")
-        print(f"🔑 Admin credentials: admin@example.com / Admin123!")
+        print("🔑 Admin credentials: admin@example.com / Admin123!")
 
     except Exception as e:
         print(f"❌ Error seeding data: {e}")
@@ -132,4 +728,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    asyncio.run(bulk(args) if args.command == "bulk" else main())
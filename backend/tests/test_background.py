@@ -0,0 +1,163 @@
+# tests/test_background.py
+"""In-process background runner: batching, spill to Celery, drops, shutdown."""
+
+import asyncio
+
+import pytest
+
+from app.core import background
+from app.core.background import CELERY, BackgroundRunner
+from app.core.config import settings
+
+
+class FakeCeleryTask:
+    def __init__(self, error=None):
+        self.sent = []
+        self.error = error
+
+    def delay(self, payloads):
+        if self.error is not None:
+            raise self.error
+        self.sent.append(payloads)
+
+
+class Recorder:
+    def __init__(self, gate=None):
+        self.batches = []
+        self.gate = gate
+
+    async def __call__(self, payloads):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.batches.append(payloads)
+
+
+@pytest.fixture
+async def runner(monkeypatch):
+    monkeypatch.setattr(settings, "BACKGROUND_JOB_MODES", {})
+    runner = BackgroundRunner()
+    yield runner
+    await runner.shutdown(timeout=0.1)
+
+
+async def drain(runner, name):
+    await asyncio.wait_for(runner._jobs[name].queue.join(), 1)
+
+
+async def test_batches_fill_up_to_batch_size(runner):
+    handler = Recorder()
+    runner.register("job", handler, concurrency=1, batch_size=3, batch_window=0.02)
+    await runner.start()
+
+    for i in range(7):
+        runner.dispatch("job", i)
+    await drain(runner, "job")
+
+    assert handler.batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert runner.metrics()["job"]["batches"] == 3
+    assert runner.metrics()["job"]["completed"] == 7
+
+
+async def test_batch_window_collects_late_jobs(runner):
+    handler = Recorder()
+    runner.register("job", handler, concurrency=1, batch_size=10, batch_window=0.1)
+    await runner.start()
+
+    runner.dispatch("job", "a")
+    await asyncio.sleep(0.02)
+    runner.dispatch("job", "b")
+    await drain(runner, "job")
+    runner.dispatch("job", "c")
+    await drain(runner, "job")
+
+    assert handler.batches == [["a", "b"], ["c"]]
+
+
+async def test_full_queue_spills_to_celery(runner):
+    gate = asyncio.Event()
+    handler = Recorder(gate)
+    task = FakeCeleryTask()
+    runner.register("job", handler, concurrency=1, max_queue=1, celery_task=task)
+    await runner.start()
+
+    runner.dispatch("job", "taken")
+    await asyncio.sleep(0)  # The worker takes it and waits on the gate
+    assert runner.dispatch("job", "queued")
+    assert runner.dispatch("job", "spilled")
+    gate.set()
+    await drain(runner, "job")
+
+    assert handler.batches == [["taken"], ["queued"]]
+    assert task.sent == [["spilled"]]
+    assert runner.metrics()["job"]["sent_to_celery"] == 1
+
+
+async def test_jobs_are_dropped_without_a_celery_fallback(runner):
+    runner.register("job", Recorder())
+
+    # Not started, so the job can't run in-process
+    assert not runner.dispatch("job", 1)
+    assert runner.metrics()["job"]["dropped"] == 1
+
+
+async def test_broker_errors_count_as_drops(runner):
+    runner.register("job", Recorder(), celery_task=FakeCeleryTask(OSError("down")))
+
+    assert not runner.dispatch("job", 1)
+    assert runner.metrics()["job"]["dropped"] == 1
+    assert runner.metrics()["job"]["sent_to_celery"] == 0
+
+
+async def test_celery_task_by_name_is_sent_lazily(runner, monkeypatch):
+    from app.tasks.celery_app import celery
+
+    sent = []
+    monkeypatch.setattr(
+        celery, "send_task", lambda name, args: sent.append((name, args))
+    )
+    runner.register("job", Recorder(), mode=CELERY, celery_task="app.tasks.x.job")
+    await runner.start()
+
+    assert runner.dispatch("job", {"id": 1})
+    assert sent == [("app.tasks.x.job", [[{"id": 1}]])]
+
+
+async def test_settings_override_is_validated(runner, monkeypatch):
+    monkeypatch.setattr(
+        settings, "BACKGROUND_JOB_MODES", {"job": CELERY, "other": "threads"}
+    )
+
+    with pytest.raises(ValueError, match="celery_task"):
+        runner.register("job", Recorder())
+    with pytest.raises(ValueError, match="Unknown mode"):
+        runner.register("other", Recorder())
+
+
+async def test_shutdown_drains_queued_jobs(runner):
+    handler = Recorder()
+    runner.register("job", handler, concurrency=1)
+    await runner.start()
+    for i in range(3):
+        runner.dispatch("job", i)
+
+    await runner.shutdown(timeout=1)
+
+    assert handler.batches == [[0], [1], [2]]
+    assert runner._jobs["job"].workers == []
+    assert not runner.running
+
+
+async def test_shutdown_cancels_workers_after_the_timeout(runner, caplog):
+    handler = Recorder(asyncio.Event())
+    runner.register("job", handler, concurrency=1)
+    await runner.start()
+    runner.dispatch("job", "stuck")
+    runner.dispatch("job", "pending")
+    await asyncio.sleep(0)
+
+    with caplog.at_level("WARNING", logger=background.__name__):
+        await runner.shutdown(timeout=0.05)
+
+    assert handler.batches == []
+    assert runner._jobs["job"].workers == []
+    assert "1 jobs pending" in caplog.text
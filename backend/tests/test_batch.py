@@ -0,0 +1,215 @@
+# tests/test_batch.py
+"""
+/batch dispatch: shared principal and session, read lanes, write ordering.
+
+Runs the real batch router and dependencies against a small app of probe
+routes. Sessions are stand-ins, so no database is needed.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request
+
+from app.api import deps
+from app.api.deps import get_current_user
+from app.api.v1 import batch as batch_module
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import session as session_module
+from app.db.session import get_db
+from app.schemas.user import UserResponse
+
+API = settings.API_V1_STR
+USER_ID = uuid.uuid4()
+
+
+class FakeSession:
+    def __init__(self):
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def close(self):
+        pass
+
+
+class FakeUserService:
+    lookups = 0
+
+    async def get_active_user(self, db, user_id):
+        FakeUserService.lookups += 1
+        now = datetime.now(timezone.utc)
+        return UserResponse(
+            id=user_id,
+            email="batch@example.com",
+            is_active=True,
+            is_superuser=False,
+            created_at=now,
+            updated_at=now,
+        )
+
+
+probe = APIRouter(prefix="/probe")
+events = []
+
+
+@probe.get("/whoami")
+async def whoami(
+    current_user: UserResponse = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    return {"user": str(current_user.id), "session": id(db)}
+
+
+@probe.get("/slow/{name}")
+async def slow(name: str, db=Depends(get_db)):
+    events.append(("start", name))
+    await asyncio.sleep(0.05)
+    events.append(("end", name))
+    return {"session": id(db)}
+
+
+@probe.post("/write/{name}")
+async def write(name: str, db=Depends(get_db)):
+    events.append(("start", name))
+    events.append(("end", name))
+    return {"session": id(db)}
+
+
+@probe.get("/fail")
+async def fail():
+    raise RuntimeError("boom")
+
+
+@probe.get("/conditional")
+async def conditional(request: Request):
+    return {"if_match": request.headers.get("if-match")}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    sessions = []
+
+    def sessionmaker():
+        def factory():
+            sessions.append(FakeSession())
+            return sessions[-1]
+
+        return factory
+
+    monkeypatch.setattr(session_module, "get_sessionmaker", sessionmaker)
+    monkeypatch.setattr(batch_module, "get_sessionmaker", sessionmaker)
+    FakeUserService.lookups = 0
+    events.clear()
+
+    app = FastAPI()
+    app.include_router(batch_module.router, prefix=API)
+    app.include_router(probe, prefix=API)
+    app.dependency_overrides[deps.get_user_service] = FakeUserService
+    app.state.sessions = sessions
+    return app
+
+
+@pytest.fixture
+async def batch(app):
+    headers = {"Authorization": f"Bearer {create_access_token(USER_ID)}"}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+
+        async def post(*requests):
+            return await client.post(
+                f"{API}/batch", json={"requests": list(requests)}, headers=headers
+            )
+
+        yield post
+
+
+def bodies(response):
+    assert response.status_code == 200
+    return [item["body"] for item in response.json()["responses"]]
+
+
+async def test_sub_requests_share_principal_and_session(app, batch):
+    response = await batch(
+        {"method": "POST", "path": "/probe/write/a"},
+        {"path": "/probe/whoami"},
+        {"method": "POST", "path": "/probe/write/b"},
+    )
+
+    first, who, second = bodies(response)
+    assert FakeUserService.lookups == 1
+    assert who["user"] == str(USER_ID)
+    # The only session opened is the batch's own, used by every item
+    assert len(app.state.sessions) == 1
+    assert first["session"] == who["session"] == second["session"]
+
+
+async def test_consecutive_reads_run_concurrently_on_separate_lanes(app, batch):
+    response = await batch(*({"path": f"/probe/slow/{i}"} for i in range(3)))
+
+    starts = [i for i, (kind, _) in enumerate(events) if kind == "start"]
+    ends = [i for i, (kind, _) in enumerate(events) if kind == "end"]
+    assert max(starts) < min(ends)
+    assert len({body["session"] for body in bodies(response)}) == 3
+    assert len(app.state.sessions) == 3
+
+
+async def test_write_waits_for_preceding_reads(batch):
+    await batch(
+        {"path": "/probe/slow/r1"},
+        {"path": "/probe/slow/r2"},
+        {"method": "POST", "path": "/probe/write/w"},
+        {"path": "/probe/slow/r3"},
+    )
+
+    position = {event: i for i, event in enumerate(events)}
+    assert position[("start", "w")] > position[("end", "r1")]
+    assert position[("start", "w")] > position[("end", "r2")]
+    assert position[("start", "r3")] > position[("end", "w")]
+
+
+async def test_nested_batch_is_rejected(batch):
+    response = await batch({"method": "POST", "path": "/batch", "body": {}})
+
+    assert response.json()["responses"][0]["status"] == 400
+
+
+async def test_failing_item_does_not_fail_the_batch(app, batch):
+    response = await batch(
+        {"path": "/probe/fail"},
+        {"method": "POST", "path": "/probe/write/after"},
+    )
+
+    failed, written = response.json()["responses"]
+    assert response.status_code == 200
+    assert failed["status"] == 500
+    assert written["status"] == 200
+    assert app.state.sessions[0].rollbacks == 1
+
+
+async def test_item_headers_are_forwarded(batch):
+    response = await batch(
+        {"path": "/probe/conditional", "headers": {"If-Match": '"3"'}}
+    )
+
+    assert bodies(response) == [{"if_match": '"3"'}]
+
+
+async def test_item_headers_outside_allowlist_are_rejected(batch):
+    response = await batch(
+        {"path": "/probe/conditional", "headers": {"Authorization": "Bearer x"}}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,219 @@
+# tests/test_cache.py
+"""HTTP validators, If-Match preconditions, the 304 middleware and the GET cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core import cache
+from app.core.cache import (
+    ResponseCache,
+    Validator,
+    etag_matches,
+    expected_versions,
+    format_http_date,
+    if_match_versions,
+    is_not_modified,
+    version_conflict,
+)
+from app.core.config import settings
+from app.core.middleware import ConditionalGetMiddleware
+
+UPDATED_AT = datetime(2025, 3, 1, 12, 30, 15, 250_000, tzinfo=timezone.utc)
+
+
+def make_request(**headers) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "if_none_match, etag, expected",
+    [
+        ('"abc"', '"abc"', True),
+        ('W/"abc"', '"abc"', True),
+        ('"abc"', 'W/"abc"', True),
+        ('"x", W/"abc"', 'W/"abc"', True),
+        ("*", '"abc"', True),
+        ('"abd"', '"abc"', False),
+        ('"abc-1"', '"abc"', False),
+    ],
+)
+def test_etag_matches(if_none_match, etag, expected):
+    assert etag_matches(if_none_match, etag) is expected
+
+
+def test_is_not_modified_by_etag():
+    validator = Validator.for_resource("task", 1, UPDATED_AT)
+
+    assert is_not_modified(make_request(if_none_match=validator.etag), validator)
+    assert not is_not_modified(make_request(if_none_match='W/"stale"'), validator)
+
+
+def test_if_none_match_wins_over_if_modified_since():
+    validator = Validator.for_resource("task", 1, UPDATED_AT)
+    request = make_request(
+        if_none_match='W/"stale"', if_modified_since=format_http_date(UPDATED_AT)
+    )
+
+    assert not is_not_modified(request, validator)
+
+
+def test_is_not_modified_by_date_at_second_resolution():
+    validator = Validator.for_resource("task", 1, UPDATED_AT)
+    same_second = format_http_date(UPDATED_AT)
+    second_before = format_http_date(UPDATED_AT - timedelta(seconds=1))
+
+    assert is_not_modified(make_request(if_modified_since=same_second), validator)
+    assert not is_not_modified(make_request(if_modified_since=second_before), validator)
+    assert not is_not_modified(make_request(if_modified_since="garbage"), validator)
+
+
+async def tagged(request):
+    return JSONResponse({"ok": True}, headers={"ETag": '"7"'})
+
+
+async def untagged(request):
+    return JSONResponse({"ok": True})
+
+
+async def streamed(request):
+    return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+
+@pytest.fixture
+async def client():
+    app = ConditionalGetMiddleware(
+        Starlette(
+            routes=[
+                Route("/tagged", tagged, methods=["GET", "POST"]),
+                Route("/untagged", untagged),
+                Route("/streamed", streamed),
+            ]
+        )
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def test_middleware_answers_matching_route_etag_with_304(client):
+    response = await client.get("/tagged", headers={"If-None-Match": '"7"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"7"'
+    assert "cache-control" in response.headers
+    assert "content-type" not in response.headers
+
+
+async def test_middleware_tags_small_bodies_and_answers_304(client):
+    first = await client.get("/untagged")
+    etag = first.headers["etag"]
+    second = await client.get("/untagged", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+async def test_middleware_passes_streams_and_writes_through(client):
+    streamed = await client.get("/streamed", headers={"If-None-Match": "*"})
+    posted = await client.post("/tagged", headers={"If-None-Match": '"7"'})
+
+    assert streamed.status_code == 200
+    assert "etag" not in streamed.headers
+    assert posted.status_code == 200
+
+
+def test_response_cache_misses_on_etag_change():
+    response_cache = ResponseCache(max_entries=10, ttl=60)
+    response_cache.set("key", Response(b"body"), 'W/"1"')
+
+    assert response_cache.get("key", 'W/"1"').body == b"body"
+    assert response_cache.get("key", 'W/"2"') is None
+    assert response_cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_response_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    response_cache = ResponseCache(max_entries=10, ttl=5)
+    response_cache.set("key", Response(b"body"), 'W/"1"')
+
+    now[0] += 5
+    assert response_cache.get("key", 'W/"1"') is not None
+    now[0] += 0.1
+    assert response_cache.get("key", 'W/"1"') is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    response_cache = ResponseCache(max_entries=2, ttl=60)
+    response_cache.set("a", Response(b"a"), "1")
+    response_cache.set("b", Response(b"b"), "1")
+    response_cache.get("a", "1")
+    response_cache.set("c", Response(b"c"), "1")
+
+    assert response_cache.get("b", "1") is None
+    assert response_cache.get("a", "1") is not None
+    assert response_cache.get("c", "1") is not None
+
+
+@pytest.mark.parametrize(
+    "if_match, expected",
+    [
+        ('"3"', [3]),
+        ('W/"3"', [3]),
+        ('"3", "4-a1b2c3d4"', [3, 4]),
+        ('"stranger", "5"', [5]),
+        ('"stranger"', []),
+        ("*", None),
+    ],
+)
+def test_if_match_versions(if_match, expected):
+    assert if_match_versions(if_match) == expected
+
+
+def test_expected_versions_prefers_if_match_over_body_version(monkeypatch):
+    monkeypatch.setattr(settings, "REQUIRE_IF_MATCH", False)
+
+    assert expected_versions('"3"', 7, "task") == [3]
+    assert expected_versions(None, 7, "task") == [7]
+    assert expected_versions(None, None, "task") is None
+
+
+def test_expected_versions_requires_a_precondition_when_configured(monkeypatch):
+    monkeypatch.setattr(settings, "REQUIRE_IF_MATCH", True)
+
+    with pytest.raises(HTTPException) as error:
+        expected_versions(None, None, "task")
+
+    assert error.value.status_code == 428
+    assert expected_versions(None, 2, "task") == [2]
+
+
+def test_version_conflict_is_412_for_if_match_and_409_for_body_version():
+    from_header = version_conflict('"3"', 4, "task")
+    from_body = version_conflict(None, 4, "task")
+
+    assert from_header.status_code == 412
+    assert from_body.status_code == 409
+    assert from_header.headers["ETag"] == from_body.headers["ETag"] == '"4"'
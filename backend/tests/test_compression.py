@@ -0,0 +1,163 @@
+# tests/test_compression.py
+"""Content negotiation and the compression middleware."""
+
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.routing import Route
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+BIG = b"x" * 2000
+CHUNKS = [b"line %d\n" % i * 50 for i in range(20)]
+
+
+@pytest.fixture
+def encodings(monkeypatch):
+    """Server preference br, then gzip, whatever is installed here."""
+    streams = {"br": compression._GzipStream, "gzip": compression._GzipStream}
+    monkeypatch.setattr(compression, "STREAMS", streams)
+    monkeypatch.setattr(compression.settings, "COMPRESSION_ENCODINGS", ["br", "gzip"])
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("BR;q=0.5", "br"),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("*;q=0", None),
+        ("br;q=bogus, gzip;q=0", None),
+        ("identity", None),
+    ],
+)
+def test_choose_encoding(encodings, accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
+
+
+async def big(request):
+    return PlainTextResponse(BIG, headers={"Vary": "Authorization"})
+
+
+async def small(request):
+    return JSONResponse({"ok": True})
+
+
+async def small_stream(request):
+    return StreamingResponse(iter([b"tiny"]), media_type="text/plain")
+
+
+async def big_stream(request):
+    return StreamingResponse(iter(CHUNKS), media_type="application/x-ndjson")
+
+
+async def encoded(request):
+    return Response(
+        gzip.compress(BIG),
+        media_type="text/plain",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+async def binary(request):
+    return Response(BIG, media_type="application/octet-stream")
+
+
+async def not_modified(request):
+    return Response(status_code=304, headers={"Content-Type": "text/plain"})
+
+
+async def no_content(request):
+    return Response(status_code=204, headers={"Content-Type": "text/plain"})
+
+
+@pytest.fixture
+async def client():
+    app = CompressionMiddleware(
+        Starlette(
+            routes=[
+                Route("/big", big),
+                Route("/small", small),
+                Route("/small-stream", small_stream),
+                Route("/big-stream", big_stream),
+                Route("/encoded", encoded),
+                Route("/binary", binary),
+                Route("/not-modified", not_modified),
+                Route("/no-content", no_content),
+            ]
+        ),
+        minimum_size=1024,
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Accept-Encoding": "gzip"},
+    ) as client:
+        yield client
+
+
+async def raw(client, path):
+    async with client.stream("GET", path) as response:
+        return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+async def test_body_is_compressed_with_length_and_vary_rewritten(client):
+    response, body = await raw(client, "/big")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["vary"] == "Authorization, Accept-Encoding"
+    assert gzip.decompress(body) == BIG
+
+
+@pytest.mark.parametrize("path", ["/small", "/small-stream"])
+async def test_small_bodies_pass_through(client, path):
+    response, body = await raw(client, path)
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert len(body) < 1024
+
+
+async def test_streamed_chunks_round_trip(client):
+    response, body = await raw(client, "/big-stream")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body) == b"".join(CHUNKS)
+
+
+async def test_encoded_binary_and_bodiless_responses_are_left_alone(client):
+    encoded, encoded_body = await raw(client, "/encoded")
+    binary, binary_body = await raw(client, "/binary")
+    not_modified, _ = await raw(client, "/not-modified")
+    no_content, _ = await raw(client, "/no-content")
+
+    assert gzip.decompress(encoded_body) == BIG
+    assert binary_body == BIG
+    assert "content-encoding" not in binary.headers
+    assert not_modified.status_code == 304
+    assert "content-encoding" not in not_modified.headers
+    assert no_content.status_code == 204
+    assert "content-encoding" not in no_content.headers
+
+
+async def test_no_acceptable_encoding_passes_through(client):
+    response = await client.get("/big", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.content == BIG
@@ -0,0 +1,149 @@
+# tests/test_counting.py
+"""Listing totals: the count cache and the estimated strategy's fallback."""
+
+import pytest
+from sqlalchemy import select
+
+from app.core import counting
+from app.core.config import settings
+from app.core.counting import CountCache, CountStrategy
+from app.models import User
+from app.repositories import base
+from app.repositories.user import UserRepository
+
+
+class Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+
+class FakeSession:
+    """Answers ``count(*)`` with ``rows`` and the reltuples lookup with ``reltuples``."""
+
+    def __init__(self, rows=0, reltuples=None):
+        self.rows = rows
+        self.reltuples = reltuples
+        self.counts = 0
+
+    async def execute(self, statement):
+        self.counts += 1
+        return Result(self.rows)
+
+    async def scalar(self, statement, params=None):
+        return self.reltuples
+
+
+@pytest.fixture
+def count_cache(monkeypatch):
+    cache = CountCache(max_entries=10, ttl=30)
+    monkeypatch.setattr(base, "count_cache", cache)
+    return cache
+
+
+def test_write_to_a_table_drops_only_its_counts():
+    cache = CountCache(max_entries=10, ttl=30)
+    cache.set("tasks", "q", 5, cache.generation("tasks"))
+    cache.set("users", "q", 7, cache.generation("users"))
+
+    cache.invalidate("tasks")
+
+    assert cache.get("tasks", "q") is None
+    assert cache.get("users", "q") == 7
+
+
+def test_count_racing_a_write_is_never_served():
+    cache = CountCache(max_entries=10, ttl=30)
+    generation = cache.generation("tasks")
+    cache.invalidate("tasks")
+
+    cache.set("tasks", "q", 5, generation)
+
+    assert cache.get("tasks", "q") is None
+    cache.set("tasks", "q", 6, cache.generation("tasks"))
+    assert cache.get("tasks", "q") == 6
+
+
+def test_counts_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(counting.time, "monotonic", lambda: now[0])
+    cache = CountCache(max_entries=10, ttl=30)
+    cache.set("tasks", "q", 5, 0)
+
+    now[0] += 30
+    assert cache.get("tasks", "q") == 5
+    now[0] += 0.1
+    assert cache.get("tasks", "q") is None
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_least_recently_used_count_is_evicted():
+    cache = CountCache(max_entries=2, ttl=30)
+    cache.set("tasks", "a", 1, 0)
+    cache.set("tasks", "b", 2, 0)
+    cache.get("tasks", "a")
+    cache.set("tasks", "c", 3, 0)
+
+    assert cache.get("tasks", "b") is None
+    assert cache.get("tasks", "a") == 1
+
+
+async def test_cached_strategy_counts_once_until_a_write(count_cache):
+    repository = UserRepository()
+    db = FakeSession(rows=12)
+    query = select(User.id).where(User.is_active.is_(True))
+
+    assert await repository.count_rows(db, query, CountStrategy.CACHED) == (12, False)
+    assert await repository.count_rows(db, query, CountStrategy.CACHED) == (12, False)
+    assert db.counts == 1
+
+    count_cache.invalidate(User.__tablename__)
+    await repository.count_rows(db, query, CountStrategy.CACHED)
+    assert db.counts == 2
+
+
+async def test_estimate_is_used_above_the_threshold(monkeypatch):
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_MIN", 1000)
+    db = FakeSession(rows=3, reltuples=250_000)
+
+    total = await UserRepository().count_rows(
+        db, select(User.id), CountStrategy.ESTIMATED
+    )
+
+    assert total == (250_000, True)
+    assert db.counts == 0
+
+
+@pytest.mark.parametrize("reltuples", [-1, 0, None, 999])
+async def test_small_or_missing_estimate_falls_back_to_counting(monkeypatch, reltuples):
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_MIN", 1000)
+    db = FakeSession(rows=3, reltuples=reltuples)
+
+    total = await UserRepository().count_rows(
+        db, select(User.id), CountStrategy.ESTIMATED
+    )
+
+    assert total == (3, False)
+    assert db.counts == 1
+
+
+async def test_filtered_query_is_estimated_from_the_plan(monkeypatch):
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_MIN", 1000)
+    explained = []
+
+    async def explain(db, query):
+        explained.append(query)
+        return {"Plan": {"Plan Rows": 4200}}
+
+    monkeypatch.setattr(base, "explain", explain)
+    query = select(User.id).where(User.is_active.is_(True)).limit(20)
+
+    total = await UserRepository().count_rows(
+        FakeSession(), query, CountStrategy.ESTIMATED
+    )
+
+    assert total == (4200, True)
+    # Paging is stripped before asking the planner
+    assert explained[0]._limit_clause is None
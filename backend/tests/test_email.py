@@ -0,0 +1,68 @@
+# tests/test_email.py
+"""Template rendering for bulk email: one render only when it is safe."""
+
+from app.tasks import email_tasks
+from app.utils.email import uses_recipient_variables
+
+
+def queued_messages(monkeypatch, *args, **kwargs):
+    captured = []
+    monkeypatch.setattr(
+        email_tasks, "dispatch_messages", lambda messages: captured.extend(messages)
+    )
+    email_tasks.send_templated_email(*args, **kwargs)
+    return captured
+
+
+def test_uses_recipient_variables():
+    assert uses_recipient_variables("welcome")
+    assert not uses_recipient_variables("task_assigned")
+
+
+def test_templated_email_renders_per_recipient_when_template_reads_email(
+    monkeypatch,
+):
+    messages = queued_messages(
+        monkeypatch, "welcome", ["a@example.com", "b@example.com"], {"full_name": None}
+    )
+
+    assert [m.to for m in messages] == ["a@example.com", "b@example.com"]
+    assert "Hi a@example.com" in messages[0].text
+    assert "Hi b@example.com" in messages[1].text
+
+
+def test_templated_email_renders_once_for_recipient_independent_template(
+    monkeypatch,
+):
+    context = {"actor": "Jane", "task_title": "Ship it", "link": "/tasks/1"}
+    messages = queued_messages(
+        monkeypatch, "task_assigned", ["a@example.com", "b@example.com"], context
+    )
+
+    assert [m.to for m in messages] == ["a@example.com", "b@example.com"]
+    assert messages[0].text == messages[1].text
+
+
+def test_templated_email_merges_per_recipient_context(monkeypatch):
+    messages = queued_messages(
+        monkeypatch,
+        "welcome",
+        ["a@example.com", "b@example.com"],
+        {"full_name": None},
+        per_recipient_context={"a@example.com": {"full_name": "Ann"}},
+    )
+
+    assert "Hi Ann" in messages[0].text
+    assert "Hi b@example.com" in messages[1].text
+
+
+def test_retry_countdown_draws_from_zero_to_the_capped_backoff(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(
+        email_tasks.random, "uniform", lambda low, high: bounds.append((low, high))
+    )
+
+    for retries in (0, 3, 10):
+        email_tasks._retry_countdown(retries)
+
+    assert bounds == [(0, 10), (0, 80), (0, 600)]
@@ -0,0 +1,222 @@
+# tests/test_idempotency.py
+"""Idempotency-Key replay, mismatch, concurrent duplicates and store fallback."""
+
+import asyncio
+import itertools
+from datetime import timedelta
+
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.core.idempotency import (
+    IdempotencyMiddleware,
+    IdempotencyStore,
+    IdempotencyStores,
+    StoredResponse,
+)
+from app.core.security import create_access_token
+
+
+class MemoryStore(IdempotencyStore):
+    def __init__(self):
+        self.entries = {}
+
+    async def reserve(self, key, fingerprint):
+        if key in self.entries:
+            return False
+        self.entries[key] = StoredResponse(fingerprint)
+        return True
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def complete(self, key, response):
+        self.entries[key] = response
+
+    async def release(self, key):
+        self.entries.pop(key, None)
+
+
+class FailingRedisStore(IdempotencyStore):
+    async def reserve(self, key, fingerprint):
+        raise RedisConnectionError("Connection refused")
+
+
+class HeldKeyRedisStore(IdempotencyStore):
+    """Reports the key as taken, then fails when it is read."""
+
+    def __init__(self, error):
+        self.error = error
+
+    async def reserve(self, key, fingerprint):
+        return False
+
+    async def get(self, key):
+        raise self.error
+
+
+class MemoryStores(IdempotencyStores):
+    def __init__(self, redis=None):
+        super().__init__()
+        self._database = MemoryStore()
+        self._redis_store = redis
+
+    @property
+    def redis(self):
+        if self._redis_store is None or self._redis_down_until > 0:
+            return None
+        return self._redis_store
+
+
+counter = itertools.count()
+gate = asyncio.Event()
+
+
+async def create(request: Request):
+    number = next(counter)
+    if request.query_params.get("wait"):
+        await gate.wait()
+    return JSONResponse({"number": number, "body": (await request.body()).decode()})
+
+
+async def other(request: Request):
+    return JSONResponse({"other": True})
+
+
+def make_client(stores):
+    app = IdempotencyMiddleware(
+        Starlette(
+            routes=[
+                Route("/tasks", create, methods=["POST"]),
+                Route("/other", other, methods=["POST"]),
+            ]
+        ),
+        stores=stores,
+    )
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.fixture
+def stores():
+    return MemoryStores()
+
+
+@pytest.fixture
+async def client(stores):
+    gate.clear()
+    async with make_client(stores) as client:
+        yield client
+
+
+def key_headers(key="key-1", user="user-1", **token_options):
+    token = create_access_token(user, **token_options)
+    return {"Idempotency-Key": key, "Authorization": f"Bearer {token}"}
+
+
+async def test_retry_replays_the_same_bytes(client):
+    first = await client.post("/tasks", content=b'{"a": 1}', headers=key_headers())
+    second = await client.post("/tasks", content=b'{"a": 1}', headers=key_headers())
+
+    assert second.status_code == first.status_code == 200
+    assert second.content == first.content
+    assert second.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+
+
+async def test_key_reused_for_another_request_is_rejected(client):
+    await client.post("/tasks", content=b'{"a": 1}', headers=key_headers())
+
+    other_body = await client.post("/tasks", content=b'{"a": 2}', headers=key_headers())
+    other_path = await client.post("/other", content=b'{"a": 1}', headers=key_headers())
+
+    assert other_body.status_code == 422
+    assert other_path.status_code == 422
+
+
+async def test_keys_are_scoped_to_the_token_subject(client):
+    first = await client.post("/tasks", content=b"x", headers=key_headers())
+    refreshed = await client.post(
+        "/tasks",
+        content=b"x",
+        headers=key_headers(expires_delta=timedelta(minutes=5)),
+    )
+    other_user = await client.post(
+        "/tasks", content=b"x", headers=key_headers(user="user-2")
+    )
+
+    assert refreshed.content == first.content
+    assert "idempotent-replayed" not in other_user.headers
+    assert other_user.json()["number"] != first.json()["number"]
+
+
+async def test_concurrent_duplicate_waits_then_replays(client, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 5)
+    request = client.post("/tasks?wait=1", content=b"x", headers=key_headers())
+
+    first = asyncio.create_task(request)
+    await asyncio.sleep(0.05)
+    duplicate = asyncio.create_task(
+        client.post("/tasks?wait=1", content=b"x", headers=key_headers())
+    )
+    await asyncio.sleep(0.05)
+    assert not duplicate.done()
+    gate.set()
+
+    first, duplicate = await first, await duplicate
+    assert duplicate.content == first.content
+    assert duplicate.headers["idempotent-replayed"] == "true"
+
+
+async def test_concurrent_duplicate_gets_409_after_wait_timeout(client, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 0.05)
+    first = asyncio.create_task(
+        client.post("/tasks?wait=1", content=b"x", headers=key_headers())
+    )
+    await asyncio.sleep(0.02)
+
+    duplicate = await client.post("/tasks?wait=1", content=b"x", headers=key_headers())
+    gate.set()
+    await first
+
+    assert duplicate.status_code == 409
+
+
+async def test_falls_back_to_database_store_when_redis_fails(monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_BACKEND", "auto")
+    stores = MemoryStores(redis=FailingRedisStore())
+
+    async with make_client(stores) as client:
+        first = await client.post("/tasks", content=b"x", headers=key_headers())
+        second = await client.post("/tasks", content=b"x", headers=key_headers())
+
+    assert first.status_code == 200
+    assert second.content == first.content
+    assert second.headers["idempotent-replayed"] == "true"
+    assert len(stores.database.entries) == 1
+    assert stores._redis_down_until > 0
+
+
+@pytest.mark.parametrize(
+    "error",
+    [RedisConnectionError("Connection reset"), RedisTimeoutError("Timeout reading")],
+)
+async def test_falls_back_to_database_store_when_redis_read_fails(monkeypatch, error):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_BACKEND", "auto")
+    monkeypatch.setattr(settings, "IDEMPOTENCY_POLL_INTERVAL", 0.01)
+    stores = MemoryStores(redis=HeldKeyRedisStore(error))
+
+    async with make_client(stores) as client:
+        response = await client.post("/tasks", content=b"x", headers=key_headers())
+
+    assert response.status_code == 200
+    assert len(stores.database.entries) == 1
+    assert stores._redis_down_until > 0
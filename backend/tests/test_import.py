@@ -0,0 +1,73 @@
+# tests/test_import.py
+"""Bulk task import: bad assignees are row errors, never a failed import."""
+
+import uuid
+
+from app.schemas.task import TaskImportResult
+from app.services.import_service import ImportService
+
+PROJECT_ID = uuid.uuid4()
+CREATOR_ID = uuid.uuid4()
+KNOWN_ID = uuid.uuid4()
+
+
+class FakeUserRepository:
+    def __init__(self):
+        self.id_lookups = []
+
+    async def get_ids_by_emails(self, db, emails):
+        return {email: KNOWN_ID for email in emails if email == "known@example.com"}
+
+    async def get_existing_ids(self, db, user_ids):
+        self.id_lookups.append(set(user_ids))
+        return {user_id for user_id in user_ids if user_id == KNOWN_ID}
+
+
+class FakeTaskRepository:
+    def __init__(self):
+        self.staged = []
+
+    async def copy_to_import_staging(self, db, records):
+        self.staged.extend(records)
+
+    async def merge_import_staging(self, db, project_id):
+        return len(self.staged)
+
+
+async def import_chunk(chunk):
+    users, tasks = FakeUserRepository(), FakeTaskRepository()
+    result = TaskImportResult()
+    await ImportService(tasks, users)._import_chunk(
+        None, PROJECT_ID, CREATOR_ID, list(enumerate(chunk, 1)), result
+    )
+    return result, tasks.staged, users.id_lookups
+
+
+async def test_non_string_assignee_email_is_a_row_error():
+    result, staged, _ = await import_chunk(
+        [{"title": "A", "assignee_email": 42}, {"title": "B"}]
+    )
+
+    assert result.failed == 1
+    assert result.errors[0].row == 1
+    assert result.errors[0].errors[0]["loc"] == ["assignee_email"]
+    assert [record[2] for record in staged] == ["B"]
+
+
+async def test_unknown_assignee_id_is_a_row_error():
+    unknown_id = uuid.uuid4()
+    result, staged, lookups = await import_chunk(
+        [
+            {"title": "A", "assignee_id": str(unknown_id)},
+            {"title": "B", "assignee_id": str(KNOWN_ID)},
+            {"title": "C", "assignee_email": "known@example.com"},
+            {"title": "D"},
+        ]
+    )
+
+    assert result.failed == 1
+    assert result.errors[0].row == 1
+    assert result.errors[0].errors == [{"loc": ["assignee_id"], "msg": "Unknown user"}]
+    assert [record[2] for record in staged] == ["B", "C", "D"]
+    # One lookup per chunk, skipping ids already resolved from emails
+    assert lookups == [{unknown_id}]
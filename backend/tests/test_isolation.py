@@ -0,0 +1,53 @@
+# tests/test_isolation.py
+"""Commits made through ``client`` are rolled back with the test's transaction."""
+
+import uuid
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models import Project, Task, User
+from tests.conftest import app_client, rolled_back_session
+
+API = settings.API_V1_STR
+
+
+async def count(connection, model, *where):
+    return await connection.scalar(
+        select(func.count()).select_from(model).where(*where)
+    )
+
+
+async def test_client_commits_are_rolled_back_with_the_test(engine):
+    title = f"Isolation {uuid.uuid4().hex}"
+
+    # What the db and client fixtures do, so the rollback can be observed
+    async with rolled_back_session(engine) as db:
+        user = User(
+            email=f"user-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x"
+        )
+        db.add(user)
+        await db.commit()
+        project = Project(name="Isolation", owner_id=user.id)
+        db.add(project)
+        await db.commit()
+
+        async with app_client(db) as client:
+            response = await client.post(
+                f"{API}/projects/{project.id}/tasks/import",
+                content=f'{{"title": "{title}"}}\n',
+                headers={
+                    "Authorization": f"Bearer {create_access_token(user.id)}",
+                    "Content-Type": "application/x-ndjson",
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+        assert await count(db, Task, Task.title == title) == 1
+
+    async with engine.connect() as connection:
+        assert await count(connection, Task, Task.title == title) == 0
+        assert await count(connection, Project, Project.id == project.id) == 0
+        assert await count(connection, User, User.id == user.id) == 0
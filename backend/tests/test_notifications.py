@@ -0,0 +1,77 @@
+# tests/test_notifications.py
+"""Grouped notifications for task events."""
+
+import uuid
+
+from app.services.notification_service import TASKS_BULK_UPDATED, build_notifications
+
+ACTOR, ASSIGNEE = str(uuid.uuid4()), str(uuid.uuid4())
+PROJECT_A, PROJECT_B = str(uuid.uuid4()), str(uuid.uuid4())
+
+
+def task(title, project_id, assignee_id=ASSIGNEE):
+    return {
+        "id": str(uuid.uuid4()),
+        "title": title,
+        "project_id": project_id,
+        "assignee_id": assignee_id,
+    }
+
+
+def event(*tasks, **changes):
+    return {
+        "type": TASKS_BULK_UPDATED,
+        "actor_id": ACTOR,
+        "changes": changes or {"status": "done"},
+        "tasks": list(tasks),
+    }
+
+
+def test_one_notification_per_assignee_and_project():
+    rows = build_notifications(
+        event(
+            task("A1", PROJECT_A),
+            task("A2", PROJECT_A),
+            task("B1", PROJECT_B),
+            task("B2", PROJECT_B),
+            task("B3", PROJECT_B),
+        )
+    )
+
+    by_link = {row["link"]: row for row in rows}
+    assert set(by_link) == {f"/projects/{PROJECT_A}", f"/projects/{PROJECT_B}"}
+    assert by_link[f"/projects/{PROJECT_A}"]["title"] == "Updated: 2 tasks"
+    assert by_link[f"/projects/{PROJECT_B}"]["message"].splitlines() == [
+        "status: done",
+        "- B1",
+        "- B2",
+        "- B3",
+    ]
+    assert {row["user_id"] for row in rows} == {uuid.UUID(ASSIGNEE)}
+
+
+def test_single_task_links_to_the_task():
+    single = task("Only", PROJECT_A)
+
+    (row,) = build_notifications(event(single, task("B1", PROJECT_B, None)))
+
+    assert row["link"] == f"/tasks/{single['id']}"
+    assert row["title"] == "Updated: Only"
+
+
+def test_actor_and_unassigned_tasks_are_skipped():
+    rows = build_notifications(
+        event(task("Mine", PROJECT_A, ACTOR), task("Nobody's", PROJECT_A, None))
+    )
+
+    assert rows == []
+
+
+def test_assignment_lists_only_the_other_changes():
+    (row,) = build_notifications(
+        event(task("A1", PROJECT_A), assignee_id=ASSIGNEE, priority="high")
+    )
+
+    assert row["type"] == "task_assigned"
+    assert row["title"] == "You were assigned A1"
+    assert row["message"].splitlines()[0] == "priority: high"
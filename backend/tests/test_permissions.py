@@ -0,0 +1,157 @@
+# tests/test_permissions.py
+"""Membership cache: TTL, invalidation epochs, role filtering and write paths."""
+
+import uuid
+
+import pytest
+
+from app.core import permissions
+from app.core.config import settings
+from app.core.permissions import INVALIDATE_ALL, MembershipCache
+from app.models import User
+from app.repositories import project as project_module
+from app.repositories.project import ProjectRepository
+from app.services import project_service
+
+API = settings.API_V1_STR
+USER_ID = uuid.uuid4()
+OWNED, ADMINISTERED, JOINED = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+
+class CountingLoader:
+    def __init__(self, roles=None):
+        self.roles = roles or {}
+        self.calls = 0
+
+    async def __call__(self, db, user_id):
+        self.calls += 1
+        return dict(self.roles)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh cache in place of the global one, publishing nowhere."""
+    monkeypatch.setattr(settings, "REDIS_URL", None)
+    cache = MembershipCache(max_users=10, ttl=30)
+    monkeypatch.setattr(project_module, "membership_cache", cache)
+    monkeypatch.setattr(project_service, "membership_cache", cache)
+    return cache
+
+
+async def test_roles_are_cached_until_the_ttl_expires(monkeypatch, cache):
+    now = [1000.0]
+    monkeypatch.setattr(permissions.time, "monotonic", lambda: now[0])
+    loader = CountingLoader({OWNED: "owner"})
+
+    assert await cache.get_roles(None, USER_ID, loader) == {OWNED: "owner"}
+    now[0] += 29
+    await cache.get_roles(None, USER_ID, loader)
+    assert loader.calls == 1
+    now[0] += 2
+    await cache.get_roles(None, USER_ID, loader)
+    assert loader.calls == 2
+    assert cache.stats() == {"users": 1, "hits": 1, "misses": 2}
+
+
+async def test_load_straddling_an_invalidation_is_not_stored(cache):
+    stale = CountingLoader({OWNED: "owner"})
+
+    async def loader(db, user_id):
+        roles = await stale(db, user_id)
+        # A membership change commits while this load is in flight
+        cache.discard([user_id])
+        return roles
+
+    await cache.get_roles(None, USER_ID, loader)
+    fresh = CountingLoader()
+
+    assert await cache.get_roles(None, USER_ID, fresh) == {}
+    assert fresh.calls == 1
+
+
+async def test_least_recently_used_user_is_evicted(cache):
+    cache.max_users = 2
+    loader = CountingLoader()
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    await cache.get_roles(None, first, loader)
+    await cache.get_roles(None, second, loader)
+    await cache.get_roles(None, first, loader)
+    await cache.get_roles(None, third, loader)
+    assert loader.calls == 3
+
+    await cache.get_roles(None, first, loader)
+    assert loader.calls == 3
+    await cache.get_roles(None, second, loader)
+    assert loader.calls == 4
+
+
+async def test_invalidation_messages_drop_listed_users_or_everyone(cache):
+    loader = CountingLoader()
+    other = uuid.uuid4()
+    await cache.get_roles(None, USER_ID, loader)
+    await cache.get_roles(None, other, loader)
+
+    cache._apply(f"{USER_ID},not-a-uuid")
+    assert cache.stats()["users"] == 1
+    cache._apply(INVALIDATE_ALL)
+    assert cache.stats()["users"] == 0
+
+
+async def test_invalidate_drops_users_without_redis(cache):
+    loader = CountingLoader()
+    await cache.get_roles(None, USER_ID, loader)
+
+    await cache.invalidate(USER_ID)
+    await cache.get_roles(None, USER_ID, loader)
+
+    assert loader.calls == 2
+
+
+@pytest.mark.parametrize(
+    "roles, expected",
+    [
+        (None, {OWNED, ADMINISTERED, JOINED}),
+        (("owner", "admin"), {OWNED, ADMINISTERED}),
+        (("owner",), {OWNED}),
+    ],
+)
+async def test_check_projects_filters_by_role(monkeypatch, cache, roles, expected):
+    repository = ProjectRepository()
+    loader = CountingLoader({OWNED: "owner", ADMINISTERED: "admin", JOINED: "member"})
+    monkeypatch.setattr(repository, "load_member_roles", loader)
+
+    allowed = await repository.check_projects(
+        None, USER_ID, [OWNED, ADMINISTERED, JOINED, uuid.uuid4()], roles=roles
+    )
+
+    assert allowed == expected
+
+
+async def test_membership_changes_invalidate_cached_roles(db, project, cache):
+    repository = ProjectRepository()
+    other = User(email=f"user-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+    db.add(other)
+    await db.commit()
+    assert await repository.get_member_roles(db, other.id) == {}
+
+    await repository.add_member(db, project.id, other.id, "admin")
+    assert await repository.get_member_roles(db, other.id) == {project.id: "admin"}
+
+    await repository.remove_member(db, project.id, other.id)
+    assert await repository.get_member_roles(db, other.id) == {}
+
+
+async def test_project_deletion_invalidates_cached_roles(
+    monkeypatch, client, db, user, project, auth_headers, cache
+):
+    purges = []
+    monkeypatch.setattr(project_service, "request_purge", purges.append)
+    repository = ProjectRepository()
+    assert await repository.get_member_roles(db, user.id) == {project.id: "owner"}
+
+    response = await client.delete(f"{API}/projects/{project.id}", headers=auth_headers)
+
+    assert response.status_code == 202
+    assert purges == [project.id]
+    assert await repository.get_member_roles(db, user.id) == {}
@@ -0,0 +1,253 @@
+# tests/test_project_clone.py
+"""Copying a project inside PostgreSQL, and claiming a clone for the copy."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import Comment, Project, ProjectClone, ProjectMember, Task, User
+from app.repositories.project_clone import ProjectCloneRepository
+from app.services import project_clone_service
+from app.services.project_clone_service import run_clone
+
+
+def new_user():
+    return User(email=f"user-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+
+
+@pytest.fixture
+async def sessionmaker(engine):
+    """Real sessions: ``run_clone`` copies on one and reports progress on another."""
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def source(sessionmaker):
+    """
+    A committed project to clone; removed afterwards with its users.
+
+    The owner also has an "owner" membership row, so copying members meets
+    the same user twice. Of three tasks one is deleted, with a comment.
+    """
+    users = SimpleNamespace(
+        owner=new_user(), admin=new_user(), member=new_user(), requester=new_user()
+    )
+    async with sessionmaker() as db:
+        db.add_all(vars(users).values())
+        await db.flush()
+        project = Project(name="Template", description="Ours", owner_id=users.owner.id)
+        db.add(project)
+        await db.flush()
+        db.add_all(
+            ProjectMember(project_id=project.id, user_id=user.id, role=role)
+            for user, role in (
+                (users.owner, "owner"),
+                (users.admin, "admin"),
+                (users.member, "member"),
+                (users.requester, "member"),
+            )
+        )
+        assigned, unassigned, deleted = [
+            Task(
+                title=title,
+                project_id=project.id,
+                creator_id=users.owner.id,
+                assignee_id=users.member.id if title == "Assigned" else None,
+                is_deleted=title == "Deleted",
+            )
+            for title in ("Assigned", "Unassigned", "Deleted")
+        ]
+        db.add_all([assigned, unassigned, deleted])
+        await db.flush()
+        db.add_all(
+            Comment(content=content, task_id=task.id, user_id=users.admin.id)
+            for content, task in (
+                ("First", assigned),
+                ("Second", assigned),
+                ("Gone", deleted),
+            )
+        )
+        await db.commit()
+
+    yield SimpleNamespace(
+        project=project, tasks=[assigned, unassigned, deleted], **vars(users)
+    )
+
+    async with sessionmaker() as db:
+        # Everything created here or by the clones hangs off these users
+        user_ids = [user.id for user in vars(users).values()]
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+async def create_clone(sessionmaker, source, **includes):
+    options = {
+        "include_members": True,
+        "include_tasks": True,
+        "include_comments": True,
+        **includes,
+    }
+    async with sessionmaker() as db:
+        return await ProjectCloneRepository().create_clone(
+            db,
+            source_project_id=source.project.id,
+            requested_by=source.requester.id,
+            name="Copy",
+            description=None,
+            tasks_total=2,
+            **options,
+        )
+
+
+async def fetch(sessionmaker, query):
+    async with sessionmaker() as db:
+        return [tuple(row) for row in await db.execute(query)]
+
+
+async def count(sessionmaker, model, *where):
+    async with sessionmaker() as db:
+        return await db.scalar(select(func.count()).select_from(model).where(*where))
+
+
+async def get(sessionmaker, model, id):
+    async with sessionmaker() as db:
+        return await db.get(model, id)
+
+
+async def test_copy_gets_new_ids_and_demoted_owners(sessionmaker, source):
+    clone = await create_clone(sessionmaker, source)
+
+    assert await run_clone(clone.id, sessionmaker=sessionmaker)
+
+    clone = await get(sessionmaker, ProjectClone, clone.id)
+    assert clone.status == "done"
+    assert clone.finished_at is not None
+    copied = (clone.members_copied, clone.tasks_copied, clone.comments_copied)
+    # The owner's membership row and ownership count once
+    assert copied == (3, 2, 2)
+    project = await get(sessionmaker, Project, clone.project_id)
+    assert project.owner_id == source.requester.id
+    assert project.name == "Copy"
+    roles = dict(
+        await fetch(
+            sessionmaker,
+            select(ProjectMember.user_id, ProjectMember.role).where(
+                ProjectMember.project_id == clone.project_id
+            ),
+        )
+    )
+    assert roles == {
+        source.owner.id: "admin",
+        source.admin.id: "admin",
+        source.member.id: "member",
+    }
+
+    tasks = {
+        title: (task_id, creator_id, assignee_id)
+        for task_id, title, creator_id, assignee_id in await fetch(
+            sessionmaker,
+            select(Task.id, Task.title, Task.creator_id, Task.assignee_id).where(
+                Task.project_id == clone.project_id
+            ),
+        )
+    }
+    assert set(tasks) == {"Assigned", "Unassigned"}
+    assert not {task_id for task_id, _, _ in tasks.values()} & {
+        task.id for task in source.tasks
+    }
+    assert tasks["Assigned"][1:] == (source.requester.id, source.member.id)
+    comments = await fetch(
+        sessionmaker,
+        select(Comment.content, Comment.user_id)
+        .where(Comment.task_id == tasks["Assigned"][0])
+        .order_by(Comment.content),
+    )
+    assert comments == [("First", source.admin.id), ("Second", source.admin.id)]
+    # The source keeps its own comments
+    assert (
+        await count(sessionmaker, Comment, Comment.task_id == source.tasks[0].id) == 2
+    )
+
+
+@pytest.mark.parametrize(
+    "includes, copied",
+    [
+        ({"include_members": False}, (0, 2, 2)),
+        ({"include_comments": False}, (3, 2, 0)),
+        ({"include_tasks": False}, (3, 0, 0)),
+    ],
+)
+async def test_include_flags_limit_the_copy(sessionmaker, source, includes, copied):
+    clone = await create_clone(sessionmaker, source, **includes)
+
+    assert await run_clone(clone.id, sessionmaker=sessionmaker)
+
+    clone = await get(sessionmaker, ProjectClone, clone.id)
+    assert (clone.members_copied, clone.tasks_copied, clone.comments_copied) == copied
+    members = await count(
+        sessionmaker, ProjectMember, ProjectMember.project_id == clone.project_id
+    )
+    tasks = await count(sessionmaker, Task, Task.project_id == clone.project_id)
+    assigned = await count(
+        sessionmaker,
+        Task,
+        Task.project_id == clone.project_id,
+        Task.assignee_id.is_not(None),
+    )
+    assert (members, tasks) == copied[:2]
+    # Assignees are kept only along with the members
+    assert assigned == (1 if (members, tasks) == (3, 2) else 0)
+
+
+async def test_clone_running_elsewhere_is_not_claimed(sessionmaker, source):
+    clone = await create_clone(sessionmaker, source)
+    repository = ProjectCloneRepository()
+    async with sessionmaker() as db:
+        assert await repository.claim(db, clone.id, datetime.now(timezone.utc))
+
+    assert not await run_clone(clone.id, sessionmaker=sessionmaker)
+    assert (await get(sessionmaker, ProjectClone, clone.id)).project_id is None
+
+
+async def test_locked_clone_is_left_to_its_worker_then_taken_over(
+    sessionmaker, source, monkeypatch
+):
+    clone = await create_clone(sessionmaker, source)
+    repository = ProjectCloneRepository()
+
+    async with sessionmaker() as holder:
+        # Another worker's copy is still in its transaction
+        assert await repository.lock(holder, clone.id)
+        assert not await run_clone(clone.id, sessionmaker=sessionmaker)
+        assert (await get(sessionmaker, ProjectClone, clone.id)).status == "running"
+
+    # The worker went quiet; once stale, the clone is taken over
+    monkeypatch.setattr(
+        project_clone_service,
+        "_stale_before",
+        lambda: datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    assert await run_clone(clone.id, sessionmaker=sessionmaker)
+    assert (await get(sessionmaker, ProjectClone, clone.id)).status == "done"
+
+
+async def test_deleted_source_fails_the_clone(sessionmaker, source):
+    clone = await create_clone(sessionmaker, source)
+    async with sessionmaker() as db:
+        await db.execute(
+            update(Project)
+            .where(Project.id == source.project.id)
+            .values(is_deleted=True)
+        )
+        await db.commit()
+
+    assert not await run_clone(clone.id, sessionmaker=sessionmaker)
+
+    clone = await get(sessionmaker, ProjectClone, clone.id)
+    assert clone.status == "failed"
+    assert clone.error == "Source project not found"
+    assert clone.project_id is None
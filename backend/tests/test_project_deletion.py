@@ -0,0 +1,217 @@
+# tests/test_project_deletion.py
+"""Deleting a project: hidden at once, contents removed in resumable batches."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.models import Comment, Notification, Project, ProjectMember, Task, User
+from app.models.project import ProjectDeletion
+from app.repositories.project import ProjectRepository
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.services import project_deletion_service
+from app.services.project_deletion_service import purge_project
+
+
+def shared(db):
+    """Session factory handing out the test's session (rolled back afterwards)."""
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    return session
+
+
+class Repository(ProjectDeletionRepository):
+    """Records where each batch starts; can fail like a killed worker."""
+
+    def __init__(self, fail_at_batch=None):
+        super().__init__()
+        self.fail_at_batch = fail_at_batch
+        self.afters = []
+
+    async def delete_task_batch(self, db, **options):
+        if len(self.afters) == self.fail_at_batch:
+            raise RuntimeError("Worker lost")
+        self.afters.append(options["after"])
+        return await super().delete_task_batch(db, **options)
+
+
+@pytest.fixture(autouse=True)
+def no_pause(monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_DELETE_BATCH_PAUSE", 0)
+
+
+async def add_contents(db, project, user, count=5):
+    """Tasks with one comment and one notification each; ids in delete order."""
+    tasks = [
+        Task(title=f"Task {i}", project_id=project.id, creator_id=user.id)
+        for i in range(count)
+    ]
+    db.add_all(tasks)
+    await db.flush()
+    db.add_all(
+        [Comment(content="Hi", task_id=task.id, user_id=user.id) for task in tasks]
+        + [
+            Notification(
+                type="task_assigned",
+                title=task.title,
+                link=f"/tasks/{task.id}",
+                user_id=user.id,
+            )
+            for task in tasks
+        ]
+    )
+    await db.commit()
+    return sorted(task.id for task in tasks)
+
+
+async def count(db, model, *where):
+    return await db.scalar(select(func.count()).select_from(model).where(*where))
+
+
+async def deletion_row(db, project_id):
+    result = await db.execute(
+        select(ProjectDeletion)
+        .where(ProjectDeletion.project_id == project_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def test_marked_project_is_hidden_at_once(db, user, project):
+    await add_contents(db, project, user, count=3)
+    repository = ProjectDeletionRepository()
+
+    deletion = await repository.mark_project_deleted(
+        db, project_id=project.id, requested_by=user.id
+    )
+
+    assert deletion.status == "pending"
+    assert deletion.tasks_total == 3
+    assert await ProjectRepository().get(db, project.id) is None
+    assert await ProjectRepository().load_member_roles(db, user.id) == {}
+    # Contents stay until the job runs
+    assert await count(db, Task, Task.project_id == project.id) == 3
+    assert (
+        await repository.mark_project_deleted(
+            db, project_id=project.id, requested_by=user.id
+        )
+        is None
+    )
+
+
+async def test_batches_advance_the_cursor_and_counters(db, user, project):
+    task_ids = await add_contents(db, project, user)
+    repository = ProjectDeletionRepository()
+    await repository.mark_project_deleted(
+        db, project_id=project.id, requested_by=user.id
+    )
+
+    first = await repository.delete_task_batch(
+        db, project_id=project.id, after=None, batch_size=2
+    )
+    second = await repository.delete_task_batch(
+        db, project_id=project.id, after=first[1], batch_size=2
+    )
+
+    assert first == (2, task_ids[1])
+    assert second == (2, task_ids[3])
+    deletion = await deletion_row(db, project.id)
+    assert deletion.last_task_id == task_ids[3]
+    assert deletion.tasks_deleted == 4
+    assert deletion.comments_deleted == 4
+    assert deletion.notifications_deleted == 4
+    assert await count(db, Task, Task.project_id == project.id) == 1
+
+
+async def test_purge_removes_the_project_its_members_and_notices(db, user, project):
+    await add_contents(db, project, user)
+    other = User(email=f"user-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+    db.add(other)
+    await db.flush()
+    other_project = Project(name="Other", owner_id=user.id)
+    db.add_all([other_project, ProjectMember(project_id=project.id, user_id=other.id)])
+    await db.flush()
+    db.add_all(
+        [
+            Notification(
+                type="tasks_updated",
+                title=title,
+                link=f"/projects/{project_id}",
+                user_id=other.id,
+            )
+            for title, project_id in (
+                ("Ours", project.id),
+                ("Theirs", other_project.id),
+            )
+        ]
+    )
+    await db.commit()
+    await ProjectDeletionRepository().mark_project_deleted(
+        db, project_id=project.id, requested_by=user.id
+    )
+
+    assert await purge_project(project.id, sessionmaker=shared(db), batch_size=2)
+
+    assert await count(db, Task, Task.project_id == project.id) == 0
+    assert await count(db, Comment, Comment.user_id == user.id) == 0
+    assert await count(db, ProjectMember, ProjectMember.project_id == project.id) == 0
+    assert await count(db, Project, Project.id == project.id) == 0
+    assert await count(db, Notification, Notification.user_id == user.id) == 0
+    assert (
+        await db.scalar(
+            select(Notification.title).where(Notification.user_id == other.id)
+        )
+        == "Theirs"
+    )
+    deletion = await deletion_row(db, project.id)
+    assert deletion.status == "done"
+    assert deletion.finished_at is not None
+    assert deletion.tasks_deleted == 5
+    assert deletion.notifications_deleted == 6
+
+
+async def test_interrupted_purge_resumes_after_the_last_batch(
+    db, user, project, monkeypatch
+):
+    task_ids = await add_contents(db, project, user)
+    await ProjectDeletionRepository().mark_project_deleted(
+        db, project_id=project.id, requested_by=user.id
+    )
+
+    with pytest.raises(RuntimeError):
+        await purge_project(
+            project.id,
+            sessionmaker=shared(db),
+            batch_size=2,
+            repository=Repository(fail_at_batch=1),
+        )
+
+    deletion = await deletion_row(db, project.id)
+    assert deletion.status == "failed"
+    assert deletion.error == "Worker lost"
+    assert deletion.last_task_id == task_ids[1]
+
+    # Every unfinished deletion counts as stale, whatever the clocks say
+    monkeypatch.setattr(
+        project_deletion_service,
+        "_stale_before",
+        lambda: datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    resumed = Repository()
+    monkeypatch.setattr(
+        project_deletion_service, "ProjectDeletionRepository", lambda: resumed
+    )
+    assert await project_deletion_service.resume_project_deletions(shared(db)) == 1
+
+    assert resumed.afters[0] == task_ids[1]
+    deletion = await deletion_row(db, project.id)
+    assert deletion.status == "done"
+    assert deletion.tasks_deleted == 5
+    assert await count(db, Project, Project.id == project.id) == 0
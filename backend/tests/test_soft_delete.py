@@ -0,0 +1,134 @@
+# tests/test_soft_delete.py
+"""Soft-deleted tasks: hidden from reads, listed as tombstones, purged later."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.models import Project, Task, User
+from app.repositories import TaskRepository
+
+API = settings.API_V1_STR
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+async def add_tombstones(db, project, user, count, start=START):
+    """Deleted tasks, one day apart from ``start``."""
+    tasks = [
+        Task(
+            title=f"Deleted {i}",
+            project_id=project.id,
+            creator_id=user.id,
+            is_deleted=True,
+            deleted_at=start + timedelta(days=i),
+        )
+        for i in range(count)
+    ]
+    db.add_all(tasks)
+    await db.commit()
+    return tasks
+
+
+async def count_rows(db, *where):
+    return await db.scalar(select(func.count()).select_from(Task).where(*where))
+
+
+async def test_soft_deleted_task_is_hidden_from_reads(db, project, user):
+    repository = TaskRepository()
+    kept, deleted = [
+        Task(title=title, project_id=project.id, creator_id=user.id)
+        for title in ("Kept", "Deleted")
+    ]
+    db.add_all([kept, deleted])
+    await db.commit()
+
+    assert await repository.delete(db, id=deleted.id)
+
+    filters = {"project_id": project.id}
+    assert await repository.get(db, deleted.id) is None
+    assert await repository.get(db, deleted.id, include_deleted=True) is not None
+    assert [task.id for task in await repository.get_multi(db, filters=filters)] == [
+        kept.id
+    ]
+    assert await repository.get_count(db, filters=filters) == 1
+    # The row is still there, only flagged
+    assert await count_rows(db, Task.id == deleted.id, Task.is_deleted) == 1
+    assert not await repository.delete(db, id=deleted.id)
+
+
+async def test_hard_delete_removes_the_row(db, project, user):
+    repository = TaskRepository()
+    live = Task(title="Live", project_id=project.id, creator_id=user.id)
+    db.add(live)
+    await db.commit()
+    (deleted,) = await add_tombstones(db, project, user, 1)
+
+    assert await repository.hard_delete(db, id=live.id)
+    assert await repository.hard_delete(db, id=deleted.id)
+
+    assert await count_rows(db, Task.project_id == project.id) == 0
+    assert not await repository.hard_delete(db, id=live.id)
+
+
+async def test_tombstones_since_and_paging(client, db, project, user, auth_headers):
+    tasks = await add_tombstones(db, project, user, 4)
+    # Tasks in projects the user can't see are never reported
+    other = User(email=f"user-{uuid.uuid4().hex[:12]}@example.com", hashed_password="x")
+    db.add(other)
+    await db.flush()
+    hidden_project = Project(name="Hidden", owner_id=other.id)
+    db.add(hidden_project)
+    await db.commit()
+    await add_tombstones(db, hidden_project, other, 2)
+
+    response = await client.get(
+        f"{API}/tasks/tombstones",
+        params={"since": tasks[1].deleted_at.isoformat(), "limit": 2},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    page = response.json()
+    assert [row["id"] for row in page] == [str(task.id) for task in tasks[1:3]]
+    assert page[0]["project_id"] == str(project.id)
+    assert response.headers["X-Has-More"] == "true"
+
+    response = await client.get(
+        f"{API}/tasks/tombstones",
+        params={"since": page[-1]["deleted_at"], "after_id": page[-1]["id"]},
+        headers=auth_headers,
+    )
+
+    assert [row["id"] for row in response.json()] == [str(tasks[3].id)]
+    assert response.headers["X-Has-More"] == "false"
+
+
+async def test_purge_removes_only_old_tombstones_in_batches(
+    db, project, user, monkeypatch
+):
+    old = await add_tombstones(db, project, user, 3)
+    recent = await add_tombstones(
+        db, project, user, 1, start=START + timedelta(days=30)
+    )
+    live = Task(title="Live", project_id=project.id, creator_id=user.id)
+    db.add(live)
+    await db.commit()
+    commits = []
+    commit = db.commit
+
+    async def counting_commit():
+        commits.append(1)
+        await commit()
+
+    monkeypatch.setattr(db, "commit", counting_commit)
+
+    purged = await TaskRepository().purge_deleted(
+        db, older_than=START + timedelta(days=10), batch_size=2
+    )
+
+    assert purged == len(old)
+    assert len(commits) == 2
+    assert await count_rows(db, Task.id.in_([task.id for task in old])) == 0
+    assert await count_rows(db, Task.id.in_([recent[0].id, live.id])) == 2
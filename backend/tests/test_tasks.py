@@ -0,0 +1,100 @@
+# tests/test_tasks.py
+from app.core.config import settings
+from app.models import Task
+from app.repositories import TaskRepository
+
+API = settings.API_V1_STR
+
+
+async def add_tasks(db, project, user, count, **values):
+    tasks = [
+        Task(title=f"Task {i}", project_id=project.id, creator_id=user.id, **values)
+        for i in range(count)
+    ]
+    db.add_all(tasks)
+    await db.commit()
+    return tasks
+
+
+async def test_bulk_update_by_filters_within_cap(
+    client, db, project, user, auth_headers, monkeypatch
+):
+    await add_tasks(db, project, user, 3)
+    monkeypatch.setattr(settings, "BULK_UPDATE_MAX_ROWS", 3)
+
+    response = await client.patch(
+        f"{API}/tasks/bulk",
+        json={
+            "filters": {"project_id": str(project.id)},
+            "changes": {"status": "done"},
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+
+
+async def test_bulk_update_by_filters_over_cap_changes_nothing(
+    client, db, project, user, auth_headers, monkeypatch
+):
+    tasks = await add_tasks(db, project, user, 3)
+    monkeypatch.setattr(settings, "BULK_UPDATE_MAX_ROWS", 2)
+
+    response = await client.patch(
+        f"{API}/tasks/bulk",
+        json={
+            "filters": {"project_id": str(project.id)},
+            "changes": {"status": "done"},
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 422
+    for task in tasks:
+        await db.refresh(task)
+        assert task.status == "todo"
+        assert task.version == 1
+
+
+async def test_update_versioned_bumps_version_once(db, project, user):
+    (task,) = await add_tasks(db, project, user, 1)
+    repository = TaskRepository()
+
+    row = await repository.update_versioned(
+        db, id=task.id, values={"status": "done"}, versions=[1]
+    )
+    stale = await repository.update_versioned(
+        db, id=task.id, values={"status": "review"}, versions=[1]
+    )
+    unconditional = await repository.update_versioned(
+        db, id=task.id, values={"priority": "high"}, fields=["version", "status"]
+    )
+
+    assert row["version"] == 2
+    assert row["status"] == "done"
+    assert stale is None
+    assert dict(unconditional) == {"version": 3, "status": "done"}
+
+
+async def test_patch_with_stale_if_match_is_412_and_stale_body_version_409(
+    client, db, project, user, auth_headers
+):
+    (task,) = await add_tasks(db, project, user, 1)
+    url = f"{API}/tasks/{task.id}"
+
+    updated = await client.patch(
+        url, json={"title": "v2"}, headers={**auth_headers, "If-Match": '"1"'}
+    )
+    stale_header = await client.patch(
+        url, json={"title": "v3"}, headers={**auth_headers, "If-Match": '"1"'}
+    )
+    stale_body = await client.patch(
+        url, json={"title": "v3", "version": 1}, headers=auth_headers
+    )
+
+    assert updated.status_code == 200
+    assert updated.headers["etag"] == '"2"'
+    assert stale_header.status_code == 412
+    assert stale_body.status_code == 409
+    assert stale_body.headers["etag"] == '"2"'
@@ -0,0 +1,61 @@
+# tests/test_warmup.py
+"""Readiness only after the required warm-up steps succeed."""
+
+import asyncio
+
+import pytest
+
+from app.core import warmup
+from app.core.config import settings
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = warmup.WarmupState()
+    monkeypatch.setattr(warmup, "warmup_state", state)
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", True)
+    monkeypatch.setattr(settings, "WARMUP_RETRY_INTERVAL", 0.01)
+    return state
+
+
+async def test_database_step_is_retried_until_it_succeeds(monkeypatch, state):
+    calls = []
+
+    async def warm_database(connection_count):
+        calls.append(connection_count)
+        if len(calls) < 3:
+            raise ConnectionRefusedError("database is starting up")
+        return {"connections": connection_count, "statements": 0}
+
+    monkeypatch.setattr(warmup, "warm_database", warm_database)
+
+    await warmup.run_warmup()
+
+    assert state.ready
+    assert state.attempts == 3
+    assert state.steps["database"]["status"] == "ok"
+    assert state.steps["schemas"]["status"] == "ok"
+
+
+async def test_not_ready_while_database_step_fails(monkeypatch, state):
+    async def warm_database(connection_count):
+        raise ConnectionRefusedError("database is down")
+
+    monkeypatch.setattr(warmup, "warm_database", warm_database)
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.1):
+            await warmup.run_warmup()
+
+    assert not state.ready
+    assert state.attempts > 1
+    assert state.steps["database"]["status"] == "failed"
+
+
+async def test_ready_immediately_when_disabled(monkeypatch, state):
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", False)
+
+    await warmup.run_warmup()
+
+    assert state.ready
+    assert state.attempts == 0